@@ -1,3 +1,9 @@
+import gc
+import sys
+import time
+import tracemalloc
+from array import array
+
 class No:
     """Representa um nó em uma lista encadeada."""
     def __init__(self, valor):
@@ -8,6 +14,7 @@ class ListaEncadeada:
     """Implementação simples de uma lista encadeada para demonstrar alocação dinâmica."""
     def __init__(self):
         self.cabeca = None
+        self.cauda = None  # Último nó, para adicionar ao final em O(1)
         self.tamanho = 0
     
     def adicionar(self, valor):
@@ -17,12 +24,10 @@ class ListaEncadeada:
         if self.cabeca is None:
             self.cabeca = novo_no
         else:
-            atual = self.cabeca
-            # Percorre até o último nó
-            while atual.proximo:
-                atual = atual.proximo
-            atual.proximo = novo_no
+            # A referência à cauda evita percorrer a lista inteira
+            self.cauda.proximo = novo_no
         
+        self.cauda = novo_no
         self.tamanho += 1
     
     def remover(self, valor):
@@ -33,6 +38,8 @@ class ListaEncadeada:
         # Caso especial: remover o primeiro nó
         if self.cabeca.valor == valor:
             self.cabeca = self.cabeca.proximo  # O nó será coletado pelo garbage collector
+            if self.cabeca is None:
+                self.cauda = None
             self.tamanho -= 1
             return True
         
@@ -42,6 +49,8 @@ class ListaEncadeada:
             atual = atual.proximo
         
         if atual.proximo:
+            if atual.proximo is self.cauda:
+                self.cauda = atual
             atual.proximo = atual.proximo.proximo  # O nó removido será coletado pelo garbage collector
             self.tamanho -= 1
             return True
@@ -59,6 +68,164 @@ class ListaEncadeada:
             
         print(" -> ".join(valores) if valores else "Lista vazia")
 
+class ListaEncadeadaArena:
+    """
+    Lista encadeada cujos nós vivem em uma arena: em vez de um objeto `No`
+    por elemento, os valores e os índices do próximo nó ficam em dois arrays
+    tipados paralelos (módulo `array`), e um nó é apenas uma posição nesses
+    arrays. O índice -1 faz o papel de `None`.
+    
+    As posições liberadas por `remover` entram em uma lista de posições
+    livres, encadeada pelo próprio array de próximos, e são reaproveitadas
+    por `adicionar`. A arena nunca encolhe sozinha: `compactar()` reorganiza
+    os elementos na ordem da lista e descarta as posições livres.
+    
+    Os valores precisam caber no tipo do array (`typecode`, inteiros de 64
+    bits por padrão).
+    """
+    def __init__(self, typecode="q"):
+        self.valores = array(typecode)
+        self.proximos = array("q")
+        self.cabeca = -1
+        self.cauda = -1
+        self.livre = -1  # Primeira posição da lista de posições livres
+        self.tamanho = 0
+    
+    def _alocar(self, valor):
+        """Retorna uma posição para um novo nó, reaproveitando uma livre se houver."""
+        if self.livre == -1:
+            self.valores.append(valor)
+            self.proximos.append(-1)
+            return len(self.valores) - 1
+        
+        posicao = self.livre
+        self.livre = self.proximos[posicao]
+        self.valores[posicao] = valor
+        self.proximos[posicao] = -1
+        return posicao
+    
+    def _liberar(self, posicao):
+        """Devolve uma posição à lista de posições livres."""
+        self.proximos[posicao] = self.livre
+        self.livre = posicao
+    
+    def adicionar(self, valor):
+        """Adiciona um novo nó ao final da lista."""
+        novo_no = self._alocar(valor)  # Sem alocação no heap se houver posição livre
+        
+        if self.cabeca == -1:
+            self.cabeca = novo_no
+        else:
+            self.proximos[self.cauda] = novo_no
+        
+        self.cauda = novo_no
+        self.tamanho += 1
+    
+    def remover(self, valor):
+        """Remove um nó com o valor especificado."""
+        if self.cabeca == -1:
+            return False
+        
+        valores = self.valores
+        proximos = self.proximos
+        
+        # Caso especial: remover o primeiro nó
+        if valores[self.cabeca] == valor:
+            removido = self.cabeca
+            self.cabeca = proximos[removido]
+            if self.cabeca == -1:
+                self.cauda = -1
+            self._liberar(removido)
+            self.tamanho -= 1
+            return True
+        
+        # Caso geral: procurar e remover
+        atual = self.cabeca
+        while proximos[atual] != -1 and valores[proximos[atual]] != valor:
+            atual = proximos[atual]
+        
+        removido = proximos[atual]
+        if removido != -1:
+            if removido == self.cauda:
+                self.cauda = atual
+            proximos[atual] = proximos[removido]
+            self._liberar(removido)
+            self.tamanho -= 1
+            return True
+        
+        return False
+    
+    def compactar(self):
+        """
+        Reorganiza a arena na ordem da lista, sem posições livres, e
+        retorna quantas posições foram liberadas.
+        """
+        novos_valores = array(self.valores.typecode)
+        atual = self.cabeca
+        while atual != -1:
+            novos_valores.append(self.valores[atual])
+            atual = self.proximos[atual]
+        
+        liberadas = len(self.valores) - len(novos_valores)
+        # Depois de compactar, o próximo da posição i é simplesmente i + 1
+        self.valores = novos_valores
+        self.proximos = array("q", range(1, self.tamanho + 1))
+        if self.tamanho:
+            self.proximos[-1] = -1
+        self.cabeca = 0 if self.tamanho else -1
+        self.cauda = self.tamanho - 1
+        self.livre = -1
+        return liberadas
+    
+    def imprimir(self):
+        """Imprime todos os elementos da lista."""
+        valores = []
+        atual = self.cabeca
+        
+        while atual != -1:
+            valores.append(str(self.valores[atual]))
+            atual = self.proximos[atual]
+        
+        print(" -> ".join(valores) if valores else "Lista vazia")
+
+def comparar_memoria(quantidade=10**6):
+    """
+    Compara `ListaEncadeada` e `ListaEncadeadaArena` ao adicionar
+    `quantidade` inteiros: memória ocupada e blocos alocados (medidos com
+    tracemalloc), tempo de construção e duração de uma coleta completa do
+    garbage collector com a lista ainda viva.
+    """
+    print(f"{'Estrutura':<22}{'Memória (MB)':>14}{'Bytes/elem.':>13}{'Blocos':>12}"
+          f"{'Blocos/s':>14}{'Construção (s)':>16}{'gc.collect (s)':>16}")
+    
+    for classe in (ListaEncadeada, ListaEncadeadaArena):
+        gc.collect()
+        tempo_inicio = time.perf_counter()
+        lista = classe()
+        for i in range(quantidade):
+            lista.adicionar(i)
+        tempo_construcao = time.perf_counter() - tempo_inicio
+        
+        tempo_inicio = time.perf_counter()
+        gc.collect()
+        tempo_coleta = time.perf_counter() - tempo_inicio
+        del lista
+        gc.collect()
+        
+        tracemalloc.start()
+        lista = classe()
+        for i in range(quantidade):
+            lista.adicionar(i)
+        estatisticas = tracemalloc.take_snapshot().statistics("filename")
+        memoria, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blocos = sum(estatistica.count for estatistica in estatisticas)
+        del lista
+        
+        print(f"{classe.__name__:<22}{memoria / 2**20:>14.1f}{memoria / quantidade:>13.1f}"
+              f"{blocos:>12,}{blocos / tempo_construcao:>14,.0f}"
+              f"{tempo_construcao:>16.3f}{tempo_coleta:>16.4f}")
+
 def demonstrar_alocacao_dinamica():
     print("\nDemonstração de alocação dinâmica com Lista Encadeada:")
     print("-" * 60)
@@ -95,6 +262,32 @@ def demonstrar_alocacao_dinamica():
     print("Quando a função terminar, a lista e todos os seus nós")
     print("serão coletados pelo garbage collector de Python.")
 
+def demonstrar_lista_arena():
+    print("\nDemonstração de uma lista encadeada em arena:")
+    print("-" * 60)
+    
+    lista = ListaEncadeadaArena()
+    for i in range(1, 6):
+        lista.adicionar(i * 10)
+    print("Lista inicial: ", end="")
+    lista.imprimir()
+    
+    for valor in (20, 40):
+        lista.remover(valor)
+    print("Após remover 20 e 40: ", end="")
+    lista.imprimir()
+    print(f"Posições na arena: {len(lista.valores)}, posição livre: {lista.livre}")
+    
+    lista.adicionar(60)
+    print("Após adicionar 60 (reaproveita uma posição livre): ", end="")
+    lista.imprimir()
+    print(f"Posições na arena: {len(lista.valores)}")
+    
+    lista.remover(10)
+    print(f"Após remover 10 e compactar, posições liberadas: {lista.compactar()}")
+    print(f"Valores na arena: {list(lista.valores)}, próximos: {list(lista.proximos)}")
+    print("-" * 60)
+
 def demonstrar_lista_dinamica():
     print("\nDemonstração de alocação dinâmica com lista Python:")
     print("-" * 60)
@@ -133,5 +326,13 @@ if __name__ == "__main__":
     # Demonstra alocação dinâmica com estrutura personalizada
     demonstrar_alocacao_dinamica()
     
+    # Demonstra a mesma lista com os nós guardados em uma arena
+    demonstrar_lista_arena()
+    
     # Demonstra alocação dinâmica com lista nativa do Python
-    demonstrar_lista_dinamica()
\ No newline at end of file
+    demonstrar_lista_dinamica()
+    
+    # A comparação com um milhão de nós leva vários segundos e só roda com --comparar
+    if "--comparar" in sys.argv:
+        print("\nComparação de memória entre a lista de objetos No e a arena:")
+        comparar_memoria()
\ No newline at end of file
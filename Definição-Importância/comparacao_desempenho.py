@@ -1,5 +1,18 @@
-import time
+import argparse
+import bisect
+import gc
+import json
+import math
+import platform
 import random
+import statistics
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, busca_binaria_lote usa bisect
+    np = None
 
 def busca_linear(lista, elemento):
     """Implementação de busca linear em uma lista."""
@@ -23,39 +36,602 @@ def busca_binaria(lista, elemento):
             inicio = meio + 1
     return -1
 
-# Criar uma lista de tamanho n
-def comparar_desempenho(tamanho=10000, repeticoes=10):
+def busca_bisect(lista, elemento):
+    """Busca binária usando o módulo bisect da biblioteca padrão."""
+    i = bisect.bisect_left(lista, elemento)
+    if i < len(lista) and lista[i] == elemento:
+        return i
+    return -1
+
+def busca_interpolacao(lista, elemento):
+    """
+    Busca por interpolação em uma lista ordenada de números.
+    
+    Estima a posição do elemento supondo valores distribuídos uniformemente,
+    o que leva a O(log log n) comparações em dados uniformes. Como salvaguarda,
+    sempre que um passo de interpolação não reduz o intervalo pela metade, o
+    passo seguinte é binário; assim o pior caso continua O(log n).
+    """
+    inicio = 0
+    fim = len(lista) - 1
+    binario = False
+    
+    while inicio <= fim:
+        menor = lista[inicio]
+        maior = lista[fim]
+        if elemento < menor or elemento > maior:
+            return -1
+        
+        tamanho = fim - inicio
+        if binario or maior == menor:
+            meio = (inicio + fim) // 2
+        else:
+            meio = inicio + int((elemento - menor) * tamanho // (maior - menor))
+        
+        if lista[meio] == elemento:
+            return meio
+        elif lista[meio] > elemento:
+            fim = meio - 1
+        else:
+            inicio = meio + 1
+        
+        # Próximo passo é binário se a interpolação não ajudou o suficiente
+        binario = not binario and (fim - inicio) > tamanho // 2
+    return -1
+
+def _galopar(lista, elemento, inicio=0):
+    """
+    Retorna a primeira posição a partir de `inicio` cujo valor não é menor
+    que `elemento` (como `bisect_left`), dando saltos de tamanho 1, 2, 4, ...
+    antes da busca binária. O custo é O(log d), onde d é a distância entre
+    `inicio` e a resposta.
+    """
+    tamanho = len(lista)
+    anterior = inicio
+    salto = 1
+    limite = inicio
+    while limite < tamanho and lista[limite] < elemento:
+        anterior = limite + 1
+        limite = inicio + salto
+        salto *= 2
+    return bisect.bisect_left(lista, elemento, anterior, min(limite, tamanho))
+
+def busca_exponencial(lista, elemento):
+    """
+    Busca exponencial (ilimitada) em uma lista ordenada: dobra o limite a
+    partir do início até ultrapassar o elemento e então faz uma busca
+    binária nesse trecho. Custa O(log i), onde i é a posição do elemento, e
+    por isso é vantajosa quando os elementos procurados estão perto do início.
+    """
+    return busca_galope(lista, elemento, 0)
+
+def busca_galope(lista, elemento, inicio=0):
+    """
+    Busca "galopante" a partir de uma posição conhecida, útil para consultas
+    ordenadas em que cada resposta está perto da anterior.
+    Retorna a posição do elemento ou -1.
+    """
+    posicao = _galopar(lista, elemento, inicio)
+    if posicao < len(lista) and lista[posicao] == elemento:
+        return posicao
+    return -1
+
+ESTRATEGIAS = {
+    "binaria": busca_binaria,
+    "interpolacao": busca_interpolacao,
+}
+
+def escolher_estrategia(lista, amostras=64):
+    """
+    Escolhe a estratégia de busca para uma lista ordenada.
+    
+    Compara a posição real de `amostras` elementos igualmente espaçados com a
+    posição prevista por interpolação linear entre o primeiro e o último
+    valor. Se o maior desvio for pequeno (até a raiz quadrada do tamanho),
+    os dados são considerados uniformes e a interpolação é escolhida; dados
+    enviesados ou não numéricos usam a busca binária.
+    """
+    tamanho = len(lista)
+    if tamanho < amostras:
+        return "binaria"
+    
+    menor = lista[0]
+    maior = lista[-1]
+    try:
+        amplitude = maior - menor
+        if amplitude <= 0:
+            return "binaria"
+        maior_desvio = 0.0
+        for k in range(amostras + 1):
+            posicao = k * (tamanho - 1) // amostras
+            prevista = (lista[posicao] - menor) / amplitude * (tamanho - 1)
+            maior_desvio = max(maior_desvio, abs(prevista - posicao))
+    except TypeError:
+        return "binaria"
+    
+    return "interpolacao" if maior_desvio <= math.sqrt(tamanho) else "binaria"
+
+class BuscadorAdaptativo:
+    """
+    Ponto de entrada único para buscas em uma lista ordenada.
+    A distribuição dos dados é amostrada uma vez, na criação, e a estratégia
+    escolhida é usada em todas as chamadas de `buscar`.
+    """
+    def __init__(self, lista, amostras=64):
+        self.lista = lista
+        self.estrategia = escolher_estrategia(lista, amostras)
+        self._busca = ESTRATEGIAS[self.estrategia]
+    
+    def buscar(self, elemento):
+        """Retorna a posição do elemento na lista ou -1."""
+        return self._busca(self.lista, elemento)
+
+def busca_binaria_lote(lista, consultas):
+    """
+    Busca várias chaves de uma vez em uma sequência ordenada.
+    
+    Com NumPy, usa `searchsorted` vetorizado sobre as consultas ordenadas;
+    passar `lista` como `array.array` ou `numpy.ndarray` evita copiar a
+    tabela a cada chamada.
+    Sem NumPy, se as consultas já estiverem ordenadas, faz uma única
+    passagem no estilo da intercalação (merge), galopando a partir da
+    resposta anterior; caso contrário, faz uma busca binária por consulta.
+    
+    Returns:
+        Uma lista com as posições de cada consulta, na ordem recebida, com
+        -1 para as ausentes, com ou sem NumPy. Havendo repetições na lista,
+        é devolvida a primeira ocorrência.
+    """
+    if np is not None:
+        tabela = np.asarray(lista)
+        chaves = np.asarray(consultas)
+        if tabela.size == 0:
+            return [-1] * chaves.size
+        # Com chaves ordenadas, o searchsorted do NumPy reduz o intervalo de
+        # cada busca a partir do resultado anterior e percorre a tabela em
+        # ordem, como uma intercalação. Chaves fora de ordem são ordenadas
+        # antes e as posições devolvidas à ordem original depois, o que é
+        # bem mais rápido em tabelas que não cabem no cache
+        if chaves.size > 1 and not np.all(chaves[1:] >= chaves[:-1]):
+            ordem = np.argsort(chaves, kind="stable")
+            posicoes = np.empty(chaves.shape, dtype=np.intp)
+            posicoes[ordem] = np.searchsorted(tabela, chaves[ordem])
+        else:
+            posicoes = np.searchsorted(tabela, chaves)
+        encontradas = tabela[np.minimum(posicoes, tabela.size - 1)] == chaves
+        return np.where(encontradas, posicoes, -1).tolist()
+    
+    tamanho = len(lista)
+    if all(anterior <= atual for anterior, atual in zip(consultas, consultas[1:])):
+        resultado = []
+        inicio = 0
+        for consulta in consultas:
+            inicio = _galopar(lista, consulta, inicio)
+            resultado.append(inicio if inicio < tamanho and lista[inicio] == consulta else -1)
+        return resultado
+    
+    return [busca_bisect(lista, consulta) for consulta in consultas]
+
+class FiltroBloom:
+    """
+    Filtro de Bloom: conjunto aproximado e compacto, guardado em um array de bits.
+    Responde "com certeza não está" ou "talvez esteja"; a taxa de falsos
+    positivos é dimensionada para a capacidade informada.
+    """
+    def __init__(self, capacidade, taxa_falsos_positivos=0.01):
+        capacidade = max(1, capacidade)
+        self.capacidade = capacidade
+        self.num_bits = max(8, math.ceil(-capacidade * math.log(taxa_falsos_positivos) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacidade * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _posicoes(self, valor):
+        """Posições dos bits de um valor, por hashing duplo a partir de hash()."""
+        # Mistura o hash (o de inteiros é o próprio número) e o divide em dois
+        mistura = (hash(valor) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h1 = mistura >> 32
+        h2 = (mistura & 0xFFFFFFFF) | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def adicionar(self, valor):
+        """Marca os bits do valor."""
+        bits = self.bits
+        for posicao in self._posicoes(valor):
+            bits[posicao >> 3] |= 1 << (posicao & 7)
+    
+    def pode_conter(self, valor):
+        """Retorna False se o valor com certeza não foi adicionado."""
+        # Mesmo cálculo de _posicoes, mas parando no primeiro bit desmarcado
+        mistura = (hash(valor) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        posicao = mistura >> 32
+        h2 = (mistura & 0xFFFFFFFF) | 1
+        bits = self.bits
+        num_bits = self.num_bits
+        for _ in range(self.num_hashes):
+            posicao %= num_bits
+            if not bits[posicao >> 3] & (1 << (posicao & 7)):
+                return False
+            posicao += h2
+        return True
+
+class IndiceBusca:
+    """
+    Índice de pertinência construído uma vez sobre uma lista não ordenada,
+    para substituir chamadas repetidas a `busca_linear`.
+    
+    Modos:
+    - "hash": dicionário valor -> primeira posição; `contem` e `posicao` em O(1).
+    - "bloom+hash": um filtro de Bloom na frente do dicionário rejeita a
+      maior parte das consultas ausentes sem tocar no dicionário.
+    - "bloom": apenas o filtro (cerca de 1,2 byte por elemento a 1% de falsos
+      positivos); consultas que passam pelo filtro são confirmadas com
+      `busca_linear`, o que compensa quando quase todas as consultas falham.
+    
+    `adicionar` e `remover` alteram a lista e atualizam o índice sem
+    reconstruí-lo, de modo que todos os modos concordam em `posicao`.
+    """
+    MODOS = ("hash", "bloom+hash", "bloom")
+    
+    def __init__(self, lista, modo="hash", taxa_falsos_positivos=0.01):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo desconhecido: {modo}")
+        self.lista = lista
+        self.modo = modo
+        self.taxa_falsos_positivos = taxa_falsos_positivos
+        self.posicoes = None
+        self.filtro = None
+        
+        if modo != "bloom":
+            posicoes = {}
+            for i, valor in enumerate(lista):
+                if valor not in posicoes:
+                    posicoes[valor] = i
+            self.posicoes = posicoes
+        if modo != "hash":
+            self._reconstruir_filtro(len(lista))
+    
+    def _reconstruir_filtro(self, capacidade):
+        """Recria o filtro de Bloom com folga para crescer."""
+        self.filtro = FiltroBloom(2 * capacidade, self.taxa_falsos_positivos)
+        valores = self.posicoes if self.posicoes is not None else self.lista
+        for valor in valores:
+            self.filtro.adicionar(valor)
+    
+    def contem(self, valor):
+        """Verifica se o valor está na lista."""
+        return self.posicao(valor) != -1
+    
+    def posicao(self, valor):
+        """Retorna a posição da primeira ocorrência do valor ou -1."""
+        if self.filtro is not None and not self.filtro.pode_conter(valor):
+            return -1
+        if self.posicoes is not None:
+            return self.posicoes.get(valor, -1)
+        return busca_linear(self.lista, valor)
+    
+    def adicionar(self, valor):
+        """Acrescenta o valor ao final da lista e ao índice."""
+        self.lista.append(valor)
+        if self.posicoes is not None and valor not in self.posicoes:
+            self.posicoes[valor] = len(self.lista) - 1
+        if self.filtro is not None:
+            if len(self.lista) > self.filtro.capacidade:
+                self._reconstruir_filtro(len(self.lista))
+            else:
+                self.filtro.adicionar(valor)
+    
+    def remover(self, valor):
+        """
+        Remove a primeira ocorrência do valor da lista e do índice. Retorna
+        False se o valor não estava na lista. Como em `list.remove`, os
+        elementos seguintes recuam uma posição, então a remoção custa O(n).
+        O filtro de Bloom não permite remoções: os bits do valor continuam
+        marcados e só aumentam um pouco os falsos positivos, que o índice
+        descarta.
+        """
+        posicao = self.posicao(valor)
+        if posicao == -1:
+            return False
+        del self.lista[posicao]
+        
+        if self.posicoes is not None:
+            del self.posicoes[valor]
+            for outro, posicao_outro in self.posicoes.items():
+                if posicao_outro > posicao:
+                    self.posicoes[outro] = posicao_outro - 1
+            # Uma ocorrência seguinte do valor passa a ser a primeira
+            try:
+                self.posicoes[valor] = self.lista.index(valor, posicao)
+            except ValueError:
+                pass
+        return True
+    
+    def memoria_por_elemento(self):
+        """
+        Bytes por elemento usados pelo índice, por componente. Os próprios
+        valores não entram na conta, pois são compartilhados com a lista.
+        """
+        tamanho = max(1, len(self.lista))
+        memoria = {}
+        if self.posicoes is not None:
+            # Tabela do dicionário mais os inteiros que guardam as posições
+            tabela = sys.getsizeof(self.posicoes)
+            inteiros = sum(sys.getsizeof(p) for p in self.posicoes.values() if p > 256)
+            memoria["hash"] = (tabela + inteiros) / tamanho
+        if self.filtro is not None:
+            memoria["bloom"] = sys.getsizeof(self.filtro.bits) / tamanho
+        memoria["total"] = sum(memoria.values())
+        return memoria
+
+def comparar_indices(tamanho=10**6, consultas=10**5, semente=0):
+    """
+    Mostra, para cada modo de `IndiceBusca`, a memória por elemento, o tempo
+    de construção e o tempo médio de uma consulta ausente.
+    """
+    rng = random.Random(semente)
+    lista = [rng.randrange(10 * tamanho) * 2 for _ in range(tamanho)]
+    ausentes = [rng.randrange(10 * tamanho) * 2 + 1 for _ in range(consultas)]
+    
+    print(f"Índices sobre {tamanho} elementos:")
+    for modo in IndiceBusca.MODOS:
+        inicio = time.perf_counter()
+        indice = IndiceBusca(lista, modo)
+        construcao = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter_ns()
+        for consulta in ausentes:
+            indice.contem(consulta)
+        por_consulta = (time.perf_counter_ns() - inicio) / consultas
+        
+        memoria = indice.memoria_por_elemento()
+        print(f"  {modo:<11} {memoria['total']:7.2f} bytes/elemento   construção: "
+              f"{construcao:6.2f} s   consulta ausente: {por_consulta:8.0f} ns")
+
+ALGORITMOS = {
+    "busca_linear": busca_linear,
+    "busca_binaria": busca_binaria,
+    "bisect": busca_bisect,
+    "interpolacao": busca_interpolacao,
+    "exponencial": busca_exponencial,
+}
+
+DISTRIBUICOES = ("acerto", "erro", "enviesada")
+
+def criar_dados(tamanho, usar_range=False):
+    """
+    Cria uma sequência ordenada com os números pares de 0 a 2 * (tamanho - 1).
+    Com `usar_range=True`, devolve um `range`, que ocupa memória constante e
+    permite testar tamanhos como 10**8 sem materializar a lista.
+    """
+    dados = range(0, 2 * tamanho, 2)
+    return dados if usar_range else list(dados)
+
+def gerar_consultas(dados, quantidade, distribuicao, rng):
+    """
+    Gera consultas para os dados criados por `criar_dados`.
+    
+    - acerto: elementos presentes, escolhidos uniformemente;
+    - erro: números ímpares, que nunca estão nos dados;
+    - enviesada: 90% das consultas vão para 16 chaves "quentes" e o
+      restante é uniforme, como em cargas reais com poucas chaves populares.
+    """
+    tamanho = len(dados)
+    if distribuicao == "acerto":
+        return [dados[rng.randrange(tamanho)] for _ in range(quantidade)]
+    if distribuicao == "erro":
+        return [dados[rng.randrange(tamanho)] + 1 for _ in range(quantidade)]
+    if distribuicao == "enviesada":
+        quentes = [dados[rng.randrange(tamanho)] for _ in range(16)]
+        return [rng.choice(quentes) if rng.random() < 0.9 else dados[rng.randrange(tamanho)]
+                for _ in range(quantidade)]
+    raise ValueError(f"Distribuição desconhecida: {distribuicao}")
+
+def percentil(ordenados, p):
+    """Percentil p (0 a 100) de uma lista ordenada, com interpolação linear."""
+    if len(ordenados) == 1:
+        return ordenados[0]
+    posicao = (len(ordenados) - 1) * p / 100
+    inferior = math.floor(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    fracao = posicao - inferior
+    return ordenados[inferior] * (1 - fracao) + ordenados[superior] * fracao
+
+def intervalo_confianca_mediana(ordenados, z=1.96):
+    """
+    Intervalo de confiança (95% por padrão) para a mediana, obtido pelas
+    estatísticas de ordem; não supõe que os tempos sigam uma distribuição normal.
+    """
+    n = len(ordenados)
+    margem = z * math.sqrt(n) / 2
+    inferior = max(0, math.floor(n / 2 - margem))
+    superior = min(n - 1, math.ceil(n / 2 + margem) - 1)
+    return ordenados[inferior], ordenados[superior]
+
+def medir(funcao, dados, consultas, repeticoes=15, aquecimento=2):
+    """
+    Mede o tempo por consulta de `funcao` com `time.perf_counter_ns`.
+    
+    Executa `aquecimento` rodadas descartadas e depois `repeticoes` rodadas
+    cronometradas sobre todas as consultas, com o coletor de lixo desligado.
+    
+    Returns:
+        Um dicionário com mediana, percentis, média, desvio padrão e o
+        intervalo de confiança da mediana, em nanossegundos por consulta.
+    """
+    for _ in range(aquecimento):
+        for consulta in consultas:
+            funcao(dados, consulta)
+    
+    amostras = []
+    gc_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            inicio = time.perf_counter_ns()
+            for consulta in consultas:
+                funcao(dados, consulta)
+            amostras.append((time.perf_counter_ns() - inicio) / len(consultas))
+    finally:
+        if gc_ativo:
+            gc.enable()
+    
+    ordenados = sorted(amostras)
+    ic_inferior, ic_superior = intervalo_confianca_mediana(ordenados)
+    return {
+        "repeticoes": repeticoes,
+        "consultas": len(consultas),
+        "mediana_ns": statistics.median(ordenados),
+        "p5_ns": percentil(ordenados, 5),
+        "p95_ns": percentil(ordenados, 95),
+        "media_ns": statistics.fmean(ordenados),
+        "desvio_ns": statistics.stdev(ordenados) if repeticoes > 1 else 0.0,
+        "ic95_mediana_ns": [ic_inferior, ic_superior],
+    }
+
+def executar_benchmark(tamanhos=(10**3, 10**4, 10**5, 10**6), distribuicoes=DISTRIBUICOES,
+                       algoritmos=tuple(ALGORITMOS), repeticoes=15, aquecimento=2,
+                       consultas=1000, limite_linear=10**6, usar_range=False, semente=0):
+    """
+    Executa o benchmark para todas as combinações de tamanho, distribuição de
+    consultas e algoritmo.
+    
+    A busca linear usa menos consultas por rodada em listas grandes (o
+    suficiente para cerca de 10**7 comparações) e é ignorada acima de
+    `limite_linear` elementos.
+    
+    Returns:
+        Um dicionário serializável em JSON com metadados e resultados.
+    """
+    rng = random.Random(semente)
+    resultados = []
+    
+    for tamanho in tamanhos:
+        dados = criar_dados(tamanho, usar_range)
+        for distribuicao in distribuicoes:
+            todas_consultas = gerar_consultas(dados, consultas, distribuicao, rng)
+            for nome in algoritmos:
+                registro = {"tamanho": tamanho, "distribuicao": distribuicao, "algoritmo": nome}
+                if nome == "busca_linear":
+                    if tamanho > limite_linear:
+                        registro["ignorado"] = "tamanho acima de limite_linear"
+                        resultados.append(registro)
+                        continue
+                    quantidade = max(5, min(consultas, 10**7 // tamanho))
+                else:
+                    quantidade = consultas
+                registro.update(medir(ALGORITMOS[nome], dados, todas_consultas[:quantidade],
+                                      repeticoes, aquecimento))
+                resultados.append(registro)
+        del dados
+    
+    return {
+        "metadados": {
+            "python": sys.version.split()[0],
+            "implementacao": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "repeticoes": repeticoes,
+            "aquecimento": aquecimento,
+            "semente": semente,
+            "dados": "range" if usar_range else "list",
+        },
+        "resultados": resultados,
+    }
+
+def comparar_execucoes(anterior, atual):
+    """
+    Compara dois resultados de `executar_benchmark` (por exemplo, lidos de
+    arquivos JSON) e lista a razão entre as medianas de cada combinação.
+    Diferenças cujos intervalos de confiança se sobrepõem são marcadas como
+    não significativas.
+    """
+    def indexar(execucao):
+        return {(r["tamanho"], r["distribuicao"], r["algoritmo"]): r
+                for r in execucao["resultados"] if "mediana_ns" in r}
+    
+    antes = indexar(anterior)
+    for chave, depois in indexar(atual).items():
+        if chave not in antes:
+            continue
+        base = antes[chave]
+        razao = depois["mediana_ns"] / max(base["mediana_ns"], 1e-9)
+        sobrepoe = (depois["ic95_mediana_ns"][0] <= base["ic95_mediana_ns"][1]
+                    and base["ic95_mediana_ns"][0] <= depois["ic95_mediana_ns"][1])
+        nota = " (não significativo)" if sobrepoe else ""
+        print(f"{chave[0]:>10} {chave[1]:<10} {chave[2]:<14} {razao:6.2f}x{nota}")
+
+def comparar_desempenho(tamanho=10000, repeticoes=15):
     """Compara o desempenho entre busca linear e binária."""
-    # Criar lista ordenada para teste
-    lista = sorted([random.randint(0, tamanho*10) for _ in range(tamanho)])
+    rng = random.Random(tamanho)
+    lista = criar_dados(tamanho)
     
     # Elementos para buscar (existentes na lista)
-    elementos_busca = [lista[random.randint(0, tamanho-1)] for _ in range(repeticoes)]
+    elementos_busca = gerar_consultas(lista, 100, "acerto", rng)
     
-    # Teste de busca linear
-    tempo_inicio = time.time()
-    for elemento in elementos_busca:
-        busca_linear(lista, elemento)
-    tempo_linear = time.time() - tempo_inicio
-    
-    # Teste de busca binária
-    tempo_inicio = time.time()
-    for elemento in elementos_busca:
-        busca_binaria(lista, elemento)
-    tempo_binario = time.time() - tempo_inicio
+    linear = medir(busca_linear, lista, elementos_busca, repeticoes)
+    binaria = medir(busca_binaria, lista, elementos_busca, repeticoes)
     
     print(f"Tamanho da lista: {tamanho} elementos")
-    print(f"Tempo médio de busca linear: {tempo_linear/repeticoes:.6f} segundos")
-    print(f"Tempo médio de busca binária: {tempo_binario/repeticoes:.6f} segundos")
-    print(f"A busca binária foi {tempo_linear/tempo_binario:.2f} vezes mais rápida")
+    print(f"Tempo mediano de busca linear: {linear['mediana_ns'] / 1e9:.9f} segundos "
+          f"(p95: {linear['p95_ns'] / 1e9:.9f})")
+    print(f"Tempo mediano de busca binária: {binaria['mediana_ns'] / 1e9:.9f} segundos "
+          f"(p95: {binaria['p95_ns'] / 1e9:.9f})")
+    # O tempo é medido em nanossegundos por consulta, nunca exatamente zero
+    aceleracao = linear["mediana_ns"] / max(binaria["mediana_ns"], 1e-9)
+    print(f"A busca binária foi {aceleracao:.2f} vezes mais rápida")
+
+def main(argumentos=None):
+    """Executa a demonstração ou, com opções, o benchmark completo."""
+    parser = argparse.ArgumentParser(description="Benchmark de algoritmos de busca")
+    parser.add_argument("--tamanhos", type=int, nargs="+", help="tamanhos das listas")
+    parser.add_argument("--distribuicoes", nargs="+", choices=DISTRIBUICOES, default=DISTRIBUICOES)
+    parser.add_argument("--algoritmos", nargs="+", choices=tuple(ALGORITMOS), default=tuple(ALGORITMOS))
+    parser.add_argument("--repeticoes", type=int, default=15)
+    parser.add_argument("--aquecimento", type=int, default=2)
+    parser.add_argument("--consultas", type=int, default=1000)
+    parser.add_argument("--limite-linear", type=int, default=10**6)
+    parser.add_argument("--range", action="store_true", help="usa range em vez de list (para até 10**8)")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--json", help="arquivo onde gravar os resultados")
+    parser.add_argument("--comparar", nargs=2, metavar=("ANTERIOR", "ATUAL"),
+                        help="compara dois arquivos JSON gerados com --json")
+    parser.add_argument("--indices", type=int, metavar="TAMANHO",
+                        help="compara memória e tempo dos modos de IndiceBusca")
+    opcoes = parser.parse_args(argumentos)
+    
+    if opcoes.indices:
+        comparar_indices(opcoes.indices)
+        return
+    
+    if opcoes.comparar:
+        with open(opcoes.comparar[0]) as anterior, open(opcoes.comparar[1]) as atual:
+            comparar_execucoes(json.load(anterior), json.load(atual))
+        return
+    
+    if opcoes.tamanhos is None and opcoes.json is None:
+        print("Comparação de desempenho entre busca linear e binária:\n")
+        # Testar com listas de diferentes tamanhos
+        for tamanho in [1000, 10000, 100000]:
+            comparar_desempenho(tamanho)
+            print()
+        
+        print("Este exemplo demonstra como a escolha da estrutura de dados e algoritmo")
+        print("corretos (lista ordenada + busca binária) pode melhorar drasticamente")
+        print("o desempenho em comparação com abordagens menos eficientes (busca linear).")
+        return
+    
+    resultado = executar_benchmark(
+        tamanhos=opcoes.tamanhos or (10**3, 10**4, 10**5, 10**6),
+        distribuicoes=opcoes.distribuicoes, algoritmos=opcoes.algoritmos,
+        repeticoes=opcoes.repeticoes, aquecimento=opcoes.aquecimento,
+        consultas=opcoes.consultas, limite_linear=opcoes.limite_linear,
+        usar_range=opcoes.range, semente=opcoes.semente,
+    )
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if opcoes.json:
+        with open(opcoes.json, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    else:
+        print(texto)
 
 if __name__ == "__main__":
-    print("Comparação de desempenho entre busca linear e binária:\n")
-    # Testar com listas de diferentes tamanhos
-    for tamanho in [1000, 10000, 100000]:
-        comparar_desempenho(tamanho)
-        print()
-        
-    print("Este exemplo demonstra como a escolha da estrutura de dados e algoritmo")
-    print("corretos (lista ordenada + busca binária) pode melhorar drasticamente")
-    print("o desempenho em comparação com abordagens menos eficientes (busca linear).")
\ No newline at end of file
+    main()
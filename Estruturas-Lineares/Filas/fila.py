@@ -1,4 +1,25 @@
+import heapq
+import operator
 from collections import deque
+from itertools import islice
+
+# Itens mostrados de cada ponta de uma fila longa ao exibi-la
+ITENS_EXIBIDOS = 10
+
+
+def _resumir(primeiros, ultimos, total):
+    """
+    Monta a representação "[a, b, ..., y, z]" de uma estrutura com `total`
+    itens, a partir de um iterador do início para o fim e de outro do fim
+    para o início. Só os itens exibidos são lidos.
+    """
+    if total <= 2 * ITENS_EXIBIDOS:
+        return "[" + ", ".join(map(repr, primeiros)) + "]"
+    inicio = list(map(repr, islice(primeiros, ITENS_EXIBIDOS)))
+    fim = list(map(repr, islice(ultimos, ITENS_EXIBIDOS)))
+    fim.reverse()
+    return "[" + ", ".join(inicio + ["..."] + fim) + "]"
+
 
 class Fila:
     """
@@ -33,23 +54,74 @@ class Fila:
         """Retorna o número de itens na fila."""
         return len(self.itens)
     
+    @classmethod
+    def de_iteravel(cls, iteravel):
+        """Cria uma fila com os itens de um iterável, na ordem em que são produzidos."""
+        fila = cls()
+        fila.estender(iteravel)
+        return fila
+    
+    def estender(self, iteravel):
+        """
+        Enfileira os itens de um iterável em uma única passagem; o deque os
+        consome diretamente, sem criar uma lista intermediária.
+        """
+        self.itens.extend(iteravel)
+    
+    def __len__(self):
+        """Retorna o número de itens na fila."""
+        return len(self.itens)
+    
+    def __iter__(self):
+        """
+        Percorre os itens do início para o final da fila, sem removê-los.
+        O próprio deque lança RuntimeError se a fila for modificada durante
+        o percurso.
+        """
+        return iter(self.itens)
+    
+    def __reversed__(self):
+        """Percorre os itens do final para o início da fila, sem removê-los."""
+        return reversed(self.itens)
+    
+    def __contains__(self, item):
+        """Verifica se o item está na fila."""
+        return item in self.itens
+    
+    def para_lista(self):
+        """Retorna os itens em uma lista do Python, do início para o final da fila."""
+        return list(self.itens)
+    
     def __str__(self):
-        """Retorna uma representação em string da fila."""
-        return str(list(self.itens))
+        """Retorna uma representação em string da fila, resumida se for longa."""
+        return _resumir(iter(self.itens), reversed(self.itens), len(self.itens))
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self})"
 
 
 class FilaCircular:
     """
     Implementação de uma fila circular usando um array.
     A fila circular é uma otimização de espaço para filas baseadas em arrays.
+    
+    Por padrão a capacidade é fixa. Com `crescer=True`, a fila dobra de
+    capacidade quando fica cheia; com `reduzir=True`, ela volta a encolher
+    pela metade quando fica com até 1/4 da capacidade ocupada (nunca abaixo
+    da capacidade inicial). As operações em lote movem os itens com no
+    máximo duas cópias de fatias, uma de cada lado do ponto de volta.
     """
-    def __init__(self, capacidade=10):
+    def __init__(self, capacidade=10, crescer=False, reduzir=False):
         """Inicializa uma fila circular com a capacidade especificada."""
         self.capacidade = capacidade
+        self.capacidade_inicial = capacidade
+        self.crescer = crescer
+        self.reduzir = reduzir
         self.itens = [None] * capacidade
         self.inicio = 0
         self.fim = 0
         self.tamanho_atual = 0
+        self._versao = 0  # Muda a cada alteração, para detectar iterações invalidadas
     
     def esta_vazia(self):
         """Verifica se a fila circular está vazia."""
@@ -62,23 +134,89 @@ class FilaCircular:
     def enfileirar(self, item):
         """Adiciona um item ao final da fila circular."""
         if self.esta_cheia():
-            raise IndexError("Não é possível enfileirar em uma fila cheia")
+            if not self.crescer:
+                raise IndexError("Não é possível enfileirar em uma fila cheia")
+            self._redimensionar(max(1, 2 * self.capacidade))
         
+        self._versao += 1
         self.itens[self.fim] = item
-        self.fim = (self.fim + 1) % self.capacidade
+        # Comparação em vez de módulo para dar a volta no array
+        self.fim += 1
+        if self.fim == self.capacidade:
+            self.fim = 0
         self.tamanho_atual += 1
     
+    def enfileirar_varios(self, itens):
+        """
+        Adiciona vários itens ao final da fila circular de uma vez.
+        Se não houver espaço para todos (e a fila não puder crescer), nenhum
+        item é adicionado.
+        """
+        if not isinstance(itens, (list, tuple)):
+            itens = list(itens)
+        quantidade = len(itens)
+        
+        if quantidade > self.capacidade - self.tamanho_atual:
+            if not self.crescer:
+                raise IndexError("Não há espaço suficiente na fila")
+            nova_capacidade = max(1, self.capacidade)
+            while nova_capacidade < self.tamanho_atual + quantidade:
+                nova_capacidade *= 2
+            self._redimensionar(nova_capacidade)
+        
+        self._versao += 1
+        # Primeira cópia até o fim do array, segunda a partir do início
+        primeira = min(quantidade, self.capacidade - self.fim)
+        self.itens[self.fim:self.fim + primeira] = itens[:primeira]
+        if primeira < quantidade:
+            self.itens[:quantidade - primeira] = itens[primeira:]
+        
+        self.fim = (self.fim + quantidade) % self.capacidade if self.capacidade else 0
+        self.tamanho_atual += quantidade
+    
     def desenfileirar(self):
         """Remove e retorna o item do início da fila circular."""
         if self.esta_vazia():
             raise IndexError("Não é possível desenfileirar de uma fila vazia")
         
+        self._versao += 1
         item = self.itens[self.inicio]
         self.itens[self.inicio] = None
-        self.inicio = (self.inicio + 1) % self.capacidade
+        self.inicio += 1
+        if self.inicio == self.capacidade:
+            self.inicio = 0
         self.tamanho_atual -= 1
+        
+        if self.reduzir:
+            self._talvez_reduzir()
         return item
     
+    def desenfileirar_varios(self, quantidade=None):
+        """
+        Remove e retorna, em uma lista, até `quantidade` itens do início da
+        fila circular (todos, se `quantidade` for None).
+        """
+        if quantidade is None or quantidade > self.tamanho_atual:
+            quantidade = self.tamanho_atual
+        if quantidade <= 0:
+            return []
+        
+        self._versao += 1
+        primeira = min(quantidade, self.capacidade - self.inicio)
+        resultado = self.itens[self.inicio:self.inicio + primeira]
+        self.itens[self.inicio:self.inicio + primeira] = [None] * primeira
+        restante = quantidade - primeira
+        if restante:
+            resultado += self.itens[:restante]
+            self.itens[:restante] = [None] * restante
+        
+        self.inicio = (self.inicio + quantidade) % self.capacidade
+        self.tamanho_atual -= quantidade
+        
+        if self.reduzir:
+            self._talvez_reduzir()
+        return resultado
+    
     def frente(self):
         """Retorna o item do início da fila circular sem removê-lo."""
         if self.esta_vazia():
@@ -89,28 +227,102 @@ class FilaCircular:
         """Retorna o número de itens na fila circular."""
         return self.tamanho_atual
     
-    def __str__(self):
-        """Retorna uma representação em string da fila circular."""
-        if self.esta_vazia():
-            return "[]"
-        
-        resultado = []
+    def __len__(self):
+        """Retorna o número de itens na fila circular."""
+        return self.tamanho_atual
+    
+    def __iter__(self):
+        """
+        Percorre os itens do início para o final direto no array circular,
+        sem removê-los nem copiá-los. Lança RuntimeError se a fila for
+        modificada durante o percurso.
+        """
+        versao = self._versao
+        itens = self.itens
         indice = self.inicio
         for _ in range(self.tamanho_atual):
-            resultado.append(self.itens[indice])
-            indice = (indice + 1) % self.capacidade
-        
-        return str(resultado)
+            yield itens[indice]
+            if self._versao != versao:
+                raise RuntimeError("A fila foi modificada durante a iteração")
+            indice += 1
+            if indice == self.capacidade:
+                indice = 0
+    
+    def __reversed__(self):
+        """Percorre os itens do final para o início, direto no array circular."""
+        versao = self._versao
+        itens = self.itens
+        indice = self.fim
+        for _ in range(self.tamanho_atual):
+            indice = (indice or self.capacidade) - 1
+            yield itens[indice]
+            if self._versao != versao:
+                raise RuntimeError("A fila foi modificada durante a iteração")
+    
+    def __contains__(self, item):
+        """Verifica se o item está na fila circular."""
+        return item in iter(self)
+    
+    def _em_ordem(self):
+        """Retorna os itens do início ao fim, com no máximo duas fatias."""
+        fim_primeira = self.inicio + self.tamanho_atual
+        if fim_primeira <= self.capacidade:
+            return self.itens[self.inicio:fim_primeira]
+        return self.itens[self.inicio:] + self.itens[:fim_primeira - self.capacidade]
+    
+    def _redimensionar(self, nova_capacidade):
+        """Copia os itens, em ordem, para um array com a nova capacidade."""
+        itens = self._em_ordem()
+        itens.extend([None] * (nova_capacidade - self.tamanho_atual))
+        self.itens = itens
+        self.capacidade = nova_capacidade
+        self.inicio = 0
+        self.fim = self.tamanho_atual % nova_capacidade
+    
+    def _talvez_reduzir(self):
+        """Encolhe pela metade se a ocupação cair para 1/4 ou menos."""
+        metade = self.capacidade // 2
+        if metade >= self.capacidade_inicial and self.tamanho_atual <= self.capacidade // 4:
+            self._redimensionar(metade)
+    
+    def __str__(self):
+        """Retorna uma representação em string da fila circular, resumida se for longa."""
+        return _resumir(iter(self), reversed(self), self.tamanho_atual)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self}, capacidade={self.capacidade})"
 
 
 class FilaPrioridade:
     """
-    Implementação simples de uma fila de prioridade.
-    Itens com menor valor de prioridade são atendidos primeiro.
+    Implementação de uma fila de prioridade baseada em um heap binário.
+    Itens com menor valor de prioridade são atendidos primeiro e, entre
+    prioridades iguais, vale a ordem de chegada (FIFO).
+    
+    Enfileirar e desenfileirar custam O(log n). Cada inserção devolve um
+    elemento que funciona como "alça" para cancelar o item ou alterar sua
+    prioridade, também em O(log n).
     """
+    class Elemento:
+        """Entrada do heap; também serve de alça devolvida ao chamador."""
+        __slots__ = ("prioridade", "ordem", "item", "indice")
+        
+        def __init__(self, prioridade, ordem, item):
+            self.prioridade = prioridade
+            self.ordem = ordem
+            self.item = item
+            self.indice = -1  # -1 indica que o elemento não está na fila
+        
+        def __lt__(self, outro):
+            if self.prioridade == outro.prioridade:
+                return self.ordem < outro.ordem
+            return self.prioridade < outro.prioridade
+    
     def __init__(self):
         """Inicializa uma fila de prioridade vazia."""
         self.itens = []
+        self.contador = 0  # Garante a ordem de chegada entre prioridades iguais
+        self._versao = 0
     
     def esta_vazia(self):
         """Verifica se a fila de prioridade está vazia."""
@@ -118,23 +330,36 @@ class FilaPrioridade:
     
     def enfileirar(self, item, prioridade):
         """
-        Adiciona um item à fila de prioridade.
-        Os itens são ordenados pelo valor de prioridade (crescente).
+        Adiciona um item à fila de prioridade em O(log n).
+        Retorna a alça do item, usada em `remover` e `alterar_prioridade`.
         """
-        elemento = (prioridade, item)
-        
-        # Insere o elemento na posição correta para manter a ordenação
-        if self.esta_vazia():
+        self._versao += 1
+        elemento = self.Elemento(prioridade, self.contador, item)
+        self.contador += 1
+        elemento.indice = len(self.itens)
+        self.itens.append(elemento)
+        self._subir(elemento.indice)
+        return elemento
+    
+    def enfileirar_varios(self, pares):
+        """
+        Adiciona vários pares (item, prioridade) de uma vez.
+        Reconstrói o heap em O(n) em vez de fazer n inserções de O(log n).
+        Retorna a lista de alças na mesma ordem dos pares.
+        """
+        self._versao += 1
+        alcas = []
+        for item, prioridade in pares:
+            elemento = self.Elemento(prioridade, self.contador, item)
+            self.contador += 1
+            elemento.indice = len(self.itens)
             self.itens.append(elemento)
-        else:
-            inserido = False
-            for i, (p, _) in enumerate(self.itens):
-                if prioridade < p:
-                    self.itens.insert(i, elemento)
-                    inserido = True
-                    break
-            if not inserido:
-                self.itens.append(elemento)
+            alcas.append(elemento)
+        
+        # Heapify: desce cada nó interno, do último até a raiz
+        for i in range(len(self.itens) // 2 - 1, -1, -1):
+            self._descer(i)
+        return alcas
     
     def desenfileirar(self):
         """Remove e retorna o item de maior prioridade (menor valor)."""
@@ -142,21 +367,145 @@ class FilaPrioridade:
             raise IndexError("Não é possível desenfileirar de uma fila vazia")
         
         # Retorna apenas o item, sem a prioridade
-        return self.itens.pop(0)[1]
+        return self._remover_indice(0).item
     
     def frente(self):
         """Retorna o item de maior prioridade sem removê-lo."""
         if self.esta_vazia():
             raise IndexError("A fila está vazia")
-        return self.itens[0][1]
+        return self.itens[0].item
+    
+    def remover(self, alca):
+        """Cancela o item associado à alça e retorna-o, em O(log n)."""
+        self._validar_alca(alca)
+        return self._remover_indice(alca.indice).item
+    
+    def alterar_prioridade(self, alca, prioridade):
+        """
+        Altera a prioridade do item associado à alça, em O(log n).
+        Serve tanto para diminuir (decrease-key) quanto para aumentar a chave;
+        o item mantém sua posição original na ordem de chegada.
+        """
+        self._validar_alca(alca)
+        self._versao += 1
+        alca.prioridade = prioridade
+        self._subir(alca.indice)
+        self._descer(alca.indice)
     
     def tamanho(self):
         """Retorna o número de itens na fila de prioridade."""
         return len(self.itens)
     
+    def __len__(self):
+        """Retorna o número de itens na fila de prioridade."""
+        return len(self.itens)
+    
+    def __iter__(self):
+        """
+        Percorre os itens na ordem em que estão guardados no heap, que não é
+        a ordem de prioridade, sem removê-los. Lança RuntimeError se a fila
+        for modificada durante o percurso. Não há percurso inverso, porque a
+        ordem do heap não tem um sentido a ser invertido.
+        """
+        versao = self._versao
+        for elemento in self.itens:
+            yield elemento.item
+            if self._versao != versao:
+                raise RuntimeError("A fila foi modificada durante a iteração")
+    
+    def __contains__(self, item):
+        """Verifica se o item está na fila de prioridade."""
+        return item in (elemento.item for elemento in self.itens)
+    
+    def _primeiros(self, quantidade):
+        """
+        Retorna os `quantidade` primeiros elementos em ordem de atendimento,
+        em O(k log k): parte da raiz e, a cada elemento retirado, só os seus
+        dois filhos passam a ser candidatos.
+        """
+        itens = self.itens
+        candidatos = itens[:1]
+        resultado = []
+        while candidatos and len(resultado) < quantidade:
+            elemento = heapq.heappop(candidatos)
+            resultado.append(elemento)
+            for filho in (2 * elemento.indice + 1, 2 * elemento.indice + 2):
+                if filho < len(itens):
+                    heapq.heappush(candidatos, itens[filho])
+        return resultado
+    
+    def _validar_alca(self, alca):
+        """Garante que a alça pertence a um item ainda presente nesta fila."""
+        indice = alca.indice
+        if indice < 0 or indice >= len(self.itens) or self.itens[indice] is not alca:
+            raise ValueError("O item não está na fila de prioridade")
+    
+    def _remover_indice(self, indice):
+        """Remove o elemento de uma posição do heap e restaura a propriedade."""
+        self._versao += 1
+        itens = self.itens
+        elemento = itens[indice]
+        ultimo = itens.pop()
+        if ultimo is not elemento:
+            # O último elemento ocupa a vaga e é reposicionado
+            itens[indice] = ultimo
+            ultimo.indice = indice
+            self._subir(indice)
+            self._descer(ultimo.indice)
+        elemento.indice = -1
+        return elemento
+    
+    def _subir(self, indice):
+        """Sobe o elemento enquanto ele for menor que o pai."""
+        itens = self.itens
+        elemento = itens[indice]
+        while indice > 0:
+            pai = (indice - 1) // 2
+            if not elemento < itens[pai]:
+                break
+            itens[indice] = itens[pai]
+            itens[indice].indice = indice
+            indice = pai
+        itens[indice] = elemento
+        elemento.indice = indice
+    
+    def _descer(self, indice):
+        """Desce o elemento enquanto algum filho for menor que ele."""
+        itens = self.itens
+        n = len(itens)
+        elemento = itens[indice]
+        while True:
+            filho = 2 * indice + 1
+            if filho >= n:
+                break
+            if filho + 1 < n and itens[filho + 1] < itens[filho]:
+                filho += 1
+            if not itens[filho] < elemento:
+                break
+            itens[indice] = itens[filho]
+            itens[indice].indice = indice
+            indice = filho
+        itens[indice] = elemento
+        elemento.indice = indice
+    
     def __str__(self):
-        """Retorna uma representação em string da fila de prioridade."""
-        return str([(p, i) for p, i in self.itens])
+        """
+        Retorna uma representação em string da fila de prioridade, com pares
+        (prioridade, item) em ordem de atendimento, resumida se ela for longa.
+        """
+        total = len(self.itens)
+        primeiros = self._primeiros(2 * ITENS_EXIBIDOS)
+        if total > 2 * ITENS_EXIBIDOS:
+            # Os últimos podem estar em qualquer folha: seleciona-os em uma passagem, com chave em C
+            ultimos = heapq.nlargest(ITENS_EXIBIDOS, self.itens,
+                                     key=operator.attrgetter("prioridade", "ordem"))
+        else:
+            ultimos = []
+        return _resumir(((e.prioridade, e.item) for e in primeiros),
+                        ((e.prioridade, e.item) for e in ultimos), total)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self})"
 
 
 # Exemplo de uso
@@ -177,6 +526,11 @@ if __name__ == "__main__":
     while not fila.esta_vazia():
         print(f"Desenfileirado {fila.desenfileirar()}, fila atual: {fila}")
     
+    print("\nConstruindo uma fila a partir de um gerador...")
+    fila = Fila.de_iteravel(i * 10 for i in range(1, 4))
+    fila.estender(range(40, 60, 10))
+    print(f"Fila: {fila}, percorrida sem remover: {[item for item in fila]}")
+    
     print("\n=== Fila Circular ===")
     fila_circular = FilaCircular(5)
     print(f"Fila circular inicial: {fila_circular}")
@@ -198,6 +552,25 @@ if __name__ == "__main__":
         fila_circular.enfileirar(i * 5)
         print(f"Enfileirado {i * 5}, fila atual: {fila_circular}")
     
+    print("\nFila circular que cresce sob demanda, com operações em lote...")
+    fila_elastica = FilaCircular(4, crescer=True, reduzir=True)
+    fila_elastica.enfileirar_varios(range(1, 11))
+    print(f"Após enfileirar 10 itens: {fila_elastica} (capacidade {fila_elastica.capacidade})")
+    print(f"Desenfileirados em lote: {fila_elastica.desenfileirar_varios(8)}")
+    print(f"Fila atual: {fila_elastica} (capacidade {fila_elastica.capacidade})")
+    
+    print("\nPercorrendo a fila circular sem removê-la...")
+    fila_longa = FilaCircular(64, crescer=True)
+    fila_longa.enfileirar_varios(range(100))
+    print(f"Fila resumida: {fila_longa}")
+    print(f"len: {len(fila_longa)}, 42 está na fila? {42 in fila_longa}, "
+          f"três últimos de trás para frente: {list(islice(reversed(fila_longa), 3))}")
+    try:
+        for item in fila_longa:
+            fila_longa.desenfileirar()
+    except RuntimeError as erro:
+        print(f"Erro: {erro}")
+    
     print("\n=== Fila de Prioridade ===")
     fila_prioridade = FilaPrioridade()
     print(f"Fila de prioridade inicial: {fila_prioridade}")
@@ -215,4 +588,15 @@ if __name__ == "__main__":
     
     print("\nDesenfileirando elementos por ordem de prioridade...")
     while not fila_prioridade.esta_vazia():
-        print(f"Desenfileirado {fila_prioridade.desenfileirar()}, fila atual: {fila_prioridade}")
\ No newline at end of file
+        print(f"Desenfileirado {fila_prioridade.desenfileirar()}, fila atual: {fila_prioridade}")
+    print("\nUsando alças para cancelar e repriorizar tarefas...")
+    alcas = fila_prioridade.enfileirar_varios(
+        [("Backup", 3), ("Relatório", 2), ("E-mail", 2), ("Deploy", 5)]
+    )
+    print(f"Fila após enfileirar em lote: {fila_prioridade}")
+    fila_prioridade.remover(alcas[1])
+    print(f"Após cancelar 'Relatório': {fila_prioridade}")
+    fila_prioridade.alterar_prioridade(alcas[3], 1)
+    print(f"Após mudar 'Deploy' para prioridade 1: {fila_prioridade}")
+    while not fila_prioridade.esta_vazia():
+        print(f"Desenfileirado {fila_prioridade.desenfileirar()}, fila atual: {fila_prioridade}")
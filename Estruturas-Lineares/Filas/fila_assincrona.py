@@ -0,0 +1,337 @@
+import asyncio
+import sys
+import time
+from collections import deque
+
+from fila import FilaCircular
+
+
+class FilaAssincrona:
+    """
+    Fila de capacidade limitada para uso com asyncio.
+    
+    Os itens ficam em uma `FilaCircular` de capacidade fixa: quando ela está
+    cheia, `await enfileirar(...)` suspende o produtor até surgir espaço
+    (contrapressão), e quando está vazia `await desenfileirar()` suspende o
+    consumidor até chegar um item. As tarefas suspensas são acordadas em
+    ordem de chegada, cada uma só quando o que ela precisa (um item, um lote
+    inteiro ou uma posição livre) já está disponível.
+    
+    `desenfileirar_lote` retira vários itens com uma única cópia de fatias,
+    o que poupa a troca de contexto por item que um consumidor de
+    `asyncio.Queue` paga ao montar lotes com `get`.
+    """
+    def __init__(self, capacidade=1024):
+        """Inicializa uma fila assíncrona com a capacidade especificada."""
+        self.fila = FilaCircular(capacidade)
+        # Pares (futuro, quantidade necessária) das tarefas suspensas
+        self._produtores = deque()
+        self._consumidores = deque()
+        self.total_enfileirados = 0
+        self.total_desenfileirados = 0
+        self.esperas_produtores = 0
+        self.esperas_consumidores = 0
+    
+    def esta_vazia(self):
+        """Verifica se a fila está vazia."""
+        return self.fila.esta_vazia()
+    
+    def esta_cheia(self):
+        """Verifica se a fila está cheia."""
+        return self.fila.esta_cheia()
+    
+    def tamanho(self):
+        """Retorna o número de itens na fila."""
+        return self.fila.tamanho()
+    
+    def _disponivel(self, esperando):
+        """Itens (para consumidores) ou posições livres (para produtores) disponíveis."""
+        if esperando is self._consumidores:
+            return self.fila.tamanho_atual
+        return self.fila.capacidade - self.fila.tamanho_atual
+    
+    def _acordar(self, esperando):
+        """
+        Acorda, em ordem de chegada, as tarefas cuja necessidade já pode ser
+        atendida. Uma tarefa que pede mais do que há disponível não segura as
+        que chegaram depois pedindo menos; como só lotes com prazo pedem mais
+        de um item, ela espera no máximo até o fim do prazo.
+        """
+        disponivel = self._disponivel(esperando)
+        adiadas = []
+        while esperando and disponivel:
+            entrada = esperando.popleft()
+            futuro, necessario = entrada
+            if futuro.done():
+                continue
+            if necessario > disponivel:
+                adiadas.append(entrada)
+                continue
+            futuro.set_result(None)
+            disponivel -= necessario
+        # As adiadas voltam para a frente, na ordem em que chegaram
+        esperando.extendleft(reversed(adiadas))
+    
+    async def _esperar(self, esperando, necessario=1, timeout=None):
+        """
+        Suspende a tarefa até ser acordada. Retorna False se o tempo de
+        espera se esgotar antes disso.
+        """
+        futuro = asyncio.get_running_loop().create_future()
+        entrada = (futuro, necessario)
+        esperando.append(entrada)
+        
+        try:
+            if timeout is None:
+                await futuro
+            else:
+                await asyncio.wait((futuro,), timeout=timeout)
+        except asyncio.CancelledError:
+            if futuro.done() and not futuro.cancelled():
+                # Foi acordada, mas não vai usar a vez: repassa o aviso
+                self._acordar(esperando)
+            else:
+                futuro.cancel()
+                self._descartar(esperando, entrada)
+            raise
+        
+        if futuro.done():
+            return True
+        futuro.cancel()
+        self._descartar(esperando, entrada)
+        return False
+    
+    def _descartar(self, esperando, entrada):
+        """Tira uma tarefa da espera e acorda quem estava bloqueado atrás dela."""
+        try:
+            esperando.remove(entrada)
+        except ValueError:
+            pass
+        self._acordar(esperando)
+    
+    def enfileirar_sem_esperar(self, item):
+        """Adiciona um item ao final da fila ou lança IndexError se ela estiver cheia."""
+        self.fila.enfileirar(item)
+        self.total_enfileirados += 1
+        if self._consumidores:
+            self._acordar(self._consumidores)
+    
+    async def enfileirar(self, item):
+        """Adiciona um item ao final da fila, esperando por espaço se ela estiver cheia."""
+        while self.fila.esta_cheia():
+            self.esperas_produtores += 1
+            await self._esperar(self._produtores)
+        self.enfileirar_sem_esperar(item)
+    
+    async def enfileirar_varios(self, itens):
+        """
+        Adiciona vários itens ao final da fila, preenchendo o espaço livre de
+        uma vez e esperando por mais espaço quantas vezes for preciso.
+        """
+        if not isinstance(itens, (list, tuple)):
+            itens = list(itens)
+        enviados = 0
+        
+        while enviados < len(itens):
+            livre = self.fila.capacidade - self.fila.tamanho_atual
+            if livre == 0:
+                self.esperas_produtores += 1
+                await self._esperar(self._produtores)
+                continue
+            
+            lote = itens[enviados:enviados + livre]
+            self.fila.enfileirar_varios(lote)
+            enviados += len(lote)
+            self.total_enfileirados += len(lote)
+            if self._consumidores:
+                self._acordar(self._consumidores)
+    
+    def desenfileirar_sem_esperar(self):
+        """Remove e retorna o item do início da fila ou lança IndexError se ela estiver vazia."""
+        item = self.fila.desenfileirar()
+        self.total_desenfileirados += 1
+        if self._produtores:
+            self._acordar(self._produtores)
+        return item
+    
+    async def desenfileirar(self):
+        """Remove e retorna o item do início da fila, esperando por um item se ela estiver vazia."""
+        while self.fila.esta_vazia():
+            self.esperas_consumidores += 1
+            await self._esperar(self._consumidores)
+        return self.desenfileirar_sem_esperar()
+    
+    async def desenfileirar_lote(self, maximo, timeout=None):
+        """
+        Remove e retorna, em uma lista, até `maximo` itens do início da fila.
+        
+        Sem `timeout`, espera apenas pelo primeiro item e leva o que estiver
+        disponível. Com `timeout` (em segundos), espera até haver `maximo`
+        itens ou até o prazo acabar, e então leva o que houver, podendo
+        retornar uma lista vazia. Os itens só saem da fila no final, de modo
+        que cancelar a tarefa durante a espera não perde nenhum item.
+        """
+        laco = asyncio.get_running_loop()
+        if timeout is None:
+            necessario = 1
+            prazo = None
+        else:
+            necessario = max(1, min(maximo, self.fila.capacidade))
+            prazo = laco.time() + timeout
+        
+        while self.fila.tamanho_atual < necessario:
+            restante = None if prazo is None else prazo - laco.time()
+            if restante is not None and restante <= 0:
+                break
+            self.esperas_consumidores += 1
+            await self._esperar(self._consumidores, necessario, restante)
+        
+        lote = self.fila.desenfileirar_varios(maximo)
+        if lote:
+            self.total_desenfileirados += len(lote)
+            if self._produtores:
+                self._acordar(self._produtores)
+        return lote
+    
+    def metricas(self):
+        """Retorna um dicionário com a ocupação, as tarefas em espera e os contadores da fila."""
+        return {
+            "tamanho": self.fila.tamanho_atual,
+            "capacidade": self.fila.capacidade,
+            "produtores_esperando": sum(not futuro.done() for futuro, _ in self._produtores),
+            "consumidores_esperando": sum(not futuro.done() for futuro, _ in self._consumidores),
+            "total_enfileirados": self.total_enfileirados,
+            "total_desenfileirados": self.total_desenfileirados,
+            "esperas_produtores": self.esperas_produtores,
+            "esperas_consumidores": self.esperas_consumidores,
+        }
+    
+    def __str__(self):
+        """Retorna uma representação em string da fila."""
+        return str(self.fila)
+
+
+async def _medir(produtores, consumidores, total, enfileirar, consumir, finalizar):
+    """
+    Executa `produtores` tarefas que chamam `enfileirar(inicio, fim)` e
+    `consumidores` tarefas que chamam `consumir()` até receberem o sinal de
+    fim, e retorna a vazão em itens por segundo.
+    """
+    por_produtor = total // produtores
+    tempo_inicio = time.perf_counter()
+    
+    tarefas_consumidoras = [asyncio.create_task(consumir()) for _ in range(consumidores)]
+    await asyncio.gather(*(enfileirar(i * por_produtor, (i + 1) * por_produtor)
+                           for i in range(produtores)))
+    # Um sinal de fim (None) para cada consumidor
+    await finalizar(consumidores)
+    await asyncio.gather(*tarefas_consumidoras)
+    
+    return por_produtor * produtores / (time.perf_counter() - tempo_inicio)
+
+
+async def _cenario_asyncio(produtores, consumidores, total, capacidade, lote):
+    fila = asyncio.Queue(capacidade)
+    
+    async def enfileirar(inicio, fim):
+        for i in range(inicio, fim):
+            await fila.put(i)
+    
+    async def consumir():
+        while True:
+            # Monta o lote com um get bloqueante seguido de get_nowait
+            itens = [await fila.get()]
+            while len(itens) < lote and not fila.empty():
+                itens.append(fila.get_nowait())
+            sinais = itens.count(None)
+            if sinais:
+                for _ in range(sinais - 1):
+                    await fila.put(None)
+                return
+    
+    async def finalizar(quantidade):
+        for _ in range(quantidade):
+            await fila.put(None)
+    
+    return await _medir(produtores, consumidores, total, enfileirar, consumir, finalizar)
+
+
+async def _cenario_fila_assincrona(produtores, consumidores, total, capacidade, lote):
+    fila = FilaAssincrona(capacidade)
+    
+    async def enfileirar(inicio, fim):
+        for i in range(inicio, fim):
+            await fila.enfileirar(i)
+    
+    async def consumir():
+        while True:
+            itens = await fila.desenfileirar_lote(lote)
+            sinais = itens.count(None)
+            if sinais:
+                # Devolve os sinais de fim que pertencem a outros consumidores
+                await fila.enfileirar_varios([None] * (sinais - 1))
+                return
+    
+    async def finalizar(quantidade):
+        await fila.enfileirar_varios([None] * quantidade)
+    
+    return await _medir(produtores, consumidores, total, enfileirar, consumir, finalizar)
+
+
+def comparar_desempenho(cenarios=((1, 1), (4, 4), (16, 16)), total=200_000,
+                        capacidade=1024, lotes=(1, 16, 64, 256)):
+    """
+    Compara a vazão (milhões de itens por segundo) de `FilaAssincrona` com
+    a de `asyncio.Queue` para consumidores que processam lotes de vários
+    tamanhos. Cada cenário é um par (produtores, consumidores).
+    """
+    for produtores, consumidores in cenarios:
+        print(f"{produtores} produtor(es), {consumidores} consumidor(es):")
+        for lote in lotes:
+            vazao_asyncio = asyncio.run(
+                _cenario_asyncio(produtores, consumidores, total, capacidade, lote))
+            vazao_fila = asyncio.run(
+                _cenario_fila_assincrona(produtores, consumidores, total, capacidade, lote))
+            print(f"  lote {lote:>4}   asyncio.Queue: {vazao_asyncio / 1e6:6.3f}"
+                  f"   FilaAssincrona: {vazao_fila / 1e6:6.3f}")
+        print()
+
+
+# Demonstração de uso
+async def demonstrar():
+    fila = FilaAssincrona(capacidade=4)
+    recebidos = []
+    
+    async def produtor():
+        for i in range(1, 11):
+            await fila.enfileirar(i)
+        await fila.enfileirar(None)
+    
+    async def consumidor():
+        while True:
+            lote = await fila.desenfileirar_lote(3, timeout=0.01)
+            print(f"Lote recebido: {lote}")
+            if None in lote:
+                recebidos.extend(item for item in lote if item is not None)
+                return
+            recebidos.extend(lote)
+    
+    await asyncio.gather(produtor(), consumidor())
+    print(f"Itens recebidos: {recebidos}")
+    
+    print("\nLote com prazo em uma fila vazia:")
+    print(f"Resultado após 50 ms: {await fila.desenfileirar_lote(5, timeout=0.05)}")
+    
+    print("\nMétricas da fila:")
+    for nome, valor in fila.metricas().items():
+        print(f"  {nome}: {valor}")
+
+
+if __name__ == "__main__":
+    print("=== Fila assíncrona com capacidade limitada ===")
+    asyncio.run(demonstrar())
+    
+    # A comparação leva vários segundos e só roda com --comparar
+    if "--comparar" in sys.argv:
+        print("\nComparação de vazão com asyncio.Queue (milhões de itens/s):\n")
+        comparar_desempenho()
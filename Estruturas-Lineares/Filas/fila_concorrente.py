@@ -0,0 +1,438 @@
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+from fila import FilaCircular
+
+
+class FilaConcorrente:
+    """
+    Fila circular segura para várias threads produtoras e consumidoras (MPMC).
+    
+    Os itens ficam em uma `FilaCircular` de capacidade fixa protegida por uma
+    única trava. `enfileirar` bloqueia enquanto a fila está cheia e
+    `desenfileirar` enquanto ela está vazia, ambos com `timeout` opcional
+    (None espera indefinidamente; 0 não espera). As operações em lote
+    copiam vários itens de uma vez e acordam as threads em espera com um
+    único aviso, em vez de um aviso por item.
+    """
+    def __init__(self, capacidade=1024):
+        """Inicializa uma fila concorrente com a capacidade especificada."""
+        self.fila = FilaCircular(capacidade)
+        self._trava = threading.Lock()
+        self._nao_vazia = threading.Condition(self._trava)
+        self._nao_cheia = threading.Condition(self._trava)
+    
+    def _tem_itens(self):
+        return self.fila.tamanho_atual > 0
+    
+    def _tem_espaco(self):
+        return self.fila.tamanho_atual < self.fila.capacidade
+    
+    def esta_vazia(self):
+        """Verifica se a fila está vazia (o resultado pode mudar logo em seguida)."""
+        return self.fila.esta_vazia()
+    
+    def tamanho(self):
+        """Retorna o número de itens na fila (o resultado pode mudar logo em seguida)."""
+        return self.fila.tamanho()
+    
+    def enfileirar(self, item, timeout=None):
+        """
+        Adiciona um item ao final da fila, esperando por espaço se ela
+        estiver cheia. Lança IndexError se o tempo de espera se esgotar.
+        """
+        with self._trava:
+            if not self._nao_cheia.wait_for(self._tem_espaco, timeout):
+                raise IndexError("Tempo esgotado esperando espaço na fila")
+            self.fila.enfileirar(item)
+            self._nao_vazia.notify()
+    
+    def desenfileirar(self, timeout=None):
+        """
+        Remove e retorna o item do início da fila, esperando por um item se
+        ela estiver vazia. Lança IndexError se o tempo de espera se esgotar.
+        """
+        with self._trava:
+            if not self._nao_vazia.wait_for(self._tem_itens, timeout):
+                raise IndexError("Tempo esgotado esperando um item na fila")
+            item = self.fila.desenfileirar()
+            self._nao_cheia.notify()
+            return item
+    
+    def enfileirar_varios(self, itens, timeout=None):
+        """
+        Adiciona vários itens ao final da fila, esperando por espaço quantas
+        vezes for preciso. Retorna quantos itens foram enfileirados, que só é
+        menor que o total se o tempo de espera se esgotar.
+        """
+        if not isinstance(itens, (list, tuple)):
+            itens = list(itens)
+        prazo = None if timeout is None else time.monotonic() + timeout
+        enviados = 0
+        
+        with self._trava:
+            while enviados < len(itens):
+                livre = self.fila.capacidade - self.fila.tamanho_atual
+                if livre == 0:
+                    restante = None if prazo is None else prazo - time.monotonic()
+                    if not self._nao_cheia.wait_for(self._tem_espaco, restante):
+                        break
+                    continue
+                
+                lote = itens[enviados:enviados + livre]
+                self.fila.enfileirar_varios(lote)
+                enviados += len(lote)
+                # Um único aviso acorda de uma vez os consumidores necessários
+                self._nao_vazia.notify(len(lote))
+        
+        return enviados
+    
+    def desenfileirar_varios(self, maximo=None, timeout=None):
+        """
+        Remove e retorna, em uma lista, até `maximo` itens do início da fila
+        (todos os disponíveis, se `maximo` for None). Espera até haver ao
+        menos um item; se o tempo de espera se esgotar, retorna uma lista vazia.
+        """
+        with self._trava:
+            if not self._nao_vazia.wait_for(self._tem_itens, timeout):
+                return []
+            itens = self.fila.desenfileirar_varios(maximo)
+            self._nao_cheia.notify(len(itens))
+            return itens
+
+
+class FilaConcorrenteSPSC:
+    """
+    Fila circular para exatamente uma thread produtora e uma consumidora (SPSC).
+    
+    No caminho rápido nenhuma trava é usada: só o produtor altera o contador
+    de itens escritos e só o consumidor altera o de itens lidos, e no CPython
+    a atribuição de um atributo ou de uma posição de lista é atômica. A
+    capacidade é arredondada para uma potência de 2, de modo que a posição
+    no array sai de uma máscara de bits. A trava só entra em cena quando um
+    dos lados precisa dormir: ele marca que está esperando antes de
+    reavaliar a condição, e o outro lado só o acorda se vir essa marca.
+    
+    Usar mais de um produtor ou mais de um consumidor ao mesmo tempo
+    corrompe a fila; para esse caso use `FilaConcorrente`.
+    """
+    def __init__(self, capacidade=1024):
+        """Inicializa a fila com capacidade igual à potência de 2 mais próxima acima."""
+        self.capacidade = 1 << max(0, capacidade - 1).bit_length()
+        self._mascara = self.capacidade - 1
+        self.itens = [None] * self.capacidade
+        self._escritos = 0  # alterado apenas pelo produtor
+        self._lidos = 0     # alterado apenas pelo consumidor
+        self._trava = threading.Lock()
+        self._nao_vazia = threading.Condition(self._trava)
+        self._nao_cheia = threading.Condition(self._trava)
+        self._consumidor_esperando = False
+        self._produtor_esperando = False
+    
+    def _tem_itens(self):
+        return self._escritos != self._lidos
+    
+    def _tem_espaco(self):
+        return self._escritos - self._lidos < self.capacidade
+    
+    def esta_vazia(self):
+        """Verifica se a fila está vazia (o resultado pode mudar logo em seguida)."""
+        return self._escritos == self._lidos
+    
+    def tamanho(self):
+        """Retorna o número de itens na fila (o resultado pode mudar logo em seguida)."""
+        return self._escritos - self._lidos
+    
+    def _esperar_espaco(self, timeout):
+        """Faz o produtor dormir até haver espaço; retorna False se o tempo se esgotar."""
+        with self._trava:
+            self._produtor_esperando = True
+            try:
+                return self._nao_cheia.wait_for(self._tem_espaco, timeout)
+            finally:
+                self._produtor_esperando = False
+    
+    def _esperar_itens(self, timeout):
+        """Faz o consumidor dormir até haver itens; retorna False se o tempo se esgotar."""
+        with self._trava:
+            self._consumidor_esperando = True
+            try:
+                return self._nao_vazia.wait_for(self._tem_itens, timeout)
+            finally:
+                self._consumidor_esperando = False
+    
+    def _avisar_consumidor(self):
+        if self._consumidor_esperando:
+            with self._trava:
+                self._nao_vazia.notify()
+    
+    def _avisar_produtor(self):
+        if self._produtor_esperando:
+            with self._trava:
+                self._nao_cheia.notify()
+    
+    def enfileirar(self, item, timeout=None):
+        """
+        Adiciona um item ao final da fila, esperando por espaço se ela
+        estiver cheia. Lança IndexError se o tempo de espera se esgotar.
+        """
+        if self._escritos - self._lidos == self.capacidade and not self._esperar_espaco(timeout):
+            raise IndexError("Tempo esgotado esperando espaço na fila")
+        
+        self.itens[self._escritos & self._mascara] = item
+        # Publica o item só depois de gravá-lo no array
+        self._escritos += 1
+        self._avisar_consumidor()
+    
+    def desenfileirar(self, timeout=None):
+        """
+        Remove e retorna o item do início da fila, esperando por um item se
+        ela estiver vazia. Lança IndexError se o tempo de espera se esgotar.
+        """
+        if self._escritos == self._lidos and not self._esperar_itens(timeout):
+            raise IndexError("Tempo esgotado esperando um item na fila")
+        
+        indice = self._lidos & self._mascara
+        item = self.itens[indice]
+        self.itens[indice] = None
+        self._lidos += 1
+        self._avisar_produtor()
+        return item
+    
+    def enfileirar_varios(self, itens, timeout=None):
+        """
+        Adiciona vários itens ao final da fila, com no máximo duas cópias de
+        fatias por lote e um único aviso ao consumidor. Retorna quantos itens
+        foram enfileirados, que só é menor que o total se o tempo de espera
+        se esgotar.
+        """
+        if not isinstance(itens, (list, tuple)):
+            itens = list(itens)
+        prazo = None if timeout is None else time.monotonic() + timeout
+        enviados = 0
+        
+        while enviados < len(itens):
+            livre = self.capacidade - (self._escritos - self._lidos)
+            if livre == 0:
+                restante = None if prazo is None else prazo - time.monotonic()
+                if not self._esperar_espaco(restante):
+                    break
+                continue
+            
+            quantidade = min(livre, len(itens) - enviados)
+            inicio = self._escritos & self._mascara
+            primeira = min(quantidade, self.capacidade - inicio)
+            self.itens[inicio:inicio + primeira] = itens[enviados:enviados + primeira]
+            if primeira < quantidade:
+                self.itens[:quantidade - primeira] = itens[enviados + primeira:enviados + quantidade]
+            
+            enviados += quantidade
+            self._escritos += quantidade
+            self._avisar_consumidor()
+        
+        return enviados
+    
+    def desenfileirar_varios(self, maximo=None, timeout=None):
+        """
+        Remove e retorna, em uma lista, até `maximo` itens do início da fila
+        (todos os disponíveis, se `maximo` for None). Espera até haver ao
+        menos um item; se o tempo de espera se esgotar, retorna uma lista vazia.
+        """
+        if self._escritos == self._lidos and not self._esperar_itens(timeout):
+            return []
+        
+        quantidade = self._escritos - self._lidos
+        if maximo is not None and maximo < quantidade:
+            quantidade = maximo
+        if quantidade <= 0:
+            return []
+        
+        inicio = self._lidos & self._mascara
+        primeira = min(quantidade, self.capacidade - inicio)
+        resultado = self.itens[inicio:inicio + primeira]
+        self.itens[inicio:inicio + primeira] = [None] * primeira
+        if primeira < quantidade:
+            resultado += self.itens[:quantidade - primeira]
+            self.itens[:quantidade - primeira] = [None] * (quantidade - primeira)
+        
+        self._lidos += quantidade
+        self._avisar_produtor()
+        return resultado
+
+
+def _medir(produtores, consumidores, total, enfileirar, consumir, finalizar):
+    """
+    Executa `produtores` threads que chamam `enfileirar(inicio, fim)` e
+    `consumidores` threads que chamam `consumir()` até receberem o sinal de
+    fim, e retorna a vazão em itens por segundo.
+    """
+    por_produtor = total // produtores
+    threads_produtoras = [
+        threading.Thread(target=enfileirar, args=(i * por_produtor, (i + 1) * por_produtor))
+        for i in range(produtores)
+    ]
+    threads_consumidoras = [threading.Thread(target=consumir) for _ in range(consumidores)]
+    
+    tempo_inicio = time.perf_counter()
+    for thread in threads_consumidoras + threads_produtoras:
+        thread.start()
+    for thread in threads_produtoras:
+        thread.join()
+    # Um sinal de fim (None) para cada consumidor
+    finalizar(consumidores)
+    for thread in threads_consumidoras:
+        thread.join()
+    tempo = time.perf_counter() - tempo_inicio
+    
+    return por_produtor * produtores / tempo
+
+
+def _cenario_queue(produtores, consumidores, total, capacidade, lote):
+    fila = queue.Queue(capacidade)
+    
+    def enfileirar(inicio, fim):
+        for i in range(inicio, fim):
+            fila.put(i)
+    
+    def consumir():
+        while fila.get() is not None:
+            pass
+    
+    def finalizar(quantidade):
+        for _ in range(quantidade):
+            fila.put(None)
+    
+    return _medir(produtores, consumidores, total, enfileirar, consumir, finalizar)
+
+
+def _cenario_deque(produtores, consumidores, total, capacidade, lote):
+    # deque não bloqueia: o consumidor cede a vez quando a encontra vazia
+    fila = deque()
+    
+    def enfileirar(inicio, fim):
+        for i in range(inicio, fim):
+            fila.append(i)
+    
+    def consumir():
+        while True:
+            try:
+                item = fila.popleft()
+            except IndexError:
+                time.sleep(0)
+                continue
+            if item is None:
+                return
+    
+    def finalizar(quantidade):
+        fila.extend([None] * quantidade)
+    
+    return _medir(produtores, consumidores, total, enfileirar, consumir, finalizar)
+
+
+def _cenario_concorrente(classe, em_lote):
+    def cenario(produtores, consumidores, total, capacidade, lote):
+        fila = classe(capacidade)
+        
+        if em_lote:
+            def enfileirar(inicio, fim):
+                for i in range(inicio, fim, lote):
+                    fila.enfileirar_varios(range(i, min(i + lote, fim)))
+            
+            def consumir():
+                while True:
+                    itens = fila.desenfileirar_varios(lote)
+                    sinais = itens.count(None)
+                    if sinais:
+                        # Devolve os sinais de fim que pertencem a outros consumidores
+                        if sinais > 1:
+                            fila.enfileirar_varios([None] * (sinais - 1))
+                        return
+        else:
+            def enfileirar(inicio, fim):
+                for i in range(inicio, fim):
+                    fila.enfileirar(i)
+            
+            def consumir():
+                while fila.desenfileirar() is not None:
+                    pass
+        
+        def finalizar(quantidade):
+            fila.enfileirar_varios([None] * quantidade)
+        
+        return _medir(produtores, consumidores, total, enfileirar, consumir, finalizar)
+    return cenario
+
+
+CENARIOS = {
+    "queue.Queue": _cenario_queue,
+    "deque": _cenario_deque,
+    "FilaConcorrente": _cenario_concorrente(FilaConcorrente, False),
+    "FilaConcorrente (lote)": _cenario_concorrente(FilaConcorrente, True),
+    "FilaConcorrenteSPSC": _cenario_concorrente(FilaConcorrenteSPSC, False),
+    "FilaConcorrenteSPSC (lote)": _cenario_concorrente(FilaConcorrenteSPSC, True),
+}
+
+
+def comparar_desempenho(threads=(2, 4, 8, 16), total=200_000, capacidade=1024, lote=64):
+    """
+    Compara a vazão (milhões de itens por segundo) das filas concorrentes
+    com `queue.Queue` e `collections.deque`, usando metade das threads como
+    produtoras e metade como consumidoras. As variantes SPSC só participam
+    do cenário com duas threads.
+    """
+    print(f"{'Threads':>7}  " + "  ".join(f"{nome:>26}" for nome in CENARIOS))
+    for quantidade in threads:
+        produtores = max(1, quantidade // 2)
+        consumidores = max(1, quantidade - produtores)
+        colunas = []
+        for nome, cenario in CENARIOS.items():
+            if "SPSC" in nome and (produtores, consumidores) != (1, 1):
+                colunas.append(f"{'-':>26}")
+                continue
+            vazao = cenario(produtores, consumidores, total, capacidade, lote)
+            colunas.append(f"{vazao / 1e6:26.3f}")
+        print(f"{quantidade:>7}  " + "  ".join(colunas))
+
+
+# Demonstração de uso
+if __name__ == "__main__":
+    print("=== Fila concorrente (vários produtores e consumidores) ===")
+    fila = FilaConcorrente(capacidade=4)
+    resultados = []
+    
+    def consumidor():
+        while True:
+            itens = fila.desenfileirar_varios(3)
+            if None in itens:
+                resultados.extend(item for item in itens if item is not None)
+                return
+            resultados.extend(itens)
+    
+    thread = threading.Thread(target=consumidor)
+    thread.start()
+    for inicio in range(0, 20, 5):
+        fila.enfileirar_varios(range(inicio, inicio + 5))
+    fila.enfileirar(None)
+    thread.join()
+    print(f"Itens recebidos pelo consumidor: {resultados}")
+    
+    print("\nTempo de espera esgotado em uma fila vazia:")
+    try:
+        fila.desenfileirar(timeout=0.1)
+    except IndexError as erro:
+        print(f"Erro: {erro}")
+    
+    print("\n=== Fila SPSC (um produtor, um consumidor) ===")
+    fila_spsc = FilaConcorrenteSPSC(capacidade=5)
+    print(f"Capacidade arredondada para potência de 2: {fila_spsc.capacidade}")
+    fila_spsc.enfileirar_varios(range(1, 9))
+    print(f"Desenfileirados em lote: {fila_spsc.desenfileirar_varios(5)}")
+    print(f"Itens restantes: {fila_spsc.tamanho()}")
+    
+    # A comparação leva vários segundos e só roda com --comparar
+    if "--comparar" in sys.argv:
+        print("\nComparação de vazão (milhões de itens/s):\n")
+        comparar_desempenho()
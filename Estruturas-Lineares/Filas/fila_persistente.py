@@ -0,0 +1,417 @@
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+
+class FilaPersistente:
+    """
+    Fila que guarda os itens em disco e sobrevive ao reinício do processo.
+    
+    Os itens são serializados e anexados a arquivos de segmento mapeados em
+    memória (`mmap`). Cada registro é um cabeçalho (tamanho, CRC32) seguido
+    dos dados; um cabeçalho zerado marca o fim do segmento. A posição de
+    leitura fica em um arquivo de checkpoint com dois slots usados
+    alternadamente, cada um com número de sequência e CRC, de modo que uma
+    gravação interrompida nunca destrói o último checkpoint válido.
+    Segmentos totalmente consumidos são apagados.
+    
+    Como tudo é escrito na memória mapeada, os dados já estão no cache de
+    páginas do sistema quando `enfileirar` retorna e sobrevivem a um
+    `kill -9` do processo. A política de sincronização decide quando eles
+    são forçados para o disco (fsync), o que protege contra queda do
+    sistema ou de energia:
+    
+    - "sempre": a cada operação (mais durável, mais lento);
+    - "lote": a cada `lote` operações ou `intervalo` segundos (group commit);
+    - "nunca": só em `sincronizar()` e `fechar()`.
+    
+    Na recuperação, os registros são validados pelo CRC e a fila continua a
+    partir do último checkpoint. Um item desenfileirado após a última
+    sincronização pode ser entregue de novo depois de uma queda do sistema
+    (entrega pelo menos uma vez). Apenas um processo deve abrir o mesmo
+    diretório por vez.
+    """
+    _REGISTRO = struct.Struct("<II")          # tamanho, CRC32
+    _CHECKPOINT = struct.Struct("<QQQI")      # sequência, segmento, deslocamento, CRC32
+    _EXTENSAO = ".seg"
+    POLITICAS = ("sempre", "lote", "nunca")
+    
+    def __init__(self, diretorio, tamanho_segmento=1 << 24, sincronizacao="lote",
+                 lote=256, intervalo=0.05, serializar=pickle.dumps, desserializar=pickle.loads):
+        """Abre (ou cria) a fila guardada no diretório e recupera seu estado."""
+        if sincronizacao not in self.POLITICAS:
+            raise ValueError(f"Política de sincronização desconhecida: {sincronizacao}")
+        
+        self.diretorio = diretorio
+        self.tamanho_segmento = tamanho_segmento
+        self.sincronizacao = sincronizacao
+        self.lote = lote
+        self.intervalo = intervalo
+        self.serializar = serializar
+        self.desserializar = desserializar
+        
+        self._pendentes = 0
+        self._ultima_sincronizacao = time.monotonic()
+        os.makedirs(diretorio, exist_ok=True)
+        self._abrir_checkpoint()
+        self._recuperar()
+    
+    # ----- arquivos e mapeamentos -----
+    
+    def _caminho(self, numero):
+        return os.path.join(self.diretorio, f"{numero:020d}{self._EXTENSAO}")
+    
+    def _segmentos(self):
+        """Números dos segmentos existentes, em ordem."""
+        return sorted(int(nome[:-len(self._EXTENSAO)]) for nome in os.listdir(self.diretorio)
+                      if nome.endswith(self._EXTENSAO))
+    
+    def _mapear(self, numero, tamanho=None):
+        """Mapeia um segmento; com `tamanho`, cria o arquivo com esse tamanho."""
+        caminho = self._caminho(numero)
+        if tamanho is None:
+            descritor = os.open(caminho, os.O_RDWR)
+        else:
+            # Cria com outro nome e renomeia, para nunca deixar um segmento vazio
+            descritor = os.open(caminho + ".tmp", os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if tamanho is not None:
+                os.ftruncate(descritor, tamanho)
+                os.replace(caminho + ".tmp", caminho)
+            return mmap.mmap(descritor, 0)
+        finally:
+            os.close(descritor)
+    
+    def _sincronizar_diretorio(self):
+        """Torna duráveis as criações e remoções de arquivos no diretório."""
+        if self.sincronizacao == "nunca" or not hasattr(os, "O_DIRECTORY"):
+            return
+        descritor = os.open(self.diretorio, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descritor)
+        finally:
+            os.close(descritor)
+    
+    def _abrir_checkpoint(self):
+        caminho = os.path.join(self.diretorio, "checkpoint")
+        descritor = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(descritor).st_size < 2 * self._CHECKPOINT.size:
+                os.ftruncate(descritor, 2 * self._CHECKPOINT.size)
+            self._mapa_checkpoint = mmap.mmap(descritor, 0)
+        finally:
+            os.close(descritor)
+    
+    def _ler_checkpoint(self):
+        """Retorna (sequência, segmento, deslocamento) do slot válido mais recente."""
+        melhor = (0, None, 0)
+        for slot in range(2):
+            sequencia, segmento, deslocamento, crc = self._CHECKPOINT.unpack_from(
+                self._mapa_checkpoint, slot * self._CHECKPOINT.size)
+            dados = self._mapa_checkpoint[slot * self._CHECKPOINT.size:
+                                          slot * self._CHECKPOINT.size + self._CHECKPOINT.size - 4]
+            if sequencia > melhor[0] and zlib.crc32(dados) == crc:
+                melhor = (sequencia, segmento, deslocamento)
+        return melhor
+    
+    def _gravar_checkpoint(self, forcar=False):
+        """Grava a posição de leitura no slot mais antigo dos dois."""
+        self._sequencia += 1
+        slot = self._sequencia % 2
+        dados = struct.pack("<QQQ", self._sequencia, self._segmento_leitura, self._posicao_leitura)
+        self._mapa_checkpoint[slot * self._CHECKPOINT.size:(slot + 1) * self._CHECKPOINT.size] = \
+            dados + struct.pack("<I", zlib.crc32(dados))
+        if forcar:
+            self._mapa_checkpoint.flush()
+    
+    # ----- recuperação -----
+    
+    def _percorrer(self, mapa, posicao):
+        """
+        Percorre os registros válidos de um segmento a partir da posição e
+        retorna (quantidade, posição logo após o último registro válido).
+        """
+        quantidade = 0
+        limite = len(mapa) - self._REGISTRO.size
+        while posicao <= limite:
+            tamanho, crc = self._REGISTRO.unpack_from(mapa, posicao)
+            inicio = posicao + self._REGISTRO.size
+            if (tamanho == 0 and crc == 0) or inicio + tamanho > len(mapa):
+                break
+            if self._crc(mapa[inicio:inicio + tamanho], tamanho) != crc:
+                break
+            quantidade += 1
+            posicao = inicio + tamanho
+        return quantidade, posicao
+    
+    @staticmethod
+    def _crc(dados, tamanho):
+        # O tamanho entra no CRC, de modo que um cabeçalho zerado nunca é válido
+        return zlib.crc32(dados, zlib.crc32(struct.pack("<I", tamanho)))
+    
+    def _recuperar(self):
+        """Reconstrói as posições de leitura e escrita a partir dos arquivos."""
+        self._sequencia, segmento, deslocamento = self._ler_checkpoint()
+        if segmento is None:
+            segmento = 0
+        segmentos = self._segmentos()
+        
+        # Segmentos anteriores ao do checkpoint já foram consumidos; sobram no
+        # disco se o processo parou entre gravar o checkpoint e apagá-los
+        consumidos = [numero for numero in segmentos if numero < segmento]
+        for numero in consumidos:
+            os.remove(self._caminho(numero))
+        segmentos = segmentos[len(consumidos):]
+        
+        if not segmentos:
+            # Fila nova, ou o segmento apontado pelo checkpoint não chegou ao disco
+            self._mapear(segmento, self.tamanho_segmento).close()
+            segmentos.append(segmento)
+            deslocamento = 0
+            self._sincronizar_diretorio()
+        elif consumidos:
+            self._sincronizar_diretorio()
+        if segmento < segmentos[0]:
+            segmento, deslocamento = segmentos[0], 0
+        
+        self._segmento_leitura = segmento
+        self._posicao_leitura = deslocamento
+        self._segmento_escrita = segmentos[-1]
+        self._quantidade = 0
+        
+        for numero in segmentos:
+            if numero < segmento:
+                continue
+            mapa = self._mapear(numero)
+            inicio = deslocamento if numero == segmento else 0
+            quantidade, fim = self._percorrer(mapa, inicio)
+            fim = max(fim, inicio)
+            self._quantidade += quantidade
+            
+            # O que vier depois do último registro válido é resto de uma
+            # escrita interrompida e não pode ser confundido com registros
+            if numero == self._segmento_escrita:
+                resto = mapa[fim:]
+                if resto.count(0) != len(resto):
+                    mapa[fim:] = bytes(len(resto))
+                self._mapa_escrita = mapa
+                self._posicao_escrita = fim
+            else:
+                if fim + self._REGISTRO.size <= len(mapa):
+                    self._REGISTRO.pack_into(mapa, fim, 0, 0)
+                mapa.close()
+        
+        self._sincronizado_ate = 0
+        self._sincronizar_escrita()
+        if self._segmento_leitura == self._segmento_escrita:
+            self._mapa_leitura = self._mapa_escrita
+        else:
+            self._mapa_leitura = self._mapear(self._segmento_leitura)
+        self._gravar_checkpoint(forcar=True)
+    
+    # ----- operações da fila -----
+    
+    def esta_vazia(self):
+        """Verifica se a fila está vazia."""
+        return self._quantidade == 0
+    
+    def tamanho(self):
+        """Retorna o número de itens na fila."""
+        return self._quantidade
+    
+    def enfileirar(self, item):
+        """Adiciona um item ao final da fila, gravando-o no segmento atual."""
+        dados = self.serializar(item)
+        tamanho = len(dados)
+        necessario = self._REGISTRO.size + tamanho
+        
+        if self._posicao_escrita + necessario > len(self._mapa_escrita):
+            self._novo_segmento(necessario)
+        
+        posicao = self._posicao_escrita
+        inicio = posicao + self._REGISTRO.size
+        self._mapa_escrita[inicio:inicio + tamanho] = dados
+        # O cabeçalho, gravado por último, é o que torna o registro válido
+        self._REGISTRO.pack_into(self._mapa_escrita, posicao, tamanho, self._crc(dados, tamanho))
+        self._posicao_escrita = inicio + tamanho
+        self._quantidade += 1
+        self._registrar_operacao()
+    
+    def _novo_segmento(self, necessario):
+        """Fecha o segmento de escrita atual e começa o próximo."""
+        self._sincronizar_escrita()
+        if self._mapa_escrita is not self._mapa_leitura:
+            self._mapa_escrita.close()
+        
+        self._segmento_escrita += 1
+        self._mapa_escrita = self._mapear(self._segmento_escrita,
+                                          max(self.tamanho_segmento, necessario + self._REGISTRO.size))
+        self._sincronizar_diretorio()
+        self._posicao_escrita = 0
+        self._sincronizado_ate = 0
+    
+    def _proximo_registro(self):
+        """
+        Retorna (dados, posição seguinte) do próximo registro, passando para
+        o segmento seguinte quando o atual termina. A fila não pode estar vazia.
+        """
+        while True:
+            registro = self._ler_registro(self._mapa_leitura, self._posicao_leitura)
+            if registro is not None:
+                return registro
+            self._avancar_segmento_leitura()
+    
+    def _ler_registro(self, mapa, posicao):
+        """Retorna (dados, posição seguinte) do registro na posição, ou None no fim do segmento."""
+        if posicao + self._REGISTRO.size <= len(mapa):
+            tamanho, crc = self._REGISTRO.unpack_from(mapa, posicao)
+            if tamanho or crc:
+                inicio = posicao + self._REGISTRO.size
+                return mapa[inicio:inicio + tamanho], inicio + tamanho
+        return None
+    
+    def _avancar_segmento_leitura(self):
+        """Passa a ler o próximo segmento e apaga o que acabou de ser consumido."""
+        consumido = self._segmento_leitura
+        self._segmento_leitura += 1
+        self._posicao_leitura = 0
+        # O checkpoint precisa apontar para o novo segmento antes de apagar o antigo
+        self._gravar_checkpoint(forcar=True)
+        
+        self._mapa_leitura.close()
+        if self._segmento_leitura == self._segmento_escrita:
+            self._mapa_leitura = self._mapa_escrita
+        else:
+            self._mapa_leitura = self._mapear(self._segmento_leitura)
+        os.remove(self._caminho(consumido))
+        self._sincronizar_diretorio()
+    
+    def desenfileirar(self):
+        """Remove e retorna o item do início da fila."""
+        if self._quantidade == 0:
+            raise IndexError("Não é possível desenfileirar de uma fila vazia")
+        
+        dados, posicao = self._proximo_registro()
+        # Desserializa antes de avançar: se falhar, o item continua na fila
+        item = self.desserializar(dados)
+        self._posicao_leitura = posicao
+        self._quantidade -= 1
+        self._gravar_checkpoint()
+        self._registrar_operacao()
+        return item
+    
+    def frente(self):
+        """Retorna o item do início da fila sem removê-lo nem alterar o disco."""
+        if self._quantidade == 0:
+            raise IndexError("A fila está vazia")
+        
+        numero = self._segmento_leitura
+        registro = self._ler_registro(self._mapa_leitura, self._posicao_leitura)
+        while registro is None:
+            # Segmento de leitura esgotado: espia os seguintes sem apagá-lo
+            numero += 1
+            if numero == self._segmento_escrita:
+                registro = self._ler_registro(self._mapa_escrita, 0)
+            else:
+                mapa = self._mapear(numero)
+                try:
+                    registro = self._ler_registro(mapa, 0)
+                finally:
+                    mapa.close()
+        return self.desserializar(registro[0])
+    
+    # ----- durabilidade -----
+    
+    def _registrar_operacao(self):
+        """Aplica a política de sincronização após uma operação."""
+        if self.sincronizacao == "nunca":
+            return
+        self._pendentes += 1
+        if (self.sincronizacao == "sempre" or self._pendentes >= self.lote
+                or time.monotonic() - self._ultima_sincronizacao >= self.intervalo):
+            self.sincronizar()
+    
+    def _sincronizar_escrita(self):
+        """Força para o disco as páginas do segmento de escrita ainda não sincronizadas."""
+        if self._posicao_escrita == self._sincronizado_ate:
+            return
+        inicio = self._sincronizado_ate - self._sincronizado_ate % mmap.PAGESIZE
+        self._mapa_escrita.flush(inicio, self._posicao_escrita - inicio)
+        self._sincronizado_ate = self._posicao_escrita
+    
+    def sincronizar(self):
+        """Força para o disco os itens enfileirados e a posição de leitura."""
+        self._sincronizar_escrita()
+        self._mapa_checkpoint.flush()
+        self._pendentes = 0
+        self._ultima_sincronizacao = time.monotonic()
+    
+    def fechar(self):
+        """Sincroniza e libera os arquivos da fila."""
+        self.sincronizar()
+        if self._mapa_leitura is not self._mapa_escrita:
+            self._mapa_leitura.close()
+        self._mapa_escrita.close()
+        self._mapa_checkpoint.close()
+    
+    def __str__(self):
+        """Retorna uma representação em string da fila."""
+        return f"FilaPersistente('{self.diretorio}', {self._quantidade} itens)"
+
+
+def comparar_desempenho(total=20_000, tamanho_item=100):
+    """
+    Mede a vazão de enfileirar e desenfileirar `total` itens com cada
+    política de sincronização, mostrando o custo da durabilidade.
+    """
+    item = b"x" * tamanho_item
+    for politica in FilaPersistente.POLITICAS:
+        with tempfile.TemporaryDirectory() as diretorio:
+            fila = FilaPersistente(diretorio, tamanho_segmento=1 << 20, sincronizacao=politica)
+            
+            tempo_inicio = time.perf_counter()
+            for _ in range(total):
+                fila.enfileirar(item)
+            tempo_enfileirar = time.perf_counter() - tempo_inicio
+            
+            tempo_inicio = time.perf_counter()
+            while not fila.esta_vazia():
+                fila.desenfileirar()
+            tempo_desenfileirar = time.perf_counter() - tempo_inicio
+            fila.fechar()
+        
+        print(f"  {politica:<7} enfileirar: {total / tempo_enfileirar:12,.0f} itens/s"
+              f"   desenfileirar: {total / tempo_desenfileirar:12,.0f} itens/s")
+
+
+# Demonstração de uso
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as diretorio:
+        print("=== Fila persistente ===")
+        fila = FilaPersistente(diretorio, tamanho_segmento=256)
+        for i in range(1, 11):
+            fila.enfileirar({"tarefa": i})
+        print(f"Fila após enfileirar 10 itens: {fila}")
+        print(f"Segmentos em disco: {len(fila._segmentos())}")
+        
+        print(f"Desenfileirados: {[fila.desenfileirar()['tarefa'] for _ in range(8)]}")
+        print(f"Segmentos em disco após consumir: {len(fila._segmentos())}")
+        fila.fechar()
+        
+        print("\nReabrindo a fila (simulando um reinício do processo)...")
+        fila = FilaPersistente(diretorio, tamanho_segmento=256)
+        print(f"Fila recuperada: {fila}")
+        print(f"Item na frente da fila: {fila.frente()}")
+        while not fila.esta_vazia():
+            print(f"Desenfileirado: {fila.desenfileirar()}")
+        fila.fechar()
+    
+    # A medição leva vários segundos e só roda com --comparar
+    if "--comparar" in sys.argv:
+        print("\nVazão por política de sincronização:\n")
+        comparar_desempenho()
@@ -0,0 +1,325 @@
+import functools
+import sys
+import time
+
+from lista_encadeada import ListaEncadeadaIndexada
+
+
+class _Entrada:
+    """Valor guardado no cache e os dados usados pelas políticas de remoção."""
+    __slots__ = ("valor", "tamanho", "expira", "balde")
+    
+    def __init__(self, valor, tamanho, expira):
+        self.valor = valor
+        self.tamanho = tamanho
+        self.expira = expira
+        self.balde = None
+
+
+class _Balde:
+    """Chaves com a mesma frequência de uso, ligadas aos baldes vizinhos."""
+    __slots__ = ("frequencia", "chaves", "anterior", "proximo")
+    
+    def __init__(self, frequencia):
+        self.frequencia = frequencia
+        self.chaves = ListaEncadeadaIndexada()
+        self.anterior = None
+        self.proximo = None
+
+
+class Cache:
+    """
+    Cache de chave e valor com limite de tamanho e política de remoção
+    configurável, montado sobre listas encadeadas indexadas.
+    
+    - "lru": remove a chave usada há mais tempo. As chaves ficam em uma
+      `ListaEncadeadaIndexada` na ordem de uso; cada acesso move a chave
+      para o final, e a vítima é sempre a cabeça.
+    - "lfu": remove a chave usada menos vezes (e, entre as empatadas, a
+      usada há mais tempo). Cada frequência tem seu próprio balde, uma
+      `ListaEncadeadaIndexada`, e um acesso apenas passa a chave do balde f
+      para o balde f + 1. Os baldes formam uma lista duplamente encadeada
+      em ordem de frequência: o balde f + 1, se existir, é o vizinho do
+      balde f, e o de menor frequência é sempre o primeiro, então tanto o
+      acesso quanto a escolha da vítima custam O(1).
+    
+    O limite pode ser em número de entradas (`maximo_entradas`), em bytes
+    (`maximo_bytes`, medidos com `tamanho_de`) ou ambos. Com `ttl`, cada
+    entrada expira `ttl` segundos após ser gravada; como todas têm o mesmo
+    prazo, basta uma lista em ordem de gravação para achar as vencidas.
+    """
+    POLITICAS = ("lru", "lfu")
+    
+    def __init__(self, politica="lru", maximo_entradas=None, maximo_bytes=None, ttl=None,
+                 tamanho_de=sys.getsizeof):
+        if politica not in self.POLITICAS:
+            raise ValueError(f"Política de cache desconhecida: {politica}")
+        self.politica = politica
+        self.maximo_entradas = maximo_entradas
+        self.maximo_bytes = maximo_bytes
+        self.ttl = ttl
+        self.tamanho_de = tamanho_de
+        
+        self._entradas = {}
+        self._ordem = ListaEncadeadaIndexada()     # LRU: ordem de uso
+        self._menor_balde = None                   # LFU: primeiro balde de frequência
+        self._validade = ListaEncadeadaIndexada()  # TTL: ordem de gravação
+        self.bytes_usados = 0
+        
+        self.acertos = 0
+        self.falhas = 0
+        self.despejos = 0
+        self.expirados = 0
+    
+    def tamanho(self):
+        """Retorna o número de entradas no cache."""
+        return len(self._entradas)
+    
+    def contem(self, chave):
+        """Verifica se a chave está no cache, sem contar como acesso."""
+        self._expirar()
+        return chave in self._entradas
+    
+    # ----- estruturas de cada política -----
+    
+    def _registrar(self, chave, entrada):
+        """Coloca uma chave nova nas estruturas da política."""
+        if self.politica == "lru":
+            self._ordem.adicionar_final(chave)
+        else:
+            balde = self._menor_balde
+            if balde is None or balde.frequencia != 1:
+                balde = self._novo_balde(1, None)
+            balde.chaves.adicionar_final(chave)
+            entrada.balde = balde
+        if self.ttl is not None:
+            self._validade.adicionar_final(chave)
+    
+    def _novo_balde(self, frequencia, anterior):
+        """Cria um balde logo após `anterior` ou, se ele for None, no início da lista."""
+        balde = _Balde(frequencia)
+        proximo = self._menor_balde if anterior is None else anterior.proximo
+        balde.anterior = anterior
+        balde.proximo = proximo
+        if anterior is None:
+            self._menor_balde = balde
+        else:
+            anterior.proximo = balde
+        if proximo is not None:
+            proximo.anterior = balde
+        return balde
+    
+    def _tirar_do_balde(self, chave, balde):
+        """Tira a chave do balde, desligando o balde da lista se ele esvaziar."""
+        balde.chaves.remover_valor(chave)
+        if balde.chaves.esta_vazia():
+            if balde.anterior is None:
+                self._menor_balde = balde.proximo
+            else:
+                balde.anterior.proximo = balde.proximo
+            if balde.proximo is not None:
+                balde.proximo.anterior = balde.anterior
+    
+    def _registrar_acesso(self, chave, entrada):
+        """Atualiza a posição da chave na política após um acesso, em O(1)."""
+        if self.politica == "lru":
+            self._ordem.mover_para_final(chave)
+            return
+        
+        balde = entrada.balde
+        seguinte = balde.proximo
+        if seguinte is None or seguinte.frequencia != balde.frequencia + 1:
+            seguinte = self._novo_balde(balde.frequencia + 1, balde)
+        # O balde seguinte já existe antes de o atual poder ser desligado
+        self._tirar_do_balde(chave, balde)
+        seguinte.chaves.adicionar_final(chave)
+        entrada.balde = seguinte
+    
+    def _vitima(self):
+        """Chave a ser removida segundo a política."""
+        if self.politica == "lru":
+            return self._ordem.cabeca.valor
+        return self._menor_balde.chaves.cabeca.valor
+    
+    def _descartar(self, chave):
+        """Remove uma chave de todas as estruturas do cache."""
+        entrada = self._entradas.pop(chave)
+        self.bytes_usados -= entrada.tamanho
+        
+        if self.politica == "lru":
+            self._ordem.remover_valor(chave)
+        else:
+            self._tirar_do_balde(chave, entrada.balde)
+        
+        if self.ttl is not None:
+            self._validade.remover_valor(chave)
+        return entrada
+    
+    def _expirar(self):
+        """Descarta as entradas cujo prazo já venceu, das mais antigas para as mais novas."""
+        if self.ttl is None:
+            return
+        agora = time.monotonic()
+        while self._validade.cabeca is not None:
+            chave = self._validade.cabeca.valor
+            if self._entradas[chave].expira > agora:
+                break
+            self._descartar(chave)
+            self.expirados += 1
+    
+    def _acima_do_limite(self, bytes_extras=0, entradas_extras=0):
+        if self.maximo_entradas is not None and \
+                len(self._entradas) + entradas_extras > self.maximo_entradas:
+            return True
+        return self.maximo_bytes is not None and self.bytes_usados + bytes_extras > self.maximo_bytes
+    
+    # ----- operações do cache -----
+    
+    def obter(self, chave, padrao=None):
+        """Retorna o valor guardado para a chave, ou `padrao` se ela não estiver no cache."""
+        self._expirar()
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            self.falhas += 1
+            return padrao
+        
+        self.acertos += 1
+        self._registrar_acesso(chave, entrada)
+        return entrada.valor
+    
+    def inserir(self, chave, valor):
+        """
+        Grava o valor para a chave, removendo outras entradas segundo a
+        política se o limite for ultrapassado. Um valor maior que o limite
+        de bytes inteiro não é guardado.
+        """
+        self._expirar()
+        tamanho = self.tamanho_de(valor) if self.maximo_bytes is not None else 0
+        if self.maximo_bytes is not None and tamanho > self.maximo_bytes:
+            if chave in self._entradas:
+                self._descartar(chave)
+            return
+        
+        expira = None if self.ttl is None else time.monotonic() + self.ttl
+        entrada = self._entradas.get(chave)
+        
+        if entrada is not None:
+            # Atualização: conta como um acesso e renova o prazo
+            self.bytes_usados += tamanho - entrada.tamanho
+            entrada.valor = valor
+            entrada.tamanho = tamanho
+            entrada.expira = expira
+            self._registrar_acesso(chave, entrada)
+            if self.ttl is not None:
+                self._validade.mover_para_final(chave)
+            while self._acima_do_limite():
+                self._descartar(self._vitima())
+                self.despejos += 1
+            return
+        
+        # Abre espaço antes de inserir, para que a nova chave não seja a vítima
+        while self._entradas and self._acima_do_limite(tamanho, 1):
+            self._descartar(self._vitima())
+            self.despejos += 1
+        
+        self._entradas[chave] = _Entrada(valor, tamanho, expira)
+        self.bytes_usados += tamanho
+        self._registrar(chave, self._entradas[chave])
+    
+    def remover(self, chave):
+        """Remove a chave do cache. Retorna False se ela não estava no cache."""
+        self._expirar()
+        if chave not in self._entradas:
+            return False
+        self._descartar(chave)
+        return True
+    
+    def limpar(self):
+        """Remove todas as entradas, mantendo os contadores."""
+        for chave in list(self._entradas):
+            self._descartar(chave)
+    
+    def estatisticas(self):
+        """Retorna um dicionário com os contadores e a ocupação do cache."""
+        consultas = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acertos": self.acertos / consultas if consultas else 0.0,
+            "despejos": self.despejos,
+            "expirados": self.expirados,
+            "entradas": len(self._entradas),
+            "bytes": self.bytes_usados,
+        }
+
+
+_AUSENTE = object()
+
+
+def memoizar(cache=None, politica="lru", maximo_entradas=128, maximo_bytes=None, ttl=None):
+    """
+    Decorador que guarda em um `Cache` os resultados de uma função, usando
+    os argumentos (que precisam ser hasheáveis) como chave. Sem `cache`, cria
+    um novo com as opções informadas. O cache fica acessível pelo atributo
+    `cache` da função decorada, por exemplo:
+    
+        verificar = memoizar(maximo_entradas=1024)(verificar_expressao)
+        avaliar = memoizar(politica="lfu", ttl=60)(avaliar_expressao_posfixa)
+    """
+    if cache is None:
+        cache = Cache(politica, maximo_entradas, maximo_bytes, ttl)
+    
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def funcao_com_cache(*args, **kwargs):
+            chave = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            resultado = cache.obter(chave, _AUSENTE)
+            if resultado is _AUSENTE:
+                resultado = funcao(*args, **kwargs)
+                cache.inserir(chave, resultado)
+            return resultado
+        
+        funcao_com_cache.cache = cache
+        return funcao_com_cache
+    return decorador
+
+
+# Demonstração de uso
+if __name__ == "__main__":
+    print("=== Cache LRU com 3 entradas ===")
+    cache = Cache("lru", maximo_entradas=3)
+    for chave in "abc":
+        cache.inserir(chave, chave.upper())
+    cache.obter("a")
+    cache.inserir("d", "D")
+    print(f"Após usar 'a' e inserir 'd', 'b' foi removido? {not cache.contem('b')}")
+    print(f"Estatísticas: {cache.estatisticas()}")
+    
+    print("\n=== Cache LFU com 3 entradas ===")
+    cache = Cache("lfu", maximo_entradas=3)
+    for chave in "abc":
+        cache.inserir(chave, chave.upper())
+    for chave in "aabcc":
+        cache.obter(chave)
+    cache.inserir("d", "D")
+    print(f"Após inserir 'd', a chave menos usada ('b') foi removida? {not cache.contem('b')}")
+    
+    print("\n=== Cache limitado em bytes e com prazo de validade ===")
+    cache = Cache("lru", maximo_bytes=300, ttl=0.05)
+    cache.inserir("pequeno", "x" * 10)
+    cache.inserir("medio", "x" * 150)
+    cache.inserir("enorme", "x" * 500)
+    print(f"Entradas: {cache.tamanho()}, bytes usados: {cache.bytes_usados}")
+    print(f"O valor maior que o limite foi guardado? {cache.contem('enorme')}")
+    time.sleep(0.06)
+    print(f"Depois do prazo: {cache.obter('pequeno', 'expirado')}")
+    print(f"Estatísticas: {cache.estatisticas()}")
+    
+    print("\n=== Decorador ===")
+    
+    @memoizar(maximo_entradas=64)
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+    
+    print(f"fibonacci(60) = {fibonacci(60)}")
+    print(f"Estatísticas: {fibonacci.cache.estatisticas()}")
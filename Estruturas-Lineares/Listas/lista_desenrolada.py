@@ -0,0 +1,297 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from lista_encadeada import ListaEncadeada
+
+
+class NoBloco:
+    """
+    Nó de uma lista desenrolada (unrolled linked list).
+    Em vez de um único valor, guarda um bloco com até `tamanho_bloco`
+    valores consecutivos da lista.
+    """
+    __slots__ = ("valores", "proximo")
+    
+    def __init__(self, valores=None):
+        self.valores = valores if valores is not None else []
+        self.proximo = None
+
+
+class ListaDesenrolada:
+    """
+    Lista encadeada em que cada nó guarda um bloco de até `tamanho_bloco`
+    valores.
+    
+    Oferece os mesmos métodos de `ListaEncadeada`. Percorrer a lista custa
+    um salto de ponteiro a cada bloco, e não a cada elemento, e o custo fixo
+    de um nó é dividido entre os valores do bloco. Um bloco cheio é dividido
+    ao meio em uma inserção; um bloco que fica com menos da metade da
+    capacidade após uma remoção é completado com valores do bloco seguinte,
+    ou fundido com ele se os dois couberem em um só.
+    """
+    def __init__(self, tamanho_bloco=64):
+        if tamanho_bloco < 2:
+            raise ValueError("O tamanho do bloco deve ser pelo menos 2")
+        self.tamanho_bloco = tamanho_bloco
+        self.cabeca = None
+        self.cauda = None
+        self.tamanho = 0
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.cabeca is None
+    
+    def tamanho_lista(self):
+        """Retorna o tamanho da lista."""
+        return self.tamanho
+    
+    def _localizar(self, posicao):
+        """
+        Retorna (bloco anterior, bloco, índice no bloco) de uma posição
+        válida, saltando um bloco inteiro por vez.
+        """
+        anterior, no = None, self.cabeca
+        while posicao >= len(no.valores):
+            posicao -= len(no.valores)
+            anterior, no = no, no.proximo
+        return anterior, no, posicao
+    
+    def _dividir(self, no):
+        """Divide um bloco cheio ao meio, ligando a segunda metade logo depois dele."""
+        meio = len(no.valores) // 2
+        novo_no = NoBloco(no.valores[meio:])
+        del no.valores[meio:]
+        novo_no.proximo = no.proximo
+        no.proximo = novo_no
+        if no is self.cauda:
+            self.cauda = novo_no
+    
+    def adicionar_inicio(self, valor):
+        """Adiciona um elemento no início da lista."""
+        self.adicionar_posicao(valor, 0)
+    
+    def adicionar_final(self, valor):
+        """Adiciona um elemento no final da lista."""
+        if self.cauda is None:
+            self.cabeca = self.cauda = NoBloco()
+        elif len(self.cauda.valores) == self.tamanho_bloco:
+            # Ao crescer pelo final, começa um bloco novo em vez de dividir o último
+            self.cauda.proximo = NoBloco()
+            self.cauda = self.cauda.proximo
+        
+        self.cauda.valores.append(valor)
+        self.tamanho += 1
+    
+    def adicionar_posicao(self, valor, posicao):
+        """Adiciona um elemento em uma posição específica."""
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição fora dos limites")
+        
+        if posicao == self.tamanho:
+            return self.adicionar_final(valor)
+        
+        _, no, indice = self._localizar(posicao)
+        if len(no.valores) == self.tamanho_bloco:
+            self._dividir(no)
+            if indice > len(no.valores):
+                indice -= len(no.valores)
+                no = no.proximo
+        
+        no.valores.insert(indice, valor)
+        self.tamanho += 1
+    
+    def _remover_do_bloco(self, anterior, no, indice):
+        """Remove o valor de um bloco e reequilibra o bloco se ele ficar pequeno demais."""
+        valor = no.valores.pop(indice)
+        self.tamanho -= 1
+        minimo = self.tamanho_bloco // 2
+        proximo = no.proximo
+        
+        if not no.valores:
+            # Bloco vazio: sai da lista
+            if anterior is None:
+                self.cabeca = proximo
+            else:
+                anterior.proximo = proximo
+            if no is self.cauda:
+                self.cauda = anterior
+        elif len(no.valores) < minimo and proximo is not None:
+            if len(no.valores) + len(proximo.valores) <= self.tamanho_bloco:
+                # Os dois blocos cabem em um só: funde o seguinte neste
+                no.valores.extend(proximo.valores)
+                no.proximo = proximo.proximo
+                if proximo is self.cauda:
+                    self.cauda = no
+            else:
+                # Completa este bloco com valores do início do seguinte
+                falta = minimo - len(no.valores)
+                no.valores.extend(proximo.valores[:falta])
+                del proximo.valores[:falta]
+        
+        return valor
+    
+    def remover_posicao(self, posicao):
+        """Remove o elemento de uma posição e retorna seu valor."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição fora dos limites")
+        return self._remover_do_bloco(*self._localizar(posicao))
+    
+    def remover_inicio(self):
+        """Remove o elemento do início da lista e retorna seu valor."""
+        if self.cabeca is None:
+            raise ValueError("Não é possível remover de uma lista vazia")
+        return self._remover_do_bloco(None, self.cabeca, 0)
+    
+    def remover_final(self):
+        """Remove o elemento do final da lista e retorna seu valor."""
+        if self.cabeca is None:
+            raise ValueError("Não é possível remover de uma lista vazia")
+        
+        # Só é preciso procurar o bloco anterior se o último bloco for esvaziar
+        if len(self.cauda.valores) > 1:
+            self.tamanho -= 1
+            return self.cauda.valores.pop()
+        return self.remover_posicao(self.tamanho - 1)
+    
+    def remover_valor(self, valor):
+        """Remove a primeira ocorrência de um valor específico."""
+        anterior, no = None, self.cabeca
+        
+        while no:
+            if valor in no.valores:
+                self._remover_do_bloco(anterior, no, no.valores.index(valor))
+                return True
+            anterior, no = no, no.proximo
+        
+        return False
+    
+    def buscar(self, valor):
+        """
+        Busca um valor e retorna sua posição na lista.
+        Retorna -1 se o valor não for encontrado.
+        """
+        no = self.cabeca
+        posicao = 0
+        
+        while no:
+            # A busca dentro do bloco é feita pela própria lista do Python
+            if valor in no.valores:
+                return posicao + no.valores.index(valor)
+            posicao += len(no.valores)
+            no = no.proximo
+        
+        return -1
+    
+    def obter(self, posicao):
+        """Retorna o valor na posição especificada."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição fora dos limites")
+        
+        _, no, indice = self._localizar(posicao)
+        return no.valores[indice]
+    
+    def imprimir(self):
+        """Retorna uma representação em string da lista."""
+        valores = []
+        no = self.cabeca
+        
+        while no:
+            valores.extend(map(str, no.valores))
+            no = no.proximo
+        
+        return " -> ".join(valores) if valores else "Lista vazia"
+
+
+def _medir_memoria(construir):
+    """Retorna os bytes alocados (medidos com tracemalloc) por `construir()`."""
+    tracemalloc.start()
+    estrutura = construir()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del estrutura
+    return memoria
+
+
+def escolher_tamanho_bloco(tamanho=10**5, blocos=(4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096),
+                           operacoes=1000):
+    """
+    Mede, para cada tamanho de bloco, o tempo de uma varredura completa
+    (busca de um valor ausente), o tempo médio de inserção em posições
+    aleatórias e a memória por elemento, comparando com `ListaEncadeada`.
+    Ao final, indica o melhor tamanho de bloco para cada critério.
+    """
+    posicoes = [random.randrange(tamanho) for _ in range(operacoes)]
+    print(f"Lista com {tamanho} elementos\n")
+    print(f"{'Estrutura':<24}{'Varredura (ms)':>16}{'Inserção (µs)':>16}{'Bytes/elem.':>14}")
+    
+    def construir(classe, *argumentos):
+        lista = classe(*argumentos)
+        for i in range(tamanho):
+            lista.adicionar_final(i)
+        return lista
+    
+    resultados = {}
+    for tamanho_bloco in (None,) + tuple(blocos):
+        argumentos = () if tamanho_bloco is None else (tamanho_bloco,)
+        classe = ListaEncadeada if tamanho_bloco is None else ListaDesenrolada
+        lista = construir(classe, *argumentos)
+        
+        tempo_inicio = time.perf_counter()
+        lista.buscar(-1)
+        varredura = time.perf_counter() - tempo_inicio
+        
+        tempo_inicio = time.perf_counter()
+        for posicao in posicoes:
+            lista.adicionar_posicao(-1, posicao)
+        insercao = (time.perf_counter() - tempo_inicio) / operacoes
+        del lista
+        
+        memoria = _medir_memoria(lambda: construir(classe, *argumentos)) / tamanho
+        nome = "ListaEncadeada" if tamanho_bloco is None else f"ListaDesenrolada(k={tamanho_bloco})"
+        print(f"{nome:<24}{varredura * 1e3:>16.2f}{insercao * 1e6:>16.2f}{memoria:>14.1f}")
+        if tamanho_bloco is not None:
+            resultados[tamanho_bloco] = (varredura, insercao, memoria)
+    
+    print()
+    for indice, criterio in enumerate(("varredura", "inserção", "memória")):
+        melhor = min(resultados, key=lambda k: resultados[k][indice])
+        print(f"Melhor k para {criterio}: {melhor}")
+
+
+# Demonstração de uso
+if __name__ == "__main__":
+    lista = ListaDesenrolada(tamanho_bloco=4)
+    
+    print("Inserindo elementos no final:")
+    for i in range(1, 11):
+        lista.adicionar_final(i * 10)
+    print(f"Lista: {lista.imprimir()}")
+    
+    def blocos(lista):
+        no, resultado = lista.cabeca, []
+        while no:
+            resultado.append(no.valores)
+            no = no.proximo
+        return resultado
+    
+    print(f"Blocos: {blocos(lista)}")
+    
+    print("\nInserindo 25 na posição 2 (o primeiro bloco, cheio, é dividido):")
+    lista.adicionar_posicao(25, 2)
+    print(f"Blocos: {blocos(lista)}")
+    
+    print("\nRemovendo 10 e 20 (o bloco fica pequeno e é fundido com o seguinte):")
+    lista.remover_valor(10)
+    lista.remover_valor(20)
+    print(f"Blocos: {blocos(lista)}")
+    
+    print(f"\nPosição do valor 70: {lista.buscar(70)}")
+    print(f"Valor na posição 5: {lista.obter(5)}")
+    print(f"Tamanho da lista: {lista.tamanho_lista()}")
+    
+    # A medição leva vários segundos e só roda com --comparar
+    if "--comparar" in sys.argv:
+        print("\nEscolha do tamanho de bloco:\n")
+        escolher_tamanho_bloco()
@@ -1,19 +1,55 @@
+import operator
+import random
+import sys
+import time
+from collections import deque
+from itertools import islice
+
+# Valores de cada extremidade que imprimir mostra em listas longas
+ITENS_EXIBIDOS = 10
+
+
 class No:
     """
     Classe que representa um nó em uma lista encadeada.
     Cada nó contém um valor e uma referência para o próximo nó.
     """
+    __slots__ = ("valor", "proximo")
+    
     def __init__(self, valor):
         self.valor = valor
         self.proximo = None
 
+class NoDuplo(No):
+    """
+    Nó de uma lista duplamente encadeada.
+    Além do próximo nó, guarda uma referência para o nó anterior.
+    """
+    __slots__ = ("anterior",)
+    
+    def __init__(self, valor):
+        # Atribuições diretas, sem super(), porque nós são criados aos milhões
+        self.valor = valor
+        self.proximo = None
+        self.anterior = None
+
 class ListaEncadeada:
     """
     Implementação de uma lista encadeada simples.
+    
+    A lista mantém referências para o primeiro (cabeça) e o último (cauda) nó,
+    de modo que inserir no final custa O(1). Com `duplamente_encadeada=True`
+    os nós também apontam para o anterior, o que torna O(1) a remoção no
+    final e a remoção de um nó conhecido, e permite percorrer a lista a
+    partir da extremidade mais próxima.
     """
-    def __init__(self):
+    def __init__(self, duplamente_encadeada=False):
         self.cabeca = None
+        self.cauda = None
         self.tamanho = 0
+        self.duplamente_encadeada = duplamente_encadeada
+        self._classe_no = NoDuplo if duplamente_encadeada else No
+        self._versao = 0  # Muda a cada alteração, para detectar iterações invalidadas
     
     def esta_vazia(self):
         """Verifica se a lista está vazia."""
@@ -24,28 +60,37 @@ class ListaEncadeada:
         return self.tamanho
     
     def adicionar_inicio(self, valor):
-        """Adiciona um elemento no início da lista."""
-        novo_no = No(valor)
+        """Adiciona um elemento no início da lista e retorna o nó criado."""
+        novo_no = self._classe_no(valor)
         novo_no.proximo = self.cabeca
+        
+        if self.cabeca is None:
+            self.cauda = novo_no
+        elif self.duplamente_encadeada:
+            self.cabeca.anterior = novo_no
+        
         self.cabeca = novo_no
         self.tamanho += 1
+        self._versao += 1
+        return novo_no
     
     def adicionar_final(self, valor):
-        """Adiciona um elemento no final da lista."""
-        novo_no = No(valor)
+        """Adiciona um elemento no final da lista e retorna o nó criado."""
+        novo_no = self._classe_no(valor)
         
         # Se a lista estiver vazia, o novo nó será a cabeça
-        if self.cabeca is None:
+        if self.cauda is None:
             self.cabeca = novo_no
         else:
-            # Percorre até o último nó
-            atual = self.cabeca
-            while atual.proximo:
-                atual = atual.proximo
-            # Adiciona o novo nó após o último
-            atual.proximo = novo_no
+            # A cauda evita percorrer a lista até o último nó
+            self.cauda.proximo = novo_no
+            if self.duplamente_encadeada:
+                novo_no.anterior = self.cauda
         
+        self.cauda = novo_no
         self.tamanho += 1
+        self._versao += 1
+        return novo_no
     
     def adicionar_posicao(self, valor, posicao):
         """Adiciona um elemento em uma posição específica."""
@@ -55,27 +100,67 @@ class ListaEncadeada:
         
         # Caso especial: adicionar no início
         if posicao == 0:
-            self.adicionar_inicio(valor)
-            return
+            return self.adicionar_inicio(valor)
         
         # Caso especial: adicionar no final
         if posicao == self.tamanho:
-            self.adicionar_final(valor)
-            return
-        
-        # Caso geral: adicionar no meio
-        novo_no = No(valor)
-        atual = self.cabeca
+            return self.adicionar_final(valor)
         
-        # Percorre até a posição anterior
-        for _ in range(posicao - 1):
-            atual = atual.proximo
+        # Caso geral: adicionar no meio, logo após o nó da posição anterior
+        novo_no = self._classe_no(valor)
+        atual = self._no_na_posicao(posicao - 1)
         
         # Insere o novo nó entre o atual e o próximo
         novo_no.proximo = atual.proximo
         atual.proximo = novo_no
+        if self.duplamente_encadeada:
+            novo_no.anterior = atual
+            novo_no.proximo.anterior = novo_no
         
         self.tamanho += 1
+        self._versao += 1
+        return novo_no
+    
+    @classmethod
+    def de_iteravel(cls, iteravel, *args, **kwargs):
+        """
+        Cria uma lista com os valores de um iterável, em O(n). Os demais
+        argumentos são repassados ao construtor da lista.
+        """
+        lista = cls(*args, **kwargs)
+        lista.estender(iteravel)
+        return lista
+    
+    def estender(self, iteravel):
+        """
+        Adiciona ao final da lista os valores de um iterável, em uma única
+        passagem e sem criar uma lista intermediária, de modo que geradores
+        grandes podem ser consumidos aos poucos.
+        """
+        if iteravel is self:
+            iteravel = self.para_lista()
+        
+        self._versao += 1
+        classe_no = self._classe_no
+        duplamente_encadeada = self.duplamente_encadeada
+        ultimo = self.cauda
+        adicionados = 0
+        
+        try:
+            for valor in iteravel:
+                novo_no = classe_no(valor)
+                if ultimo is None:
+                    self.cabeca = novo_no
+                else:
+                    ultimo.proximo = novo_no
+                    if duplamente_encadeada:
+                        novo_no.anterior = ultimo
+                ultimo = novo_no
+                adicionados += 1
+        finally:
+            # Mesmo que o iterável falhe no meio, a lista fica consistente
+            self.cauda = ultimo
+            self.tamanho += adicionados
     
     def remover_inicio(self):
         """Remove o elemento do início da lista e retorna seu valor."""
@@ -84,34 +169,83 @@ class ListaEncadeada:
         
         valor = self.cabeca.valor
         self.cabeca = self.cabeca.proximo
+        
+        if self.cabeca is None:
+            self.cauda = None
+        elif self.duplamente_encadeada:
+            self.cabeca.anterior = None
+        
         self.tamanho -= 1
+        self._versao += 1
         return valor
     
     def remover_final(self):
-        """Remove o elemento do final da lista e retorna seu valor."""
+        """
+        Remove o elemento do final da lista e retorna seu valor.
+        Custa O(1) na lista duplamente encadeada e O(n) na simples, que
+        precisa percorrer a lista até o penúltimo nó.
+        """
         if self.cabeca is None:
             raise ValueError("Não é possível remover de uma lista vazia")
         
         # Caso especial: lista com apenas um elemento
-        if self.cabeca.proximo is None:
+        if self.cabeca is self.cauda:
             valor = self.cabeca.valor
             self.cabeca = None
+            self.cauda = None
             self.tamanho -= 1
+            self._versao += 1
             return valor
         
-        # Caso geral: mais de um elemento
-        atual = self.cabeca
+        valor = self.cauda.valor
         
-        # Percorre até o penúltimo nó
-        while atual.proximo.proximo:
-            atual = atual.proximo
+        if self.duplamente_encadeada:
+            # O nó anterior à cauda é conhecido diretamente
+            penultimo = self.cauda.anterior
+        else:
+            # Percorre até o penúltimo nó
+            penultimo = self.cabeca
+            while penultimo.proximo is not self.cauda:
+                penultimo = penultimo.proximo
         
         # Remove o último nó e retorna seu valor
-        valor = atual.proximo.valor
-        atual.proximo = None
+        penultimo.proximo = None
+        self.cauda = penultimo
         self.tamanho -= 1
+        self._versao += 1
         return valor
     
+    def remover_no(self, no):
+        """
+        Remove da lista um nó conhecido (por exemplo, o retornado por
+        `adicionar_final`) e retorna seu valor, em O(1).
+        Disponível apenas na lista duplamente encadeada; o nó deve pertencer
+        a esta lista. Lança ValueError para um nó que já foi removido.
+        """
+        if not self.duplamente_encadeada:
+            raise TypeError("remover_no requer uma lista duplamente encadeada")
+        
+        # Um nó removido fica sem vizinhos, mas só a cabeça e a cauda podem não ter
+        if (no.anterior is None and no is not self.cabeca) or \
+                (no.proximo is None and no is not self.cauda):
+            raise ValueError("O nó não pertence à lista")
+        
+        if no.anterior is None:
+            self.cabeca = no.proximo
+        else:
+            no.anterior.proximo = no.proximo
+        
+        if no.proximo is None:
+            self.cauda = no.anterior
+        else:
+            no.proximo.anterior = no.anterior
+        
+        no.anterior = None
+        no.proximo = None
+        self.tamanho -= 1
+        self._versao += 1
+        return no.valor
+    
     def remover_valor(self, valor):
         """Remove a primeira ocorrência de um valor específico."""
         if self.cabeca is None:
@@ -119,8 +253,7 @@ class ListaEncadeada:
         
         # Caso especial: remover o primeiro nó
         if self.cabeca.valor == valor:
-            self.cabeca = self.cabeca.proximo
-            self.tamanho -= 1
+            self.remover_inicio()
             return True
         
         # Caso geral: procurar o valor e remover
@@ -130,8 +263,14 @@ class ListaEncadeada:
         
         # Se encontrou o valor
         if atual.proximo:
-            atual.proximo = atual.proximo.proximo
+            removido = atual.proximo
+            atual.proximo = removido.proximo
+            if removido is self.cauda:
+                self.cauda = atual
+            elif self.duplamente_encadeada:
+                removido.proximo.anterior = atual
             self.tamanho -= 1
+            self._versao += 1
             return True
         
         return False
@@ -157,22 +296,540 @@ class ListaEncadeada:
         if posicao < 0 or posicao >= self.tamanho:
             raise IndexError("Posição fora dos limites")
         
+        return self._no_na_posicao(posicao).valor
+    
+    def _no_na_posicao(self, posicao):
+        """
+        Retorna o nó de uma posição válida.
+        Na lista duplamente encadeada, percorre a partir da extremidade mais
+        próxima; em qualquer modo, a última posição é obtida pela cauda.
+        """
+        if posicao == self.tamanho - 1:
+            return self.cauda
+        
+        if self.duplamente_encadeada and posicao > self.tamanho // 2:
+            atual = self.cauda
+            for _ in range(self.tamanho - 1 - posicao):
+                atual = atual.anterior
+            return atual
+        
         atual = self.cabeca
         for _ in range(posicao):
             atual = atual.proximo
+        return atual
+    
+    def _religar_anteriores(self):
+        """Acerta a cauda e, na lista duplamente encadeada, os ponteiros para o anterior."""
+        anterior = None
+        atual = self.cabeca
         
-        return atual.valor
+        while atual:
+            if self.duplamente_encadeada:
+                atual.anterior = anterior
+            anterior = atual
+            atual = atual.proximo
+        
+        self.cauda = anterior
     
-    def imprimir(self):
-        """Retorna uma representação em string da lista."""
-        valores = []
+    @staticmethod
+    def _comparador(decorado, reverso):
+        """
+        Retorna uma função que diz se o primeiro valor deve vir antes do
+        segundo. Com `decorado`, os valores são pares (chave, valor) criados
+        por `_decorar` e só a chave é comparada.
+        """
+        if not decorado:
+            return operator.gt if reverso else operator.lt
+        if reverso:
+            return lambda a, b: a[0] > b[0]
+        return lambda a, b: a[0] < b[0]
+    
+    def _decorar(self, chave):
+        """
+        Troca o valor de cada nó pelo par (chave(valor), valor), para que a
+        chave seja calculada uma só vez por nó, como em `sorted`. Se `chave`
+        falhar, nenhum nó é alterado.
+        """
+        chaves = [chave(valor) for valor in self]
+        atual = self.cabeca
+        for valor_chave in chaves:
+            atual.valor = (valor_chave, atual.valor)
+            atual = atual.proximo
+    
+    def _desdecorar(self):
+        """Devolve a cada nó o valor original guardado por `_decorar`."""
+        atual = self.cabeca
+        while atual:
+            atual.valor = atual.valor[1]
+            atual = atual.proximo
+    
+    @staticmethod
+    def _intercalar(esquerda, fim_esquerda, direita, fim_direita, vem_antes):
+        """
+        Intercala duas cadeias ordenadas de nós, dadas pelo primeiro e pelo
+        último nó de cada uma, religando apenas os ponteiros `proximo`, e
+        retorna o primeiro e o último nó do resultado. Em caso de empate, o
+        nó da esquerda vem primeiro (intercalação estável).
+        """
+        if vem_antes(direita.valor, esquerda.valor):
+            inicio = fim = direita
+            direita = direita.proximo
+        else:
+            inicio = fim = esquerda
+            esquerda = esquerda.proximo
+        
+        while esquerda and direita:
+            if vem_antes(direita.valor, esquerda.valor):
+                fim.proximo = direita
+                fim = direita
+                direita = direita.proximo
+            else:
+                fim.proximo = esquerda
+                fim = esquerda
+                esquerda = esquerda.proximo
+        
+        # O que sobrou de uma das cadeias já está ordenado e termina no fim conhecido dela
+        if esquerda:
+            fim.proximo = esquerda
+            return inicio, fim_esquerda
+        fim.proximo = direita
+        return inicio, fim_direita if direita else fim
+    
+    @staticmethod
+    def _cortar(no, quantidade):
+        """
+        Separa os primeiros `quantidade` nós da cadeia e retorna o último
+        nó separado e o início do restante.
+        """
+        for _ in range(quantidade - 1):
+            if no.proximo is None:
+                break
+            no = no.proximo
+        restante = no.proximo
+        no.proximo = None
+        return no, restante
+    
+    def ordenar(self, chave=None, reverso=False):
+        """
+        Ordena a lista no próprio lugar com merge sort de baixo para cima,
+        em O(n log n), sem criar nós: apenas os ponteiros são religados.
+        A ordenação é estável e aceita `chave` e `reverso` como `sorted`.
+        """
+        if self.tamanho < 2:
+            return
+        
+        if chave is not None:
+            self._decorar(chave)
+        vem_antes = self._comparador(chave is not None, reverso)
+        cabeca = self.cabeca
+        passo = 1
+        
+        # Intercala sequências de tamanho 1, 2, 4, ... até cobrir a lista inteira
+        while passo < self.tamanho:
+            atual = cabeca
+            cabeca = ultimo = None
+            
+            while atual:
+                esquerda = atual
+                fim_esquerda, direita = self._cortar(esquerda, passo)
+                if direita is None:
+                    # Sequência final sem par: já está ordenada e fica no fim
+                    inicio, fim = esquerda, fim_esquerda
+                    atual = None
+                else:
+                    fim_direita, atual = self._cortar(direita, passo)
+                    inicio, fim = self._intercalar(esquerda, fim_esquerda,
+                                                   direita, fim_direita, vem_antes)
+                
+                if ultimo is None:
+                    cabeca = inicio
+                else:
+                    ultimo.proximo = inicio
+                ultimo = fim
+            
+            passo *= 2
+        
+        self.cabeca = cabeca
+        if chave is not None:
+            self._desdecorar()
+        self._religar_anteriores()
+        self._versao += 1
+    
+    def mesclar(self, outra, chave=None, reverso=False):
+        """
+        Intercala nesta lista, em O(n + m), os nós de outra lista já
+        ordenada com o mesmo critério; a outra lista fica vazia. Em caso de
+        empate, os elementos desta lista vêm primeiro.
+        """
+        if outra.duplamente_encadeada != self.duplamente_encadeada:
+            raise TypeError("As duas listas devem ser do mesmo tipo de encadeamento")
+        if outra is self or outra.cabeca is None:
+            return
+        
+        if self.cabeca is None:
+            self.cabeca = outra.cabeca
+        elif chave is None:
+            self.cabeca, _ = self._intercalar(self.cabeca, self.cauda, outra.cabeca, outra.cauda,
+                                              self._comparador(False, reverso))
+        else:
+            self._decorar(chave)
+            try:
+                outra._decorar(chave)
+            except BaseException:
+                self._desdecorar()
+                raise
+            self.cabeca, _ = self._intercalar(self.cabeca, self.cauda, outra.cabeca, outra.cauda,
+                                              self._comparador(True, reverso))
+            self._desdecorar()
+        self.tamanho += outra.tamanho
+        self._versao += 1
+        self._religar_anteriores()
+        
+        outra.cabeca = None
+        outra.cauda = None
+        outra.tamanho = 0
+        outra._versao += 1
+    
+    def remover_duplicatas_ordenada(self):
+        """
+        Remove, em O(n), os valores repetidos de uma lista ordenada, mantendo
+        a primeira ocorrência de cada um. Retorna quantos nós foram removidos.
+        """
+        removidos = 0
         atual = self.cabeca
         
+        while atual and atual.proximo:
+            if atual.proximo.valor == atual.valor:
+                atual.proximo = atual.proximo.proximo
+                if self.duplamente_encadeada and atual.proximo:
+                    atual.proximo.anterior = atual
+                removidos += 1
+            else:
+                atual = atual.proximo
+        
+        self.cauda = atual
+        self.tamanho -= removidos
+        self._versao += 1
+        return removidos
+    
+    def __len__(self):
+        """Retorna o tamanho da lista."""
+        return self.tamanho
+    
+    def __iter__(self):
+        """
+        Percorre os valores da lista, da cabeça para a cauda, sem copiá-los.
+        Lança RuntimeError se a lista for modificada durante o percurso.
+        """
+        versao = self._versao
+        atual = self.cabeca
         while atual:
-            valores.append(str(atual.valor))
+            yield atual.valor
+            if self._versao != versao:
+                raise RuntimeError("A lista foi modificada durante a iteração")
             atual = atual.proximo
+    
+    def __reversed__(self):
+        """
+        Percorre os valores da cauda para a cabeça, sem copiá-los. Disponível
+        apenas na lista duplamente encadeada.
+        """
+        if not self.duplamente_encadeada:
+            raise TypeError("Uma lista simplesmente encadeada não pode ser percorrida de trás para frente")
+        return self._percorrer_da_cauda()
+    
+    def _percorrer_da_cauda(self):
+        versao = self._versao
+        atual = self.cauda
+        while atual:
+            yield atual.valor
+            if self._versao != versao:
+                raise RuntimeError("A lista foi modificada durante a iteração")
+            atual = atual.anterior
+    
+    def __contains__(self, valor):
+        """Verifica se o valor está na lista."""
+        return self.buscar(valor) != -1
+    
+    def para_lista(self):
+        """Retorna os valores da lista em uma lista do Python."""
+        return list(self)
+    
+    def _ultimos(self, quantidade):
+        """Retorna, em ordem, os últimos valores da lista, guardando só `quantidade` deles."""
+        if self.duplamente_encadeada:
+            ultimos = list(islice(reversed(self), quantidade))
+            ultimos.reverse()
+            return ultimos
+        # Sem ponteiro para o anterior, percorre a lista guardando apenas os últimos
+        return deque(self, maxlen=quantidade)
+    
+    def _exibidos(self, formatar, limite):
+        """Valores formatados para exibição, com "..." no lugar dos que ficam de fora."""
+        if limite is None or self.tamanho <= 2 * limite:
+            return list(map(formatar, self))
+        return [*map(formatar, islice(self, limite)), "...", *map(formatar, self._ultimos(limite))]
+    
+    def imprimir(self, limite=ITENS_EXIBIDOS):
+        """
+        Retorna uma representação em string da lista. Se ela tiver mais de
+        2 * `limite` valores, mostra só os primeiros e os últimos `limite`;
+        com `limite=None`, mostra todos.
+        """
+        if self.cabeca is None:
+            return "Lista vazia"
+        return " -> ".join(self._exibidos(str, limite))
+    
+    def __str__(self):
+        return self.imprimir()
+    
+    def __repr__(self):
+        return f"{type(self).__name__}([{', '.join(self._exibidos(repr, ITENS_EXIBIDOS))}])"
+
+
+class ListaEncadeadaIndexada(ListaEncadeada):
+    """
+    Lista duplamente encadeada com um dicionário que leva cada valor ao seu
+    nó, no estilo de um "linked hash map".
+    
+    Com o índice, `contem`, `remover_valor`, `mover_para_inicio` e
+    `mover_para_final` custam O(1), e a ordem de percurso continua sendo a
+    ordem da lista. Os valores precisam ser hasheáveis e únicos: adicionar um
+    valor que já está na lista lança ValueError.
+    """
+    def __init__(self):
+        super().__init__(duplamente_encadeada=True)
+        self._indice = {}
+    
+    def _verificar_novo(self, valor):
+        if valor in self._indice:
+            raise ValueError(f"O valor {valor!r} já está na lista")
+    
+    def adicionar_inicio(self, valor):
+        """Adiciona um elemento no início da lista e retorna o nó criado."""
+        self._verificar_novo(valor)
+        no = self._indice[valor] = super().adicionar_inicio(valor)
+        return no
+    
+    def adicionar_final(self, valor):
+        """Adiciona um elemento no final da lista e retorna o nó criado."""
+        self._verificar_novo(valor)
+        no = self._indice[valor] = super().adicionar_final(valor)
+        return no
+    
+    def adicionar_posicao(self, valor, posicao):
+        """Adiciona um elemento em uma posição específica."""
+        self._verificar_novo(valor)
+        no = self._indice[valor] = super().adicionar_posicao(valor, posicao)
+        return no
+    
+    def remover_inicio(self):
+        """Remove o elemento do início da lista e retorna seu valor."""
+        valor = super().remover_inicio()
+        del self._indice[valor]
+        return valor
+    
+    def remover_final(self):
+        """Remove o elemento do final da lista e retorna seu valor, em O(1)."""
+        valor = super().remover_final()
+        del self._indice[valor]
+        return valor
+    
+    def remover_no(self, no):
+        """
+        Remove da lista um nó conhecido e retorna seu valor, em O(1).
+        Lança ValueError se o nó não estiver na lista.
+        """
+        if self._indice.get(no.valor) is not no:
+            raise ValueError("O nó não pertence à lista")
+        valor = super().remover_no(no)
+        del self._indice[valor]
+        return valor
+    
+    def remover_valor(self, valor):
+        """Remove o elemento com o valor especificado, em O(1)."""
+        no = self._indice.pop(valor, None)
+        if no is None:
+            return False
+        super().remover_no(no)
+        return True
+    
+    def mesclar(self, outra, chave=None, reverso=False):
+        """
+        Intercala nesta lista, em O(n + m), os nós de outra lista duplamente
+        encadeada já ordenada, que fica vazia. Lança ValueError se as listas
+        tiverem valores em comum. Mesclar a lista com ela mesma não faz nada,
+        como na lista base.
+        """
+        if outra is self:
+            return
+        if isinstance(outra, ListaEncadeadaIndexada):
+            novos = outra._indice
+        else:
+            novos = {}
+            atual = outra.cabeca
+            while atual:
+                if atual.valor in novos:
+                    raise ValueError(f"O valor {atual.valor!r} aparece mais de uma vez")
+                novos[atual.valor] = atual
+                atual = atual.proximo
+        
+        for valor in novos:
+            if valor in self._indice:
+                raise ValueError(f"O valor {valor!r} já está na lista")
+        
+        super().mesclar(outra, chave, reverso)
+        self._indice.update(novos)
+        if isinstance(outra, ListaEncadeadaIndexada):
+            outra._indice = {}
+    
+    def estender(self, iteravel):
+        """
+        Adiciona ao final da lista os valores de um iterável, em uma única
+        passagem. Lança ValueError no primeiro valor repetido, mantendo os
+        anteriores a ele.
+        """
+        for valor in iteravel:
+            self.adicionar_final(valor)
+    
+    def contem(self, valor):
+        """Verifica, em O(1), se o valor está na lista."""
+        return valor in self._indice
+    
+    __contains__ = contem
+    
+    def buscar(self, valor):
+        """
+        Busca um valor e retorna sua posição na lista.
+        Retorna -1 em O(1) se o valor não estiver na lista; se estiver, a
+        posição é contada voltando do nó até a cabeça.
+        """
+        no = self._indice.get(valor)
+        if no is None:
+            return -1
+        
+        posicao = 0
+        while no.anterior is not None:
+            no = no.anterior
+            posicao += 1
+        return posicao
+    
+    def mover_para_inicio(self, valor):
+        """Move o elemento com o valor especificado para o início da lista, em O(1)."""
+        no = self._indice.get(valor)
+        if no is None:
+            return False
+        if no is not self.cabeca:
+            # Desliga o nó de onde está e o religa na cabeça, sem criar outro
+            super().remover_no(no)
+            no.proximo = self.cabeca
+            self.cabeca.anterior = no
+            self.cabeca = no
+            self.tamanho += 1
+        return True
+    
+    def mover_para_final(self, valor):
+        """Move o elemento com o valor especificado para o final da lista, em O(1)."""
+        no = self._indice.get(valor)
+        if no is None:
+            return False
+        if no is not self.cauda:
+            super().remover_no(no)
+            no.anterior = self.cauda
+            self.cauda.proximo = no
+            self.cauda = no
+            self.tamanho += 1
+        return True
+
+
+def comparar_construcao(tamanho=10**6):
+    """
+    Compara o tempo para construir uma lista com `tamanho` valores chamando
+    `adicionar_final` em um laço e com `de_iteravel`, nos dois modos da lista.
+    """
+    for duplamente_encadeada in (False, True):
+        tempo_inicio = time.perf_counter()
+        lista = ListaEncadeada(duplamente_encadeada)
+        for valor in range(tamanho):
+            lista.adicionar_final(valor)
+        tempo_laco = time.perf_counter() - tempo_inicio
+        del lista
+        
+        tempo_inicio = time.perf_counter()
+        lista = ListaEncadeada.de_iteravel(range(tamanho), duplamente_encadeada)
+        tempo_lote = time.perf_counter() - tempo_inicio
+        
+        tempo_inicio = time.perf_counter()
+        lista.para_lista()
+        tempo_conversao = time.perf_counter() - tempo_inicio
+        del lista
         
-        return " -> ".join(valores) if valores else "Lista vazia"
+        modo = "duplamente encadeada" if duplamente_encadeada else "simplesmente encadeada"
+        print(f"Lista {modo} com {tamanho} valores")
+        print(f"  adicionar_final em um laço: {tempo_laco * 1e3:10.2f} ms")
+        print(f"  de_iteravel:                {tempo_lote * 1e3:10.2f} ms")
+        print(f"  para_lista:                 {tempo_conversao * 1e3:10.2f} ms")
+
+
+def comparar_ordenacao(tamanhos=(10**4, 10**5), repeticoes=3):
+    """
+    Compara `ordenar`, `mesclar` e `remover_duplicatas_ordenada` com o
+    caminho de copiar os valores para uma lista do Python, ordená-la com
+    `sorted` (sem repetições, no caso das duplicatas) e reconstruir a lista
+    encadeada com `adicionar_final`, exibindo o melhor tempo de cada um.
+    """
+    def copiar_ordenar_reconstruir(*listas, unicos=False):
+        valores = []
+        for lista in listas:
+            atual = lista.cabeca
+            while atual:
+                valores.append(atual.valor)
+                atual = atual.proximo
+        nova = ListaEncadeada()
+        for valor in sorted(set(valores) if unicos else valores):
+            nova.adicionar_final(valor)
+        return nova
+    
+    def medir(preparar, executar):
+        melhor = float("inf")
+        for _ in range(repeticoes):
+            argumentos = preparar()
+            tempo_inicio = time.perf_counter()
+            executar(*argumentos)
+            melhor = min(melhor, time.perf_counter() - tempo_inicio)
+        return melhor
+    
+    for tamanho in tamanhos:
+        valores = [random.random() for _ in range(tamanho)]
+        metade = sorted(valores[:tamanho // 2]), sorted(valores[tamanho // 2:])
+        repetidos = sorted(random.randrange(tamanho // 10) for _ in range(tamanho))
+        
+        def lista_de(iteravel):
+            lista = ListaEncadeada()
+            for valor in iteravel:
+                lista.adicionar_final(valor)
+            return lista
+        
+        tempo_ordenar = medir(lambda: (lista_de(valores),), lambda lista: lista.ordenar())
+        tempo_copiar = medir(lambda: (lista_de(valores),), copiar_ordenar_reconstruir)
+        tempo_mesclar = medir(lambda: (lista_de(metade[0]), lista_de(metade[1])),
+                              lambda a, b: a.mesclar(b))
+        tempo_mesclar_copiando = medir(
+            lambda: (lista_de(metade[0]), lista_de(metade[1])),
+            lambda a, b: copiar_ordenar_reconstruir(a, b))
+        tempo_duplicatas = medir(lambda: (lista_de(repetidos),),
+                                 lambda lista: lista.remover_duplicatas_ordenada())
+        tempo_duplicatas_copiando = medir(
+            lambda: (lista_de(repetidos),),
+            lambda lista: copiar_ordenar_reconstruir(lista, unicos=True))
+        
+        print(f"Tamanho da lista: {tamanho} elementos")
+        print(f"  ordenar no lugar:             {tempo_ordenar * 1e3:10.2f} ms")
+        print(f"  copiar, sorted e reconstruir: {tempo_copiar * 1e3:10.2f} ms")
+        print(f"  mesclar duas metades:         {tempo_mesclar * 1e3:10.2f} ms")
+        print(f"  mesclar copiando:             {tempo_mesclar_copiando * 1e3:10.2f} ms")
+        print(f"  remover duplicatas no lugar:  {tempo_duplicatas * 1e3:10.2f} ms")
+        print(f"  remover duplicatas copiando:  {tempo_duplicatas_copiando * 1e3:10.2f} ms")
 
 
 # Demonstração de uso
@@ -212,4 +869,71 @@ if __name__ == "__main__":
     print(f"Valor na posição {pos}: {valor}")
     
     print(f"\nTamanho da lista: {lista.tamanho_lista()}")
-    print(f"A lista está vazia? {lista.esta_vazia()}")
\ No newline at end of file
+    print(f"A lista está vazia? {lista.esta_vazia()}")
+    
+    print("\nLista duplamente encadeada:")
+    dupla = ListaEncadeada(duplamente_encadeada=True)
+    nos = [dupla.adicionar_final(i) for i in range(1, 8)]
+    print(f"Lista inicial: {dupla.imprimir()}")
+    print(f"Valor na posição 5 (percorrida a partir da cauda): {dupla.obter(5)}")
+    print(f"Removido o nó de valor {dupla.remover_no(nos[3])}: {dupla.imprimir()}")
+    print(f"Removido do final em O(1): {dupla.remover_final()}, nova lista: {dupla.imprimir()}")
+    
+    print("\nLista indexada por valor:")
+    indexada = ListaEncadeadaIndexada()
+    for tarefa in ("compilar", "testar", "empacotar", "publicar"):
+        indexada.adicionar_final(tarefa)
+    print(f"Lista inicial: {indexada.imprimir()}")
+    print(f"Contém 'testar'? {indexada.contem('testar')}")
+    indexada.mover_para_inicio("publicar")
+    print(f"Após mover 'publicar' para o início: {indexada.imprimir()}")
+    indexada.mover_para_final("compilar")
+    print(f"Após mover 'compilar' para o final: {indexada.imprimir()}")
+    print(f"Removido 'testar': {indexada.remover_valor('testar')}, nova lista: {indexada.imprimir()}")
+    try:
+        indexada.adicionar_final("empacotar")
+    except ValueError as erro:
+        print(f"Erro: {erro}")
+    
+    print("\nOrdenação no próprio lugar:")
+    desordenada = ListaEncadeada(duplamente_encadeada=True)
+    for valor in (5, 3, 8, 1, 3, 9, 1, 5):
+        desordenada.adicionar_final(valor)
+    print(f"Lista inicial: {desordenada.imprimir()}")
+    desordenada.ordenar()
+    print(f"Ordenada: {desordenada.imprimir()}")
+    print(f"Duplicatas removidas: {desordenada.remover_duplicatas_ordenada()}, "
+          f"nova lista: {desordenada.imprimir()}")
+    outra = ListaEncadeada(duplamente_encadeada=True)
+    for valor in (2, 4, 6):
+        outra.adicionar_final(valor)
+    desordenada.mesclar(outra)
+    print(f"Após mesclar com 2 -> 4 -> 6: {desordenada.imprimir()}")
+    desordenada.ordenar(chave=lambda valor: valor % 3, reverso=True)
+    print(f"Ordenada pelo resto da divisão por 3, decrescente: {desordenada.imprimir()}")
+    
+    print("\nConstrução a partir de um iterável:")
+    quadrados = ListaEncadeada.de_iteravel(i * i for i in range(1, 6))
+    quadrados.estender(range(100, 103))
+    print(f"Lista: {quadrados.imprimir()}")
+    print(f"Convertida para list: {quadrados.para_lista()}, soma: {sum(quadrados)}")
+    
+    print("\nPercorrendo uma lista longa sem copiá-la:")
+    longa = ListaEncadeada.de_iteravel(range(1000), duplamente_encadeada=True)
+    print(f"Lista resumida: {longa}")
+    print(f"len: {len(longa)}, 500 está na lista? {500 in longa}, "
+          f"três últimos de trás para frente: {list(islice(reversed(longa), 3))}")
+    try:
+        for valor in longa:
+            if valor == 3:
+                longa.remover_inicio()
+    except RuntimeError as erro:
+        print(f"Erro: {erro}")
+    
+    # As comparações levam vários segundos e só rodam com --comparar
+    if "--comparar" in sys.argv:
+        print("\nComparação da construção em lote:\n")
+        comparar_construcao()
+        
+        print("\nComparação com copiar, ordenar e reconstruir:\n")
+        comparar_ordenacao()
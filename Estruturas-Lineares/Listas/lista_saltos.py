@@ -0,0 +1,250 @@
+import random
+import sys
+import time
+
+from lista_encadeada import ListaEncadeada
+
+
+class NoSalto:
+    """
+    Nó de uma lista de saltos (skip list) indexável.
+    Em cada nível, o nó guarda o próximo nó daquele nível e a largura do
+    salto, isto é, quantas posições da lista o salto atravessa.
+    """
+    __slots__ = ("valor", "proximos", "larguras")
+    
+    def __init__(self, valor, nivel):
+        self.valor = valor
+        self.proximos = [None] * nivel
+        self.larguras = [0] * nivel
+
+
+class ListaSaltos:
+    """
+    Lista posicional implementada como uma lista de saltos indexável.
+    
+    Oferece os mesmos métodos de `ListaEncadeada`, mas `obter`,
+    `adicionar_posicao` e `remover_posicao` custam O(log n) esperado: as
+    larguras guardadas em cada salto permitem descer até uma posição sem
+    visitar os elementos intermediários. Operações por valor (`buscar` e
+    `remover_valor`) continuam precisando percorrer a lista.
+    """
+    NIVEL_MAXIMO = 32
+    
+    def __init__(self):
+        # Sentinelas: a cabeça ocupa a posição 0 e o fim a posição tamanho + 1
+        self.cabeca = NoSalto(None, self.NIVEL_MAXIMO)
+        self.fim = NoSalto(None, 0)
+        self.nivel = 1
+        self.tamanho = 0
+        self.cabeca.proximos[0] = self.fim
+        self.cabeca.larguras[0] = 1
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.tamanho == 0
+    
+    def tamanho_lista(self):
+        """Retorna o tamanho da lista."""
+        return self.tamanho
+    
+    def _sortear_nivel(self):
+        """Sorteia a altura de um novo nó (probabilidade 1/2 por nível)."""
+        bits = random.getrandbits(self.NIVEL_MAXIMO - 1)
+        # Quantidade de bits 1 consecutivos a partir do menos significativo
+        return ((bits + 1) & ~bits).bit_length()
+    
+    def _anteriores(self, posicao):
+        """
+        Retorna, para cada nível, o último nó antes da posição informada e
+        a posição desse nó (a cabeça conta como posição 0).
+        """
+        anteriores = [None] * self.nivel
+        posicoes = [0] * self.nivel
+        no = self.cabeca
+        pos = 0
+        for nivel in range(self.nivel - 1, -1, -1):
+            while pos + no.larguras[nivel] <= posicao:
+                pos += no.larguras[nivel]
+                no = no.proximos[nivel]
+            anteriores[nivel] = no
+            posicoes[nivel] = pos
+        return anteriores, posicoes
+    
+    def _no_na_posicao(self, posicao):
+        """Retorna o nó de uma posição válida (0 é o primeiro elemento)."""
+        alvo = posicao + 1
+        no = self.cabeca
+        pos = 0
+        for nivel in range(self.nivel - 1, -1, -1):
+            while pos + no.larguras[nivel] <= alvo:
+                pos += no.larguras[nivel]
+                no = no.proximos[nivel]
+        return no
+    
+    def adicionar_inicio(self, valor):
+        """Adiciona um elemento no início da lista."""
+        self.adicionar_posicao(valor, 0)
+    
+    def adicionar_final(self, valor):
+        """Adiciona um elemento no final da lista."""
+        self.adicionar_posicao(valor, self.tamanho)
+    
+    def adicionar_posicao(self, valor, posicao):
+        """Adiciona um elemento em uma posição específica, em O(log n) esperado."""
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição fora dos limites")
+        
+        altura = self._sortear_nivel()
+        
+        # Níveis novos começam ligando a cabeça diretamente ao fim
+        if altura > self.nivel:
+            for nivel in range(self.nivel, altura):
+                self.cabeca.proximos[nivel] = self.fim
+                self.cabeca.larguras[nivel] = self.tamanho + 1
+            self.nivel = altura
+        
+        anteriores, posicoes = self._anteriores(posicao)
+        novo_no = NoSalto(valor, altura)
+        
+        for nivel in range(altura):
+            anterior = anteriores[nivel]
+            distancia = posicao - posicoes[nivel]
+            novo_no.proximos[nivel] = anterior.proximos[nivel]
+            novo_no.larguras[nivel] = anterior.larguras[nivel] - distancia
+            anterior.proximos[nivel] = novo_no
+            anterior.larguras[nivel] = distancia + 1
+        
+        # Saltos mais altos que o novo nó passam a atravessar um elemento a mais
+        for nivel in range(altura, self.nivel):
+            anteriores[nivel].larguras[nivel] += 1
+        
+        self.tamanho += 1
+    
+    def remover_posicao(self, posicao):
+        """Remove o elemento de uma posição e retorna seu valor, em O(log n) esperado."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição fora dos limites")
+        
+        anteriores, _ = self._anteriores(posicao)
+        alvo = anteriores[0].proximos[0]
+        
+        for nivel in range(self.nivel):
+            anterior = anteriores[nivel]
+            if anterior.proximos[nivel] is alvo:
+                anterior.larguras[nivel] += alvo.larguras[nivel] - 1
+                anterior.proximos[nivel] = alvo.proximos[nivel]
+            else:
+                anterior.larguras[nivel] -= 1
+        
+        self.tamanho -= 1
+        return alvo.valor
+    
+    def remover_inicio(self):
+        """Remove o elemento do início da lista e retorna seu valor."""
+        if self.tamanho == 0:
+            raise ValueError("Não é possível remover de uma lista vazia")
+        return self.remover_posicao(0)
+    
+    def remover_final(self):
+        """Remove o elemento do final da lista e retorna seu valor."""
+        if self.tamanho == 0:
+            raise ValueError("Não é possível remover de uma lista vazia")
+        return self.remover_posicao(self.tamanho - 1)
+    
+    def remover_valor(self, valor):
+        """
+        Remove a primeira ocorrência de um valor específico.
+        Localizar o valor é O(n); a remoção em si é O(log n) esperado.
+        """
+        posicao = self.buscar(valor)
+        if posicao == -1:
+            return False
+        self.remover_posicao(posicao)
+        return True
+    
+    def buscar(self, valor):
+        """
+        Busca um valor e retorna sua posição na lista.
+        Retorna -1 se o valor não for encontrado.
+        """
+        atual = self.cabeca.proximos[0]
+        posicao = 0
+        
+        while atual is not self.fim:
+            if atual.valor == valor:
+                return posicao
+            atual = atual.proximos[0]
+            posicao += 1
+        
+        return -1
+    
+    def obter(self, posicao):
+        """Retorna o valor na posição especificada, em O(log n) esperado."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição fora dos limites")
+        return self._no_na_posicao(posicao).valor
+    
+    def imprimir(self):
+        """Retorna uma representação em string da lista."""
+        valores = []
+        atual = self.cabeca.proximos[0]
+        
+        while atual is not self.fim:
+            valores.append(str(atual.valor))
+            atual = atual.proximos[0]
+        
+        return " -> ".join(valores) if valores else "Lista vazia"
+
+
+def comparar_desempenho(tamanhos=(10**4, 10**5, 10**6), operacoes=200):
+    """
+    Compara `ListaEncadeada` e `ListaSaltos` em leituras e inserções em
+    posições aleatórias, exibindo o tempo médio por operação.
+    """
+    for tamanho in tamanhos:
+        posicoes = [random.randrange(tamanho) for _ in range(operacoes)]
+        print(f"Tamanho da lista: {tamanho} elementos")
+        
+        for classe in (ListaEncadeada, ListaSaltos):
+            lista = classe()
+            for i in range(tamanho):
+                lista.adicionar_final(i)
+            
+            tempo_inicio = time.perf_counter()
+            for posicao in posicoes:
+                lista.obter(posicao)
+            tempo_obter = (time.perf_counter() - tempo_inicio) / operacoes
+            
+            tempo_inicio = time.perf_counter()
+            for posicao in posicoes:
+                lista.adicionar_posicao(-1, posicao)
+            tempo_inserir = (time.perf_counter() - tempo_inicio) / operacoes
+            
+            print(f"  {classe.__name__:<15} obter: {tempo_obter * 1e6:10.2f} µs"
+                  f"   adicionar_posicao: {tempo_inserir * 1e6:10.2f} µs")
+        print()
+
+
+# Demonstração de uso
+if __name__ == "__main__":
+    lista = ListaSaltos()
+    
+    print("Inserindo elementos no final:")
+    for i in range(1, 8):
+        lista.adicionar_final(i * 10)
+    print(f"Lista: {lista.imprimir()}")
+    
+    print("\nInserindo 25 na posição 2:")
+    lista.adicionar_posicao(25, 2)
+    print(f"Lista após inserção: {lista.imprimir()}")
+    
+    print(f"\nValor na posição 5: {lista.obter(5)}")
+    print(f"Removido da posição 3: {lista.remover_posicao(3)}, nova lista: {lista.imprimir()}")
+    print(f"Removido valor 60: {lista.remover_valor(60)}, nova lista: {lista.imprimir()}")
+    print(f"Tamanho da lista: {lista.tamanho_lista()}")
+    
+    # A comparação leva vários segundos e só roda com --comparar
+    if "--comparar" in sys.argv:
+        print("\nComparação de desempenho com a lista encadeada:\n")
+        comparar_desempenho()
@@ -1,3 +1,36 @@
+from array import array
+from collections import deque
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, usa-se apenas a pilha
+    np = None
+
+# A partir deste tamanho, verificar_parenteses_balanceados usa NumPy, se disponível
+LIMIAR_VETORIZADO = 1 << 14
+
+# Itens da base e do topo mostrados ao exibir uma pilha longa
+ITENS_EXIBIDOS = 10
+
+# Formatos de buffer que podem ser copiados em bloco para cada tipo de array
+# (em algumas plataformas, 'l' e 'q' são o mesmo inteiro de 64 bits)
+_FORMATOS_EQUIVALENTES = {
+    "b": "b", "B": "B", "h": "h", "H": "H", "i": "i", "I": "I",
+    "l": "lq", "L": "LQ", "q": "ql", "Q": "QL", "f": "f", "d": "d", "u": "u", "w": "w",
+}
+
+
+def _resumir(primeiros, ultimos, total):
+    """Formata a pilha como "[a, b, ..., y, z]", lendo só os itens exibidos."""
+    if total <= 2 * ITENS_EXIBIDOS:
+        return "[" + ", ".join(map(repr, primeiros)) + "]"
+    inicio = list(map(repr, islice(primeiros, ITENS_EXIBIDOS)))
+    fim = list(map(repr, islice(ultimos, ITENS_EXIBIDOS)))
+    fim.reverse()
+    return "[" + ", ".join(inicio + ["..."] + fim) + "]"
+
+
 class Pilha:
     """
     Implementação de uma pilha utilizando uma lista em Python.
@@ -6,6 +39,7 @@ class Pilha:
     def __init__(self):
         """Inicializa uma pilha vazia."""
         self.itens = []
+        self._versao = 0  # Muda a cada alteração, para detectar iterações invalidadas
     
     def esta_vazia(self):
         """Verifica se a pilha está vazia."""
@@ -13,12 +47,14 @@ class Pilha:
     
     def empilhar(self, item):
         """Adiciona um item ao topo da pilha."""
+        self._versao += 1
         self.itens.append(item)
     
     def desempilhar(self):
         """Remove e retorna o item do topo da pilha."""
         if self.esta_vazia():
             raise IndexError("Não é possível desempilhar de uma pilha vazia")
+        self._versao += 1
         return self.itens.pop()
     
     def topo(self):
@@ -31,9 +67,41 @@ class Pilha:
         """Retorna o número de itens na pilha."""
         return len(self.itens)
     
+    def __len__(self):
+        """Retorna o número de itens na pilha."""
+        return len(self.itens)
+    
+    def __iter__(self):
+        """
+        Percorre os itens do topo para a base, na ordem em que seriam
+        desempilhados, sem copiá-los. Lança RuntimeError se a pilha for
+        modificada durante o percurso.
+        """
+        versao = self._versao
+        itens = self.itens
+        for indice in range(len(itens) - 1, -1, -1):
+            yield itens[indice]
+            if self._versao != versao:
+                raise RuntimeError("A pilha foi modificada durante a iteração")
+    
+    def __reversed__(self):
+        """Percorre os itens da base para o topo, na ordem em que foram empilhados."""
+        versao = self._versao
+        for item in self.itens:
+            yield item
+            if self._versao != versao:
+                raise RuntimeError("A pilha foi modificada durante a iteração")
+    
+    def __contains__(self, item):
+        """Verifica se o item está na pilha."""
+        return item in self.itens
+    
     def __str__(self):
-        """Retorna uma representação em string da pilha."""
-        return str(self.itens)
+        """Retorna a pilha em string, da base para o topo, resumida se for longa."""
+        return _resumir(iter(self.itens), reversed(self.itens), len(self.itens))
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self})"
 
 
 class PilhaLimitada:
@@ -92,6 +160,8 @@ class PilhaEncadeada:
     """
     class No:
         """Classe interna que representa um nó na lista encadeada."""
+        __slots__ = ("valor", "proximo")
+        
         def __init__(self, valor):
             self.valor = valor
             self.proximo = None
@@ -100,6 +170,7 @@ class PilhaEncadeada:
         """Inicializa uma pilha encadeada vazia."""
         self.topo_no = None
         self.tamanho_atual = 0
+        self._versao = 0
     
     def esta_vazia(self):
         """Verifica se a pilha está vazia."""
@@ -107,6 +178,7 @@ class PilhaEncadeada:
     
     def empilhar(self, item):
         """Adiciona um item ao topo da pilha."""
+        self._versao += 1
         novo_no = self.No(item)
         novo_no.proximo = self.topo_no
         self.topo_no = novo_no
@@ -117,6 +189,7 @@ class PilhaEncadeada:
         if self.esta_vazia():
             raise IndexError("Não é possível desempilhar de uma pilha vazia")
         
+        self._versao += 1
         item = self.topo_no.valor
         self.topo_no = self.topo_no.proximo
         self.tamanho_atual -= 1
@@ -132,19 +205,205 @@ class PilhaEncadeada:
         """Retorna o número de itens na pilha."""
         return self.tamanho_atual
     
-    def __str__(self):
-        """Retorna uma representação em string da pilha."""
-        if self.esta_vazia():
-            return "[]"
+    @classmethod
+    def de_iteravel(cls, iteravel):
+        """
+        Cria uma pilha empilhando os itens de um iterável na ordem em que são
+        produzidos, de modo que o último fica no topo.
+        """
+        pilha = cls()
+        pilha.estender(iteravel)
+        return pilha
+    
+    def estender(self, iteravel):
+        """
+        Empilha os itens de um iterável em uma única passagem, sem criar uma
+        lista intermediária.
+        """
+        if iteravel is self:
+            iteravel = self.para_lista()
         
-        valores = []
+        self._versao += 1
+        classe_no = self.No
+        topo = self.topo_no
+        empilhados = 0
+        
+        try:
+            for item in iteravel:
+                novo_no = classe_no(item)
+                novo_no.proximo = topo
+                topo = novo_no
+                empilhados += 1
+        finally:
+            # Mesmo que o iterável falhe no meio, a pilha fica consistente
+            self.topo_no = topo
+            self.tamanho_atual += empilhados
+    
+    def __len__(self):
+        """Retorna o número de itens na pilha."""
+        return self.tamanho_atual
+    
+    def __iter__(self):
+        """
+        Percorre os itens do topo para a base, na ordem em que seriam
+        desempilhados, sem copiá-los. Lança RuntimeError se a pilha for
+        modificada durante o percurso. Como os nós só apontam para baixo,
+        não há percurso inverso.
+        """
+        versao = self._versao
         atual = self.topo_no
         while atual:
-            valores.append(atual.valor)
+            yield atual.valor
+            if self._versao != versao:
+                raise RuntimeError("A pilha foi modificada durante a iteração")
             atual = atual.proximo
+    
+    def __contains__(self, item):
+        """Verifica se o item está na pilha."""
+        return item in iter(self)
+    
+    def para_lista(self):
+        """Retorna os itens em uma lista do Python, da base para o topo, como em `Pilha`."""
+        valores = list(self)
+        valores.reverse()
+        return valores
+    
+    def __str__(self):
+        """Retorna a pilha em string, da base para o topo, resumida se for longa."""
+        # A base vem primeiro, para mostrar o topo no final da lista. Os itens da
+        # base estão no fim da cadeia: só os últimos nós percorridos são guardados
+        base = deque(self, maxlen=2 * ITENS_EXIBIDOS)
+        return _resumir(reversed(base), iter(self), self.tamanho_atual)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self})"
+
+
+class PilhaTipada:
+    """
+    Implementação de uma pilha de números usando `array.array`.
+    Os valores ficam armazenados lado a lado, sem um objeto Python por item:
+    com o tipo 'q' (inteiro de 64 bits) ou 'd' (float de 64 bits), cada
+    elemento ocupa 8 bytes, contra cerca de 36 a 64 bytes em uma lista de
+    inteiros ou em uma PilhaEncadeada.
+    """
+    def __init__(self, typecode="q"):
+        """Inicializa uma pilha vazia para valores do tipo indicado (código do módulo array)."""
+        self.itens = array(typecode)
+        self._versao = 0
+    
+    def esta_vazia(self):
+        """Verifica se a pilha está vazia."""
+        return len(self.itens) == 0
+    
+    def empilhar(self, item):
+        """Adiciona um item ao topo da pilha."""
+        self._versao += 1
+        self.itens.append(item)
+    
+    def empilhar_varios(self, itens):
+        """
+        Adiciona vários itens de uma vez; o último passa a ser o topo.
+        Um `array.array` do mesmo tipo ou um buffer contíguo com o mesmo
+        formato (como um memoryview ou um array do NumPy) é copiado em bloco,
+        sem passar item a item; nos demais casos, cada item é convertido e
+        validado pelo próprio array.
+        """
+        self._versao += 1
+        if isinstance(itens, array) and itens.typecode == self.itens.typecode:
+            self.itens.extend(itens)
+            return
+        
+        try:
+            visao = memoryview(itens)
+        except TypeError:
+            # Iterável comum: copiado item a item
+            self.itens.extend(itens)
+            return
         
-        # A ordem é invertida para mostrar o topo no final da lista
-        return str(valores[::-1])
+        with visao:
+            if (visao.c_contiguous and visao.itemsize == self.itens.itemsize
+                    and visao.format.lstrip("@=") in _FORMATOS_EQUIVALENTES[self.itens.typecode]):
+                self.itens.frombytes(visao.cast("B"))
+            else:
+                self.itens.extend(visao.tolist())
+    
+    def desempilhar(self):
+        """Remove e retorna o item do topo da pilha."""
+        if self.esta_vazia():
+            raise IndexError("Não é possível desempilhar de uma pilha vazia")
+        self._versao += 1
+        return self.itens.pop()
+    
+    def desempilhar_varios(self, quantidade):
+        """
+        Remove os `quantidade` itens do topo e os retorna em um novo array,
+        na ordem da pilha (o último elemento é o antigo topo).
+        """
+        if quantidade > len(self.itens):
+            raise IndexError("Não há itens suficientes na pilha")
+        if quantidade <= 0:
+            return array(self.itens.typecode)
+        
+        self._versao += 1
+        removidos = self.itens[-quantidade:]
+        del self.itens[-quantidade:]
+        return removidos
+    
+    def topo(self):
+        """Retorna o item do topo da pilha sem removê-lo."""
+        if self.esta_vazia():
+            raise IndexError("A pilha está vazia")
+        return self.itens[-1]
+    
+    def tamanho(self):
+        """Retorna o número de itens na pilha."""
+        return len(self.itens)
+    
+    def visao(self):
+        """
+        Retorna um memoryview dos itens, da base ao topo, sem copiá-los.
+        Enquanto a visão não for liberada (`release()` ou bloco `with`), a
+        pilha não pode crescer nem diminuir.
+        """
+        return memoryview(self.itens)
+    
+    def __len__(self):
+        """Retorna o número de itens na pilha."""
+        return len(self.itens)
+    
+    def __iter__(self):
+        """
+        Percorre os itens do topo para a base, na ordem em que seriam
+        desempilhados, sem copiar o array. Lança RuntimeError se a pilha
+        for modificada durante o percurso.
+        """
+        versao = self._versao
+        itens = self.itens
+        for indice in range(len(itens) - 1, -1, -1):
+            yield itens[indice]
+            if self._versao != versao:
+                raise RuntimeError("A pilha foi modificada durante a iteração")
+    
+    def __reversed__(self):
+        """Percorre os itens da base para o topo, na ordem em que foram empilhados."""
+        versao = self._versao
+        for item in self.itens:
+            yield item
+            if self._versao != versao:
+                raise RuntimeError("A pilha foi modificada durante a iteração")
+    
+    def __contains__(self, item):
+        """Verifica se o item está na pilha, comparando direto no array."""
+        return item in self.itens
+    
+    def __str__(self):
+        """Retorna a pilha em string, da base para o topo, resumida se for longa."""
+        # Só os itens exibidos viram objetos Python, não o array inteiro
+        return _resumir(iter(self.itens), reversed(self.itens), len(self.itens))
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.itens.typecode!r}, {self})"
 
 
 # Exemplos de aplicações com pilhas
@@ -158,6 +417,9 @@ def verificar_parenteses_balanceados(expressao):
     Returns:
         True se os parênteses estiverem balanceados, False caso contrário.
     """
+    if np is not None and isinstance(expressao, str) and len(expressao) >= LIMIAR_VETORIZADO:
+        return verificar_parenteses_vetorizado(expressao)
+    
     pilha = Pilha()
     mapeamento = {')': '(', '}': '{', ']': '['}
     
@@ -175,6 +437,58 @@ def verificar_parenteses_balanceados(expressao):
     return pilha.esta_vazia()
 
 
+if np is not None:
+    # Tabelas de consulta indexadas pelo valor do byte, montadas uma só vez
+    _VARIACAO = np.zeros(256, dtype=np.int8)
+    _VARIACAO[list(b"({[")] = 1
+    _VARIACAO[list(b")}]")] = -1
+    _TIPO = np.zeros(256, dtype=np.int8)
+    _TIPO[list(b"()")] = 1
+    _TIPO[list(b"[]")] = 2
+    _TIPO[list(b"{}")] = 3
+
+
+def verificar_parenteses_vetorizado(expressao):
+    """
+    Versão de `verificar_parenteses_balanceados` sem laço em Python (requer NumPy).
+    
+    Aberturas valem +1 e fechamentos -1; a soma acumulada é a profundidade da
+    pilha após cada símbolo. Ela nunca pode ficar negativa e deve terminar em
+    zero. Se houver mais de um tipo de símbolo, cada fechamento é comparado
+    com a abertura do mesmo nível que o antecede, obtida por uma ordenação
+    estável pelo nível.
+    
+    Args:
+        expressao: A expressão a ser verificada (str ou bytes).
+        
+    Returns:
+        True se os parênteses estiverem balanceados, False caso contrário.
+    """
+    if isinstance(expressao, str):
+        expressao = expressao.encode("utf-8", "surrogatepass")
+    
+    simbolos = np.frombuffer(expressao, dtype=np.uint8)
+    simbolos = simbolos[_VARIACAO[simbolos] != 0]
+    if simbolos.size == 0:
+        return True
+    
+    variacao = _VARIACAO[simbolos]
+    profundidade = np.cumsum(variacao, dtype=np.int64)
+    if profundidade.min() < 0 or profundidade[-1] != 0:
+        return False
+    
+    # Tipo do símbolo: parênteses, colchetes ou chaves
+    tipos = _TIPO[simbolos]
+    if tipos.min() == tipos.max():
+        return True
+    
+    niveis = profundidade - (variacao > 0)
+    ordem = np.argsort(niveis, kind="stable")
+    tipos = tipos[ordem]
+    fechamentos = np.flatnonzero(variacao[ordem] < 0)
+    return bool(np.all(tipos[fechamentos] == tipos[fechamentos - 1]))
+
+
 def converter_decimal_para_binario(numero_decimal):
     """
     Converte um número decimal para sua representação binária.
@@ -261,6 +575,28 @@ if __name__ == "__main__":
     while not pilha.esta_vazia():
         print(f"Desempilhado {pilha.desempilhar()}, pilha atual: {pilha}")
     
+    print("\n=== Pilha Encadeada Construída em Lote ===")
+    pilha_encadeada = PilhaEncadeada.de_iteravel(i * 10 for i in range(1, 6))
+    print(f"Pilha encadeada: {pilha_encadeada}, topo: {pilha_encadeada.topo()}")
+    pilha_encadeada.estender(range(60, 80, 10))
+    print(f"Ordem de desempilhamento: {list(pilha_encadeada)}")
+    print(f"Da base para o topo: {pilha_encadeada.para_lista()}")
+    pilha_encadeada.estender(range(80, 400, 10))
+    print(f"Pilha com {len(pilha_encadeada)} itens, resumida: {pilha_encadeada}")
+    print(f"200 está na pilha? {200 in pilha_encadeada}")
+    
+    print("\n=== Pilha Tipada ===")
+    pilha_tipada = PilhaTipada("d")
+    pilha_tipada.empilhar_varios(array("d", [1.5, 2.5, 3.5, 4.5]))
+    pilha_tipada.empilhar(5.5)
+    print(f"Pilha tipada: {pilha_tipada} ({pilha_tipada.itens.itemsize} bytes por item)")
+    print(f"Desempilhados dois de uma vez: {pilha_tipada.desempilhar_varios(2).tolist()}")
+    with pilha_tipada.visao() as visao:
+        print(f"Soma lida pela visão sem cópia: {sum(visao)}")
+    pilha_tipada.empilhar_varios(range(100))
+    print(f"Pilha com {len(pilha_tipada)} itens, resumida: {pilha_tipada}")
+    print(f"50.0 está na pilha? {50.0 in pilha_tipada}")
+    
     print("\n=== Verificação de Parênteses Balanceados ===")
     expressoes = [
         "{[()()]}",
@@ -9,8 +9,37 @@ Exemplos:
 - Não balanceados: "{[(])}", "(()", "if (x == 1) { print(y);"
 
 Este programa demonstra o uso da estrutura de dados Pilha (LIFO - Last In, First Out).
+
+Para arquivos grandes, `verificar_arquivo` lê a entrada em blocos de bytes
+de tamanho fixo e informa a posição (byte, linha e coluna) do primeiro erro.
+Uso: python verificador_expressoes.py [arquivo ...]
 """
 
+import functools
+import mmap
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections import deque, namedtuple
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, usa-se apenas a pilha
+    np = None
+
+# Tamanho padrão dos blocos lidos por verificar_arquivo (1 MiB)
+TAMANHO_BLOCO = 1 << 20
+
+# Tamanho padrão dos blocos distribuídos entre processos (8 MiB)
+TAMANHO_BLOCO_PARALELO = 8 << 20
+
+# A partir deste tamanho (em caracteres), verificar_expressao usa a versão
+# vetorizada com NumPy, se disponível
+LIMIAR_VETORIZADO = 1 << 14
+
 class Pilha:
     """
     Implementação de uma pilha utilizando lista.
@@ -54,6 +83,11 @@ def verificar_expressao(expressao):
     Returns:
         True se a expressão estiver balanceada, False caso contrário.
     """
+    # Entradas grandes são verificadas sem laço em Python, se houver NumPy
+    if np is not None and isinstance(expressao, str) and len(expressao) >= LIMIAR_VETORIZADO:
+        dados = expressao.encode("utf-8", "surrogatepass")
+        return _primeiro_erro_vetorizado(dados) == -1
+    
     pilha = Pilha()
     
     # Definindo os pares de caracteres correspondentes
@@ -87,60 +121,630 @@ def verificar_expressao(expressao):
     return pilha.esta_vazia()
 
 
-def mostrar_detalhes(expressao):
+if np is not None:
+    # Tabelas de consulta indexadas pelo valor do byte
+    _VARIACAO = np.zeros(256, dtype=np.int8)
+    _VARIACAO[list(b"({[")] = 1
+    _VARIACAO[list(b")}]")] = -1
+    _TIPO = np.zeros(256, dtype=np.int8)
+    _TIPO[list(b"()")] = 1
+    _TIPO[list(b"[]")] = 2
+    _TIPO[list(b"{}")] = 3
+
+
+def _primeiro_erro_vetorizado(dados):
     """
-    Mostra os detalhes do processamento da expressão, indicando o estado da pilha
-    a cada passo.
+    Verifica um objeto do tipo bytes com operações vetorizadas do NumPy.
+    
+    Cada byte é mapeado para +1 (abertura), -1 (fechamento) ou 0 e a soma
+    acumulada dá a profundidade após cada delimitador. Com um único tipo de
+    delimitador, basta conferir que a profundidade nunca fica negativa e
+    termina em zero. Com tipos misturados, os pares são formados pela
+    profundidade: ordenando os delimitadores de forma estável pelo nível,
+    cada fechamento fica imediatamente após a abertura que ele fecha, e os
+    tipos de todos os pares são comparados de uma vez.
+    
+    Returns:
+        -1 se estiver balanceado; caso contrário, a posição (em bytes) do
+        mesmo erro apontado pela verificação com pilha.
+    """
+    bytes_ = np.frombuffer(dados, dtype=np.uint8)
+    indices = np.flatnonzero(_VARIACAO[bytes_])
+    if indices.size == 0:
+        return -1
+    
+    delimitadores = bytes_[indices]
+    variacao = _VARIACAO[delimitadores]
+    profundidade = np.cumsum(variacao, dtype=np.int64)
+    
+    # Primeiro fechamento sem abertura: profundidade negativa
+    negativos = np.flatnonzero(profundidade < 0)
+    limite = int(negativos[0]) if negativos.size else indices.size
+    
+    tipos = _TIPO[delimitadores[:limite]]
+    if limite and tipos.min() != tipos.max():
+        # Nível de cada delimitador: antes da abertura, depois do fechamento
+        niveis = profundidade[:limite] - (variacao[:limite] > 0)
+        ordem = np.argsort(niveis, kind="stable")
+        tipos_ordenados = tipos[ordem]
+        fechamentos = np.flatnonzero(variacao[:limite][ordem] < 0)
+        incompativeis = fechamentos[tipos_ordenados[fechamentos] != tipos_ordenados[fechamentos - 1]]
+        if incompativeis.size:
+            return int(indices[ordem[incompativeis].min()])
+    
+    if negativos.size:
+        return int(indices[limite])
+    
+    final = profundidade[-1]
+    if final > 0:
+        # Abertura mais interna não fechada: a última que levou a
+        # profundidade ao valor final
+        abertas = np.flatnonzero((profundidade == final) & (variacao > 0))
+        return int(indices[abertas[-1]])
+    return -1
+
+
+class ResultadoVerificacao:
+    """
+    Resultado detalhado de uma verificação.
+    Em contexto booleano vale True se a expressão estiver balanceada; caso
+    contrário, guarda o byte, a linha e a coluna (ambas a partir de 1) do
+    primeiro erro encontrado.
+    """
+    def __init__(self, balanceada, posicao=None, linha=None, coluna=None,
+                 caractere=None, motivo=None):
+        self.balanceada = balanceada
+        self.posicao = posicao
+        self.linha = linha
+        self.coluna = coluna
+        self.caractere = caractere
+        self.motivo = motivo
+    
+    def __bool__(self):
+        return self.balanceada
+    
+    def __eq__(self, outro):
+        if not isinstance(outro, ResultadoVerificacao):
+            return NotImplemented
+        return vars(self) == vars(outro)
+    
+    def __str__(self):
+        if self.balanceada:
+            return "balanceada"
+        return (f"não balanceada: '{self.caractere}' no byte {self.posicao} "
+                f"(linha {self.linha}, coluna {self.coluna}): {self.motivo}")
+
+
+_DELIMITADORES_BYTES = re.compile(rb"[()\[\]{}]")
+_ABERTOS_BYTES = frozenset(b"({[")
+_CORRESPONDENTES_BYTES = {ord(')'): ord('('), ord('}'): ord('{'), ord(']'): ord('[')}
+
+
+def _anotar_posicoes(bloco, posicoes):
+    """
+    Converte posições crescentes de um bloco em tuplas
+    (byte, posicao, linha, coluna), com linha e coluna relativas ao bloco e
+    contadas a partir de 0. A contagem de quebras de linha é incremental.
+    """
+    anotadas = []
+    linha = 0
+    inicio_linha = 0
+    anterior = 0
+    for posicao in posicoes:
+        quebras = bloco.count(b"\n", anterior, posicao)
+        if quebras:
+            linha += quebras
+            inicio_linha = bloco.rfind(b"\n", anterior, posicao) + 1
+        anterior = posicao
+        anotadas.append((bloco[posicao], posicao, linha, posicao - inicio_linha))
+    return anotadas
+
+
+def _resumir_bloco(bloco):
+    """
+    Reduz um bloco de bytes a um resumo que pode ser combinado, em ordem,
+    com os resumos dos blocos vizinhos.
+    
+    Returns:
+        Uma tupla (fechados, abertos, erro, quebras, ultima_quebra):
+        os fechamentos que ficaram sem par dentro do bloco, as aberturas que
+        ficaram sem fechamento, o primeiro par incompatível encontrado no
+        próprio bloco (ou None), o número de quebras de linha e a posição da
+        última delas (-1 se não houver). Fechamentos, aberturas e erro são
+        anotados por `_anotar_posicoes`; o erro traz também a abertura que
+        não correspondeu.
+    """
+    pilha = []
+    fechados = []
+    erro = None
+    abertos_bytes = _ABERTOS_BYTES
+    correspondentes = _CORRESPONDENTES_BYTES
+    
+    for ocorrencia in _DELIMITADORES_BYTES.finditer(bloco):
+        posicao = ocorrencia.start()
+        caractere = bloco[posicao]
+        if caractere in abertos_bytes:
+            pilha.append(posicao)
+        elif not pilha:
+            # Sem abertura neste bloco: o par pode estar em um bloco anterior
+            fechados.append(posicao)
+        else:
+            topo = pilha.pop()
+            if bloco[topo] != correspondentes[caractere]:
+                erro = posicao, bloco[topo]
+                break
+    
+    if erro is not None:
+        posicao, abertura = erro
+        erro = _anotar_posicoes(bloco, [posicao])[0] + (abertura,)
+    
+    return (_anotar_posicoes(bloco, fechados), _anotar_posicoes(bloco, pilha),
+            erro, bloco.count(b"\n"), bloco.rfind(b"\n"))
+
+
+class _EstadoVerificacao:
+    """
+    Combina, em ordem, os resumos produzidos por `_resumir_bloco`.
+    A pilha guarda apenas as aberturas ainda não fechadas, com posições
+    absolutas (byte, posicao, linha, coluna).
+    """
+    def __init__(self):
+        self.pilha = []
+        self.deslocamento = 0
+        self.linha = 1
+        self.coluna = 1
+        self.resultado = None
+    
+    def _absoluta(self, anotada):
+        """Converte uma posição anotada relativa ao bloco em absoluta."""
+        caractere, posicao, linha, coluna = anotada[:4]
+        if linha == 0:
+            coluna += self.coluna
+        else:
+            coluna += 1
+        return caractere, self.deslocamento + posicao, self.linha + linha, coluna
+    
+    def _falhar(self, anotada, motivo):
+        caractere, posicao, linha, coluna = self._absoluta(anotada)
+        self.resultado = ResultadoVerificacao(False, posicao, linha, coluna,
+                                              chr(caractere), motivo)
+        return False
+    
+    def absorver(self, resumo, tamanho):
+        """
+        Incorpora o resumo de um bloco com `tamanho` bytes.
+        Retorna False assim que um erro é encontrado.
+        """
+        fechados, abertos, erro, quebras, ultima_quebra = resumo
+        pilha = self.pilha
+        
+        for fechado in fechados:
+            if not pilha:
+                return self._falhar(fechado, "fechamento sem abertura correspondente")
+            abertura = pilha.pop()[0]
+            if abertura != _CORRESPONDENTES_BYTES[fechado[0]]:
+                return self._falhar(fechado, f"fechamento não corresponde a '{chr(abertura)}'")
+        
+        if erro is not None:
+            return self._falhar(erro, f"fechamento não corresponde a '{chr(erro[4])}'")
+        
+        for aberto in abertos:
+            pilha.append(self._absoluta(aberto))
+        
+        self.deslocamento += tamanho
+        if quebras:
+            self.linha += quebras
+            self.coluna = tamanho - ultima_quebra
+        else:
+            self.coluna += tamanho
+        return True
+    
+    def finalizar(self):
+        """Retorna o resultado após o último bloco."""
+        if self.resultado is not None:
+            return self.resultado
+        if self.pilha:
+            # Informa a abertura mais interna que ficou sem fechamento
+            caractere, posicao, linha, coluna = self.pilha[-1]
+            return ResultadoVerificacao(False, posicao, linha, coluna,
+                                        chr(caractere), "abertura não fechada")
+        return ResultadoVerificacao(True)
+
+
+def _ler_blocos(origem, tamanho_bloco):
+    """
+    Gera blocos de bytes de uma origem: caminho de arquivo, arquivo aberto em
+    modo binário, mmap ou objeto do tipo bytes.
+    """
+    if isinstance(origem, str) or hasattr(origem, "__fspath__"):
+        with open(origem, "rb") as arquivo:
+            yield from _ler_blocos(arquivo, tamanho_bloco)
+    elif isinstance(origem, (bytes, bytearray, memoryview, mmap.mmap)):
+        # Fatias de tamanho fixo, sem alterar a posição de leitura do mmap
+        dados = memoryview(origem)
+        try:
+            for inicio in range(0, len(dados), tamanho_bloco):
+                yield bytes(dados[inicio:inicio + tamanho_bloco])
+        finally:
+            dados.release()
+    else:
+        while True:
+            bloco = origem.read(tamanho_bloco)
+            if not bloco:
+                break
+            yield bloco
+
+
+def verificar_arquivo(origem, tamanho_bloco=TAMANHO_BLOCO, processos=1):
+    """
+    Verifica o balanceamento de uma entrada grande, lida em blocos de bytes.
+    
+    A memória usada é a de um bloco mais a pilha de aberturas pendentes; o
+    conteúdo não é decodificado, apenas os bytes de parênteses, colchetes e
+    chaves são examinados.
     
     Args:
-        expressao: A expressão a ser verificada.
+        origem: Caminho do arquivo, arquivo aberto em modo binário, mmap
+            ou objeto do tipo bytes.
+        tamanho_bloco: Quantidade de bytes processada por vez.
+        processos: Número de processos; com mais de um, um caminho de
+            arquivo é dividido entre eles como em `verificar_expressao_paralelo`.
+    
+    Returns:
+        Um ResultadoVerificacao; se a entrada não estiver balanceada, ele
+        informa o byte, a linha e a coluna do primeiro erro.
     """
-    pilha = Pilha()
+    if processos != 1 and (isinstance(origem, str) or hasattr(origem, "__fspath__")):
+        return _verificar_em_paralelo(origem, os.path.getsize(origem),
+                                      processos, tamanho_bloco)
+    
+    estado = _EstadoVerificacao()
+    for bloco in _ler_blocos(origem, tamanho_bloco):
+        if not estado.absorver(_resumir_bloco(bloco), len(bloco)):
+            break
+    return estado.finalizar()
+
+
+# Todos os bytes que não são parênteses, colchetes ou chaves
+_NAO_DELIMITADORES = bytes(b for b in range(256) if b not in b"()[]{}")
+
+
+def _verificar_esqueleto(esqueleto):
+    """Verifica uma sequência de bytes contendo apenas delimitadores."""
+    pilha = []
+    empilhar = pilha.append
+    desempilhar = pilha.pop
+    abertos = _ABERTOS_BYTES
+    correspondentes = _CORRESPONDENTES_BYTES
+    for caractere in esqueleto:
+        if caractere in abertos:
+            empilhar(caractere)
+        elif not pilha or desempilhar() != correspondentes[caractere]:
+            return False
+    return not pilha
+
+
+class EstatisticasLote:
+    """
+    Contadores de uma execução de `verificar_lote`: registros processados,
+    acertos e falhas do cache de esqueletos e vazão em registros por segundo.
+    """
+    def __init__(self):
+        self.registros = 0
+        self.inicio = None
+        self.fim = None
+        self._cache = None
+    
+    @property
+    def acertos(self):
+        """Esqueletos já conhecidos, respondidos pelo cache."""
+        return self._cache.cache_info().hits if self._cache else 0
+    
+    @property
+    def falhas(self):
+        """Esqueletos verificados de fato."""
+        return self._cache.cache_info().misses if self._cache else 0
+    
+    @property
+    def taxa_acertos(self):
+        """Fração das consultas ao cache que foram acertos."""
+        consultas = self.acertos + self.falhas
+        return self.acertos / consultas if consultas else 0.0
+    
+    @property
+    def segundos(self):
+        """Tempo decorrido desde o primeiro registro (até o último, se terminou)."""
+        if self.inicio is None:
+            return 0.0
+        return (self.fim if self.fim is not None else time.perf_counter()) - self.inicio
+    
+    @property
+    def vazao(self):
+        """Registros processados por segundo."""
+        segundos = self.segundos
+        return self.registros / segundos if segundos else 0.0
+    
+    def __str__(self):
+        return (f"{self.registros} registros, {self.taxa_acertos:.1%} de acertos no cache, "
+                f"{self.vazao:,.0f} registros/s")
+
+
+def verificar_lote(iteravel, tamanho_cache=1 << 16, estatisticas=None):
+    """
+    Verifica muitas expressões curtas, devolvendo os resultados em ordem.
+    
+    Cada registro é reduzido ao seu esqueleto de delimitadores por uma única
+    chamada a `bytes.translate`; esqueletos repetidos são verificados uma só
+    vez graças a um cache LRU limitado. Não há criação de `Pilha` por registro.
+    
+    Args:
+        iteravel: Expressões (str, bytes ou bytearray), consumidas sob demanda.
+        tamanho_cache: Número máximo de esqueletos mantidos no cache.
+        estatisticas: Um EstatisticasLote opcional, atualizado durante o processamento.
+    
+    Yields:
+        True ou False para cada expressão, na ordem de entrada.
+    """
+    if estatisticas is None:
+        estatisticas = EstatisticasLote()
+    verificar = functools.lru_cache(maxsize=tamanho_cache)(_verificar_esqueleto)
+    estatisticas._cache = verificar
+    estatisticas.inicio = time.perf_counter()
+    estatisticas.fim = None
+    nao_delimitadores = _NAO_DELIMITADORES
+    
+    for registro in iteravel:
+        if isinstance(registro, str):
+            registro = registro.encode("utf-8", "surrogatepass")
+        estatisticas.registros += 1
+        # bytes() devolve o próprio objeto para bytes e torna um bytearray hasheável
+        yield verificar(bytes(registro.translate(None, nao_delimitadores)))
+    
+    estatisticas.fim = time.perf_counter()
+
+
+# Dados compartilhados com os processos trabalhadores (definidos na inicialização)
+_dados_trabalhador = None
+_segmento_trabalhador = None
+
+
+def _iniciar_trabalhador(origem, memoria_compartilhada=False):
+    """
+    Prepara um processo trabalhador: abre o arquivo via mmap ou, com
+    `memoria_compartilhada`, conecta-se ao segmento cujo nome é `origem`.
+    """
+    global _dados_trabalhador, _segmento_trabalhador
+    if memoria_compartilhada:
+        # A referência ao segmento precisa viver enquanto o trabalhador usar o buffer
+        _segmento_trabalhador = shared_memory.SharedMemory(name=origem)
+        _dados_trabalhador = _segmento_trabalhador.buf
+    else:
+        with open(origem, "rb") as arquivo:
+            _dados_trabalhador = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _resumir_intervalo(intervalo):
+    """Resume o trecho [inicio, fim) dos dados do trabalhador."""
+    inicio, fim = intervalo
+    bloco = _dados_trabalhador[inicio:fim]
+    if isinstance(bloco, memoryview):
+        bloco = bloco.tobytes()
+    return _resumir_bloco(bloco)
+
+
+def _verificar_em_paralelo(origem, tamanho_total, processos, tamanho_bloco):
+    """
+    Divide a origem em blocos, resume cada bloco em um pool de processos e
+    combina os resumos na ordem original, parando no primeiro erro.
+    """
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or tamanho_total <= tamanho_bloco:
+        return verificar_arquivo(origem, tamanho_bloco)
+    
+    intervalos = [(inicio, min(inicio + tamanho_bloco, tamanho_total))
+                  for inicio in range(0, tamanho_total, tamanho_bloco)]
+    estado = _EstadoVerificacao()
+    
+    segmento = None
+    if isinstance(origem, str) or hasattr(origem, "__fspath__"):
+        argumentos = (origem,)
+    else:
+        # Bytes em memória seriam copiados para cada processo junto com os
+        # argumentos de inicialização; em vez disso, vão uma vez para um
+        # segmento de memória compartilhada e os processos recebem só o nome
+        segmento = shared_memory.SharedMemory(create=True, size=tamanho_total)
+        segmento.buf[:tamanho_total] = origem
+        argumentos = (segmento.name, True)
+    
+    try:
+        with multiprocessing.Pool(processos, _iniciar_trabalhador, argumentos) as pool:
+            # imap devolve os resumos em ordem, permitindo combinar enquanto
+            # os blocos seguintes ainda estão sendo processados
+            for (inicio, fim), resumo in zip(intervalos, pool.imap(_resumir_intervalo, intervalos)):
+                if not estado.absorver(resumo, fim - inicio):
+                    break
+    finally:
+        if segmento is not None:
+            segmento.close()
+            segmento.unlink()
+    
+    return estado.finalizar()
+
+
+def verificar_expressao_paralelo(expressao, processos=None, tamanho_bloco=TAMANHO_BLOCO_PARALELO):
+    """
+    Versão paralela da verificação para entradas grandes.
+    
+    A expressão é dividida em blocos; cada processo reduz um bloco às
+    aberturas que deixou abertas e aos fechamentos que não conseguiu
+    casar, e esses resumos são combinados em ordem. O resultado, inclusive a
+    posição do primeiro erro, é o mesmo de `verificar_arquivo`.
+    
+    Args:
+        expressao: A expressão (str, codificada em UTF-8) ou um objeto do tipo bytes.
+        processos: Número de processos (padrão: número de núcleos).
+        tamanho_bloco: Quantidade de bytes entregue a cada tarefa.
+    
+    Returns:
+        Um ResultadoVerificacao, com posições em bytes.
+    """
+    if isinstance(expressao, str):
+        expressao = expressao.encode("utf-8")
+    return _verificar_em_paralelo(expressao, len(expressao), processos, tamanho_bloco)
+
+
+# Tipos de evento produzidos por rastrear_expressao
+EMPILHAR = "empilhar"
+DESEMPILHAR = "desempilhar"
+IGNORAR = "ignorar"
+ERRO = "erro"
+FIM = "fim"
+
+# Evento de rastreamento: posição a partir de 0, profundidade da pilha após o
+# evento e o símbolo relevante do topo (o empilhado, o desempilhado, o que
+# causou o erro ou o que está no topo)
+EventoRastreio = namedtuple("EventoRastreio", "tipo posicao caractere profundidade topo")
+
+
+def _eventos_rastreio(expressao):
+    """Gera os eventos do processamento com pilha, um por caractere, e o evento final."""
+    pilha = []
     abertos = "({["
     fechados = ")}]"
     correspondentes = {')': '(', '}': '{', ']': '['}
     
-    print(f"Expressão: {expressao}")
-    print("Processamento passo a passo:")
-    print("-" * 50)
-    
-    for i, caractere in enumerate(expressao):
-        print(f"Caractere {i+1}: '{caractere}'")
-        
+    for posicao, caractere in enumerate(expressao):
         if caractere in abertos:
-            pilha.empilhar(caractere)
-            print(f"  Empilhando '{caractere}'")
+            pilha.append(caractere)
+            yield EventoRastreio(EMPILHAR, posicao, caractere, len(pilha), caractere)
         elif caractere in fechados:
-            if pilha.esta_vazia():
-                print(f"  Erro: Pilha vazia ao encontrar '{caractere}'")
-                print("-" * 50)
-                return False
-            
-            topo = pilha.desempilhar()
+            if not pilha:
+                yield EventoRastreio(ERRO, posicao, caractere, 0, None)
+                return
+            topo = pilha.pop()
             if topo != correspondentes[caractere]:
-                print(f"  Erro: Topo da pilha '{topo}' não corresponde a '{caractere}'")
-                print("-" * 50)
-                return False
-            else:
-                print(f"  Desempilhando '{topo}' que corresponde a '{caractere}'")
+                yield EventoRastreio(ERRO, posicao, caractere, len(pilha), topo)
+                return
+            yield EventoRastreio(DESEMPILHAR, posicao, caractere, len(pilha), topo)
         else:
-            print(f"  Ignorando (não é um símbolo de abertura ou fechamento)")
-        
-        print(f"  Estado atual da pilha: {pilha.itens}")
-        print()
+            yield EventoRastreio(IGNORAR, posicao, caractere, len(pilha),
+                                 pilha[-1] if pilha else None)
+    
+    yield EventoRastreio(FIM, len(expressao), None, len(pilha), pilha[-1] if pilha else None)
+
+
+def rastrear_expressao(expressao, janela=None, amostragem=1):
+    """
+    Gera, sob demanda, os eventos da verificação de uma expressão.
+    
+    Os eventos são tuplas leves (`EventoRastreio`); nada é formatado aqui, de
+    modo que o custo é proporcional apenas aos eventos consumidos. O último
+    evento é sempre do tipo ERRO ou FIM (com profundidade maior que zero se
+    restaram símbolos sem fechamento).
+    
+    Args:
+        expressao: A expressão a ser verificada.
+        janela: Se informado, gera apenas os `janela` eventos anteriores à
+            falha, seguidos do evento da falha (ou apenas o evento final, se
+            a expressão estiver balanceada).
+        amostragem: Gera um evento a cada `amostragem`; eventos de erro e o
+            evento final são sempre gerados.
+    """
+    eventos = _eventos_rastreio(expressao)
+    if amostragem > 1:
+        eventos = (evento for indice, evento in enumerate(eventos)
+                   if indice % amostragem == 0 or evento.tipo in (ERRO, FIM))
+    
+    if janela is None:
+        yield from eventos
+        return
+    
+    recentes = deque(maxlen=janela)
+    for evento in eventos:
+        if evento.tipo == ERRO or (evento.tipo == FIM and evento.profundidade):
+            yield from recentes
+            yield evento
+            return
+        if evento.tipo == FIM:
+            yield evento
+            return
+        recentes.append(evento)
+
+
+def _formatar_evento(evento):
+    """Formata um evento nas linhas exibidas por mostrar_detalhes."""
+    if evento.tipo == FIM:
+        if evento.profundidade:
+            return (f"  Erro: Pilha não está vazia no final. {evento.profundidade} "
+                    f"símbolo(s) não fechado(s), topo '{evento.topo}'")
+        return "  Expressão balanceada!"
     
-    resultado = pilha.esta_vazia()
-    if not resultado:
-        print(f"  Erro: Pilha não está vazia no final. Símbolos não fechados: {pilha.itens}")
+    linhas = [f"Caractere {evento.posicao + 1}: '{evento.caractere}'"]
+    if evento.tipo == EMPILHAR:
+        linhas.append(f"  Empilhando '{evento.caractere}'")
+    elif evento.tipo == DESEMPILHAR:
+        linhas.append(f"  Desempilhando '{evento.topo}' que corresponde a '{evento.caractere}'")
+    elif evento.tipo == ERRO:
+        if evento.topo is None:
+            linhas.append(f"  Erro: Pilha vazia ao encontrar '{evento.caractere}'")
+        else:
+            linhas.append(f"  Erro: Topo da pilha '{evento.topo}' não corresponde a '{evento.caractere}'")
+        return "\n".join(linhas)
     else:
-        print("  Expressão balanceada!")
+        linhas.append("  Ignorando (não é um símbolo de abertura ou fechamento)")
+    
+    # No desempilhamento, o símbolo do evento é o que saiu, não o novo topo
+    topo = f", topo '{evento.topo}'" if evento.topo and evento.tipo != DESEMPILHAR else ""
+    linhas.append(f"  Profundidade da pilha: {evento.profundidade}{topo}\n")
+    return "\n".join(linhas)
+
+
+def mostrar_detalhes(expressao, limite=100, janela=None):
+    """
+    Mostra os detalhes do processamento da expressão, indicando o estado da pilha
+    a cada passo.
+    
+    Apenas os eventos exibidos são formatados; os demais são contados e
+    omitidos, o que mantém a saída pequena mesmo para entradas grandes.
+    
+    Args:
+        expressao: A expressão a ser verificada.
+        limite: Número máximo de passos exibidos (None exibe todos).
+        janela: Se informado, exibe apenas os `janela` passos anteriores à falha.
     
+    Returns:
+        True se a expressão estiver balanceada, False caso contrário.
+    """
+    previa = expressao if len(expressao) <= 200 else expressao[:200] + "..."
+    print(f"Expressão: {previa}")
+    print("Processamento passo a passo:")
     print("-" * 50)
-    return resultado
+    
+    exibidos = 0
+    omitidos = 0
+    for evento in rastrear_expressao(expressao, janela=janela):
+        if evento.tipo in (ERRO, FIM):
+            if omitidos:
+                print(f"  ... {omitidos} passo(s) omitido(s)\n")
+            print(_formatar_evento(evento))
+        elif limite is None or exibidos < limite:
+            print(_formatar_evento(evento))
+            exibidos += 1
+        else:
+            omitidos += 1
+    
+    print("-" * 50)
+    return evento.tipo == FIM and evento.profundidade == 0
 
 
 def main():
     """Função principal do programa."""
+    if len(sys.argv) > 1:
+        # Modo arquivo: verifica cada caminho recebido na linha de comando
+        for caminho in sys.argv[1:]:
+            print(f"{caminho}: {verificar_arquivo(caminho)}")
+        return
+    
     print("==== Verificador de Expressões Balanceadas ====")
     print("Este programa verifica se os parênteses, colchetes e chaves")
     print("em uma expressão estão corretamente balanceados.")